@@ -5,17 +5,63 @@ Simulador de Gerenciamento de Memória com Paginação
 __version__ = "1.0.0"
 __author__ = "Sistemas Operacionais"
 
-from .configuracao import Configuracao
-from .tabela_paginas import TabelaPaginas, EntradaTabelaPaginas
+from .configuracao import Configuracao, ConfiguracaoSistema
+from .tabela_paginas import (
+    TabelaPaginas, TabelaPaginasCompacta, TabelaPaginasMultinivel,
+    TabelaPaginasInvertida, TabelaInvertida, EntradaTabelaPaginas
+)
 from .processo import Processo
 from .gerenciador_memoria import GerenciadorMemoria
 from .simulador import Simulador
+from .apresentador import Apresentador
+from .segmento import SegmentoCompartilhado
+from .deduplicacao import Deduplicador
+from .analise_reuso import AnalisadorReuso
+from .instrumentacao import Instrumentacao, Histograma
+from .resultados import (
+    ResultadoCriacao, ResultadoRemocao, ResultadoTraducao, ResultadoFork, ResultadoEscrita,
+    ResultadoSegmento, ResultadoAnexacao, ResultadoDeduplicacao
+)
+from .erros import (
+    ErroGerenciadorMemoria, ErroProcessoExistente, ErroProcessoNaoEncontrado,
+    ErroTamanhoExcedido, ErroTamanhoInvalido, ErroMemoriaInsuficiente, ErroEnderecoInvalido,
+    ErroPaginaNaoEncontrada, ErroSegmentoExistente, ErroSegmentoNaoEncontrado
+)
 
 __all__ = [
     'Configuracao',
+    'ConfiguracaoSistema',
     'TabelaPaginas',
+    'TabelaPaginasCompacta',
+    'TabelaPaginasMultinivel',
+    'TabelaPaginasInvertida',
+    'TabelaInvertida',
     'EntradaTabelaPaginas',
     'Processo',
     'GerenciadorMemoria',
-    'Simulador'
+    'Simulador',
+    'Apresentador',
+    'ResultadoCriacao',
+    'ResultadoRemocao',
+    'ResultadoTraducao',
+    'ResultadoFork',
+    'ResultadoEscrita',
+    'ResultadoSegmento',
+    'ResultadoAnexacao',
+    'ResultadoDeduplicacao',
+    'SegmentoCompartilhado',
+    'Deduplicador',
+    'AnalisadorReuso',
+    'Instrumentacao',
+    'Histograma',
+    'ErroGerenciadorMemoria',
+    'ErroProcessoExistente',
+    'ErroProcessoNaoEncontrado',
+    'ErroTamanhoExcedido',
+    'ErroTamanhoInvalido',
+    'ErroMemoriaInsuficiente',
+    'ErroEnderecoInvalido',
+    'ErroPaginaNaoEncontrada',
+    'ErroSegmentoExistente',
+    'ErroSegmentoNaoEncontrado'
 ]
@@ -0,0 +1,501 @@
+"""
+Implementação dos alocadores de quadros livres.
+
+Os alocadores conjunto, bitmap e heap entregam os quadros em ordem
+crescente (o quadro livre de menor número primeiro), como a implementação
+original baseada em set + sorted. O alocador buddy entrega blocos
+contíguos de tamanho potência de 2. Todos registram o custo de cada
+operação e sabem entregar um bloco contíguo e alinhado (alocar_alinhado),
+usado pelas páginas grandes.
+"""
+
+import heapq
+import time
+
+
+class AlocadorQuadros:
+    """Interface comum dos alocadores de quadros livres"""
+
+    nome = None
+
+    def __init__(self, total_quadros: int):
+        """
+        Inicializa o alocador com todos os quadros livres.
+
+        Args:
+            total_quadros: Quantidade total de quadros da memória física
+        """
+        self.total_quadros = total_quadros
+        self.operacoes_alocacao = 0
+        self.operacoes_liberacao = 0
+        self.quadros_alocados = 0
+        self.quadros_liberados = 0
+        self.passos_busca = 0
+        self.tempo_alocacao_ns = 0
+        self.tempo_liberacao_ns = 0
+
+    def alocar(self, quantidade: int) -> list:
+        """
+        Aloca quadros livres (do menor para o maior número, exceto no buddy).
+
+        Args:
+            quantidade: Número de quadros desejados
+
+        Returns:
+            Lista com os números dos quadros ou None se não houver quadros suficientes
+        """
+        if quantidade > self.num_livres():
+            return None
+
+        inicio = time.perf_counter_ns()
+        quadros = self._alocar(quantidade)
+        self.tempo_alocacao_ns += time.perf_counter_ns() - inicio
+        self.operacoes_alocacao += 1
+        self.quadros_alocados += quantidade
+        return quadros
+
+    def alocar_alinhado(self, tamanho_bloco: int) -> int:
+        """
+        Aloca tamanho_bloco quadros contíguos começando em um múltiplo de
+        tamanho_bloco.
+
+        Args:
+            tamanho_bloco: Número de quadros do bloco (potência de 2)
+
+        Returns:
+            Primeiro quadro do bloco ou None se não houver bloco livre alinhado
+        """
+        if tamanho_bloco > self.num_livres():
+            return None
+
+        inicio = time.perf_counter_ns()
+        primeiro = self._alocar_alinhado(tamanho_bloco)
+        self.tempo_alocacao_ns += time.perf_counter_ns() - inicio
+        if primeiro is not None:
+            self.operacoes_alocacao += 1
+            self.quadros_alocados += tamanho_bloco
+        return primeiro
+
+    def liberar(self, quadros) -> None:
+        """
+        Devolve quadros ao conjunto de livres.
+
+        Args:
+            quadros: Iterável com os números dos quadros
+        """
+        quadros = list(quadros)
+        inicio = time.perf_counter_ns()
+        self._liberar(quadros)
+        self.tempo_liberacao_ns += time.perf_counter_ns() - inicio
+        self.operacoes_liberacao += 1
+        self.quadros_liberados += len(quadros)
+
+    def _alocar(self, quantidade: int) -> list:
+        raise NotImplementedError
+
+    def _liberar(self, quadros: list) -> None:
+        raise NotImplementedError
+
+    def _alocar_alinhado(self, tamanho_bloco: int) -> int:
+        # Busca genérica: testa cada bloco alinhado até achar um todo livre
+        for primeiro in range(0, self.total_quadros - tamanho_bloco + 1, tamanho_bloco):
+            self.passos_busca += 1
+            if all(self.esta_livre(q) for q in range(primeiro, primeiro + tamanho_bloco)):
+                self._retirar_quadros(range(primeiro, primeiro + tamanho_bloco))
+                return primeiro
+        return None
+
+    def _retirar_quadros(self, quadros) -> None:
+        """Marca como alocados quadros livres específicos"""
+        raise NotImplementedError
+
+    def num_livres(self) -> int:
+        """Retorna a quantidade de quadros livres"""
+        raise NotImplementedError
+
+    def esta_livre(self, numero_quadro: int) -> bool:
+        """Verifica se um quadro está livre"""
+        raise NotImplementedError
+
+    def quadros_livres(self) -> set:
+        """Retorna um set com os quadros livres (custo O(total de quadros))"""
+        return {q for q in range(self.total_quadros) if self.esta_livre(q)}
+
+    def estatisticas_fragmentacao(self) -> dict:
+        """
+        Mede a fragmentação externa percorrendo todos os quadros.
+
+        Returns:
+            Dicionário com o número de extensões (trechos contíguos) livres,
+            a maior delas e a fragmentação externa (1 - maior / livres)
+        """
+        num_extensoes = 0
+        maior_extensao = 0
+        extensao_atual = 0
+
+        for numero_quadro in range(self.total_quadros):
+            if self.esta_livre(numero_quadro):
+                if extensao_atual == 0:
+                    num_extensoes += 1
+                extensao_atual += 1
+                maior_extensao = max(maior_extensao, extensao_atual)
+            else:
+                extensao_atual = 0
+
+        livres = self.num_livres()
+        return {
+            'num_extensoes_livres': num_extensoes,
+            'maior_extensao_livre': maior_extensao,
+            'fragmentacao_externa': 1 - maior_extensao / livres if livres else 0.0
+        }
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna o custo acumulado das operações de alocação e liberação.
+
+        Returns:
+            Dicionário com contadores e custos médios
+        """
+        return {
+            'tipo': self.nome,
+            'operacoes_alocacao': self.operacoes_alocacao,
+            'operacoes_liberacao': self.operacoes_liberacao,
+            'quadros_alocados': self.quadros_alocados,
+            'quadros_liberados': self.quadros_liberados,
+            'passos_busca': self.passos_busca,
+            'custo_medio_alocacao_ns': self.tempo_alocacao_ns / max(self.operacoes_alocacao, 1),
+            'custo_medio_liberacao_ns': self.tempo_liberacao_ns / max(self.operacoes_liberacao, 1)
+        }
+
+    def __repr__(self):
+        return f"{type(self).__name__}(livres={self.num_livres()}/{self.total_quadros})"
+
+
+class AlocadorConjunto(AlocadorQuadros):
+    """Alocador original: set de quadros livres ordenado a cada alocação, O(F log F)"""
+
+    nome = 'conjunto'
+
+    def __init__(self, total_quadros: int):
+        super().__init__(total_quadros)
+        self.livres = set(range(total_quadros))
+
+    def _alocar(self, quantidade: int) -> list:
+        self.passos_busca += len(self.livres)
+        quadros = sorted(self.livres)[:quantidade]
+        self.livres.difference_update(quadros)
+        return quadros
+
+    def _liberar(self, quadros: list) -> None:
+        self.livres.update(quadros)
+
+    def _retirar_quadros(self, quadros) -> None:
+        self.livres.difference_update(quadros)
+
+    def num_livres(self) -> int:
+        return len(self.livres)
+
+    def esta_livre(self, numero_quadro: int) -> bool:
+        return numero_quadro in self.livres
+
+    def quadros_livres(self) -> set:
+        return set(self.livres)
+
+
+class AlocadorBitmap(AlocadorQuadros):
+    """
+    Bitmap de quadros livres em palavras de 64 bits.
+
+    O menor bit ligado de cada palavra é encontrado com w & -w
+    (find-first-set), e um índice da primeira palavra possivelmente não
+    vazia evita reexaminar o início da memória já ocupado.
+    """
+
+    nome = 'bitmap'
+    BITS_PALAVRA = 64
+
+    def __init__(self, total_quadros: int):
+        super().__init__(total_quadros)
+        num_palavras, resto = divmod(total_quadros, self.BITS_PALAVRA)
+        self.palavras = [(1 << self.BITS_PALAVRA) - 1] * num_palavras
+        if resto:
+            self.palavras.append((1 << resto) - 1)
+        self.livres = total_quadros
+        self._primeira_palavra = 0
+
+    def _alocar(self, quantidade: int) -> list:
+        quadros = []
+        palavras = self.palavras
+        indice = self._primeira_palavra
+
+        while len(quadros) < quantidade:
+            palavra = palavras[indice]
+            self.passos_busca += 1
+
+            while palavra and len(quadros) < quantidade:
+                bit = palavra & -palavra
+                quadros.append(indice * self.BITS_PALAVRA + bit.bit_length() - 1)
+                palavra ^= bit
+
+            palavras[indice] = palavra
+            if not palavra:
+                indice += 1
+
+        self._primeira_palavra = indice
+        self.livres -= quantidade
+        return quadros
+
+    def _liberar(self, quadros: list) -> None:
+        for numero_quadro in quadros:
+            indice, bit = divmod(numero_quadro, self.BITS_PALAVRA)
+            self.palavras[indice] |= 1 << bit
+            if indice < self._primeira_palavra:
+                self._primeira_palavra = indice
+        self.livres += len(quadros)
+
+    def _alocar_alinhado(self, tamanho_bloco: int) -> int:
+        palavras = self.palavras
+        bits = self.BITS_PALAVRA
+
+        if tamanho_bloco >= bits:
+            # Bloco de palavras inteiras: procurar palavras cheias consecutivas
+            por_bloco = tamanho_bloco // bits
+            cheia = (1 << bits) - 1
+            primeira = self._primeira_palavra - self._primeira_palavra % por_bloco
+            for indice in range(primeira, len(palavras) - por_bloco + 1, por_bloco):
+                self.passos_busca += 1
+                if all(palavras[i] == cheia for i in range(indice, indice + por_bloco)):
+                    palavras[indice:indice + por_bloco] = [0] * por_bloco
+                    self.livres -= tamanho_bloco
+                    return indice * bits
+            return None
+
+        # Bloco dentro de uma palavra: testar os grupos alinhados de bits
+        mascara = (1 << tamanho_bloco) - 1
+        for indice in range(self._primeira_palavra, len(palavras)):
+            palavra = palavras[indice]
+            self.passos_busca += 1
+            for deslocamento in range(0, bits, tamanho_bloco):
+                if (palavra >> deslocamento) & mascara == mascara:
+                    palavras[indice] = palavra & ~(mascara << deslocamento)
+                    self.livres -= tamanho_bloco
+                    return indice * bits + deslocamento
+        return None
+
+    def num_livres(self) -> int:
+        return self.livres
+
+    def esta_livre(self, numero_quadro: int) -> bool:
+        indice, bit = divmod(numero_quadro, self.BITS_PALAVRA)
+        return bool(self.palavras[indice] >> bit & 1)
+
+
+class AlocadorHeap(AlocadorQuadros):
+    """Min-heap de quadros livres: O(log F) por quadro alocado ou liberado"""
+
+    nome = 'heap'
+
+    def __init__(self, total_quadros: int):
+        super().__init__(total_quadros)
+        # Uma lista crescente já satisfaz a propriedade de heap
+        self.heap = list(range(total_quadros))
+        self.livre = bytearray(b'\x01') * total_quadros
+
+    def _alocar(self, quantidade: int) -> list:
+        quadros = [heapq.heappop(self.heap) for _ in range(quantidade)]
+        for numero_quadro in quadros:
+            self.livre[numero_quadro] = 0
+        self.passos_busca += quantidade
+        return quadros
+
+    def _liberar(self, quadros: list) -> None:
+        for numero_quadro in quadros:
+            heapq.heappush(self.heap, numero_quadro)
+            self.livre[numero_quadro] = 1
+
+    def _retirar_quadros(self, quadros) -> None:
+        for numero_quadro in quadros:
+            self.livre[numero_quadro] = 0
+        # Remoção do meio do heap: refazê-lo, O(F), como a busca alinhada
+        self.heap = [q for q in self.heap if self.livre[q]]
+        heapq.heapify(self.heap)
+
+    def num_livres(self) -> int:
+        return len(self.heap)
+
+    def esta_livre(self, numero_quadro: int) -> bool:
+        return bool(self.livre[numero_quadro])
+
+
+class AlocadorBuddy(AlocadorQuadros):
+    """
+    Alocador buddy (sistema de pares) com blocos de 2^k quadros.
+
+    Um pedido de n quadros retira o menor bloco livre de ordem
+    ceil(log2 n) e devolve imediatamente a sobra ao final do bloco, de modo
+    que o processo recebe exatamente n quadros contíguos. Se nenhum bloco
+    for grande o bastante, o pedido é atendido por vários blocos (os
+    maiores disponíveis). Na liberação, cada bloco se funde com seu par
+    (buddy) sempre que este também estiver livre.
+    """
+
+    nome = 'buddy'
+
+    def __init__(self, total_quadros: int):
+        super().__init__(total_quadros)
+        self.ordem_maxima = max(total_quadros.bit_length() - 1, 0)
+        # Para cada ordem: set com o início dos blocos livres e um heap
+        # (com remoção preguiçosa) para achar o bloco de menor endereço
+        self.blocos_livres = [set() for _ in range(self.ordem_maxima + 1)]
+        self.heaps = [[] for _ in range(self.ordem_maxima + 1)]
+        self.livre = bytearray(total_quadros)
+        self.livres = 0
+        self._liberar_intervalo(0, total_quadros)
+        self.livre[:] = b'\x01' * total_quadros
+
+    def _adicionar_bloco(self, inicio: int, ordem: int) -> None:
+        self.blocos_livres[ordem].add(inicio)
+        heapq.heappush(self.heaps[ordem], inicio)
+
+    def _retirar_bloco(self, ordem: int) -> int:
+        """Retira o bloco livre de menor endereço com ordem >= ordem, dividindo-o"""
+        for ordem_bloco in range(ordem, self.ordem_maxima + 1):
+            self.passos_busca += 1
+            if not self.blocos_livres[ordem_bloco]:
+                continue
+
+            heap = self.heaps[ordem_bloco]
+            inicio = heapq.heappop(heap)
+            while inicio not in self.blocos_livres[ordem_bloco]:
+                inicio = heapq.heappop(heap)
+            self.blocos_livres[ordem_bloco].remove(inicio)
+
+            # Dividir até a ordem pedida, devolvendo a metade superior
+            while ordem_bloco > ordem:
+                ordem_bloco -= 1
+                self._adicionar_bloco(inicio + (1 << ordem_bloco), ordem_bloco)
+
+            return inicio
+
+        return None
+
+    def _maior_ordem_livre(self) -> int:
+        for ordem in range(self.ordem_maxima, -1, -1):
+            if self.blocos_livres[ordem]:
+                return ordem
+        return None
+
+    def _liberar_bloco(self, inicio: int, ordem: int) -> None:
+        """Devolve um bloco alinhado, fundindo-o com o par enquanto possível"""
+        while ordem < self.ordem_maxima:
+            par = inicio ^ (1 << ordem)
+            if par not in self.blocos_livres[ordem]:
+                break
+            self.blocos_livres[ordem].remove(par)
+            inicio = min(inicio, par)
+            ordem += 1
+
+        self._adicionar_bloco(inicio, ordem)
+
+    def _liberar_intervalo(self, inicio: int, fim: int) -> None:
+        """Decompõe [inicio, fim) em blocos alinhados e os libera"""
+        self.livres += fim - inicio
+
+        while inicio < fim:
+            ordem = (inicio & -inicio).bit_length() - 1 if inicio else self.ordem_maxima
+            while (1 << ordem) > fim - inicio:
+                ordem -= 1
+            self._liberar_bloco(inicio, ordem)
+            inicio += 1 << ordem
+
+    def _alocar(self, quantidade: int) -> list:
+        quadros = []
+        restante = quantidade
+
+        while restante:
+            ordem = (restante - 1).bit_length()
+            inicio = self._retirar_bloco(ordem)
+
+            if inicio is None:
+                # Sem bloco contíguo suficiente: usar o maior disponível
+                ordem = self._maior_ordem_livre()
+                inicio = self._retirar_bloco(ordem)
+
+            usados = min(restante, 1 << ordem)
+            self.livres -= 1 << ordem
+            if usados < (1 << ordem):
+                self._liberar_intervalo(inicio + usados, inicio + (1 << ordem))
+
+            quadros.extend(range(inicio, inicio + usados))
+            self.livre[inicio:inicio + usados] = bytes(usados)
+            restante -= usados
+
+        return quadros
+
+    def _alocar_alinhado(self, tamanho_bloco: int) -> int:
+        # Os blocos do buddy já são alinhados ao próprio tamanho
+        primeiro = self._retirar_bloco(tamanho_bloco.bit_length() - 1)
+        if primeiro is None:
+            return None
+        self.livres -= tamanho_bloco
+        self.livre[primeiro:primeiro + tamanho_bloco] = bytes(tamanho_bloco)
+        return primeiro
+
+    def _liberar(self, quadros: list) -> None:
+        quadros.sort()
+        indice = 0
+
+        while indice < len(quadros):
+            inicio = quadros[indice]
+            fim = inicio + 1
+            indice += 1
+            while indice < len(quadros) and quadros[indice] == fim:
+                fim += 1
+                indice += 1
+
+            self._liberar_intervalo(inicio, fim)
+            self.livre[inicio:fim] = b'\x01' * (fim - inicio)
+
+    def num_livres(self) -> int:
+        return self.livres
+
+    def esta_livre(self, numero_quadro: int) -> bool:
+        return bool(self.livre[numero_quadro])
+
+    def estatisticas_fragmentacao(self) -> dict:
+        estatisticas = super().estatisticas_fragmentacao()
+        estatisticas['blocos_livres_por_ordem'] = {
+            ordem: len(blocos) for ordem, blocos in enumerate(self.blocos_livres) if blocos
+        }
+        return estatisticas
+
+
+ALOCADORES = {
+    AlocadorConjunto.nome: AlocadorConjunto,
+    AlocadorBitmap.nome: AlocadorBitmap,
+    AlocadorHeap.nome: AlocadorHeap,
+    AlocadorBuddy.nome: AlocadorBuddy
+}
+
+
+def criar_alocador(tipo, total_quadros: int) -> AlocadorQuadros:
+    """
+    Cria um alocador a partir do nome ou retorna a instância recebida.
+
+    Args:
+        tipo: Nome do alocador (ver ALOCADORES) ou instância de AlocadorQuadros
+        total_quadros: Quantidade total de quadros
+
+    Returns:
+        Instância de AlocadorQuadros
+
+    Raises:
+        ValueError: Se o nome do alocador for desconhecido
+    """
+    if isinstance(tipo, AlocadorQuadros):
+        return tipo
+
+    if tipo not in ALOCADORES:
+        raise ValueError(f"Alocador desconhecido: {tipo} (opcoes: {', '.join(ALOCADORES)})")
+
+    return ALOCADORES[tipo](total_quadros)
@@ -0,0 +1,456 @@
+"""
+Análise de reuso sobre rastros de acesso: distâncias de pilha LRU, curvas
+de taxa de falhas e conjunto de trabalho.
+
+A distância de reuso de um acesso é o número de páginas distintas tocadas
+desde o acesso anterior à mesma página, contando ela própria (a posição da
+página na pilha LRU). Com LRU e C quadros, o acesso é um acerto se e só se
+a distância for <= C. Por isso um único histograma de distâncias dá a
+taxa de falhas de todos os tamanhos de memória de uma vez (algoritmo de
+pilha de Mattson).
+
+Em vez de percorrer a pilha a cada acesso (O(n·m)), cada página guarda a
+posição do seu último acesso em uma árvore de Fenwick indexada pelo tempo:
+a distância é o número de marcas depois dessa posição, obtido em
+O(log n). Quando a árvore enche, as marcas vivas (uma por página) são
+renumeradas em ordem, e a memória fica proporcional ao número de páginas
+distintas, não ao tamanho do rastro.
+
+A análise consome os mesmos eventos do rastro.py (o par processo/endereço
+que chega a traduzir_endereco). Há uma pilha global, que corresponde às
+políticas globais do gerenciador, e uma pilha por processo. A curva prevê
+a paginação sob demanda pura: o gerenciador carrega as páginas de um
+processo já na criação, então suas faltas em rastros curtos podem ser
+menores que as previstas.
+
+A remoção de um processo tira suas páginas da pilha global. Isso quebra a
+propriedade de inclusão do LRU, porque uma página despejada antes da
+remoção não volta sozinha para os quadros liberados. Assim, em rastros com
+remoções a curva é uma aproximação otimista (algumas faltas a menos), e em
+rastros sem remoções ela é exata.
+
+Executar:
+    python3 analise_reuso.py carga.txt --pagina 4096 --janela 10000 --saida curva.csv
+"""
+
+import argparse
+import csv
+import json
+import time
+from array import array
+from bisect import bisect_left
+from rastro import ACESSAR, CRIAR, REMOVER, ler_rastro
+
+
+class _PilhaReuso:
+    """Pilha LRU implícita: uma árvore de Fenwick marca o último acesso de cada página"""
+
+    def __init__(self, capacidade: int = 1024):
+        """
+        Args:
+            capacidade: Posições iniciais da árvore (dobra quando as páginas
+                vivas a ocupam inteira)
+        """
+        self.capacidade = capacidade
+        self.arvore = [0] * (capacidade + 1)
+        self.tempos = array('q')  # tempo do acesso gravado em cada posição (posição 1 = índice 0)
+        self.ultimo = {}  # página -> posição do último acesso
+        self.acessos = 0
+        self.primeiros = 0  # acessos sem acesso anterior (distância infinita)
+        self.distancias = {}  # distância -> ocorrências
+        self.intervalos = {}  # acessos desde o anterior à mesma página -> ocorrências
+
+    def _somar(self, posicao: int, delta: int) -> None:
+        arvore = self.arvore
+        capacidade = self.capacidade
+        while posicao <= capacidade:
+            arvore[posicao] += delta
+            posicao += posicao & -posicao
+
+    def _prefixo(self, posicao: int) -> int:
+        arvore = self.arvore
+        total = 0
+        while posicao:
+            total += arvore[posicao]
+            posicao &= posicao - 1
+        return total
+
+    def _compactar(self) -> None:
+        """Renumera as marcas vivas em 1..m (em ordem) e refaz a árvore em tempo linear"""
+        vivas = sorted(self.ultimo.items(), key=lambda item: item[1])
+        if 2 * len(vivas) > self.capacidade:
+            self.capacidade *= 2
+
+        tempos = self.tempos
+        self.tempos = array('q', (tempos[posicao - 1] for _, posicao in vivas))
+        self.ultimo = {pagina: indice for indice, (pagina, _) in enumerate(vivas, 1)}
+
+        arvore = [0] * (self.capacidade + 1)
+        for posicao in range(1, self.capacidade + 1):
+            if posicao <= len(vivas):
+                arvore[posicao] += 1
+            pai = posicao + (posicao & -posicao)
+            if pai <= self.capacidade:
+                arvore[pai] += arvore[posicao]
+        self.arvore = arvore
+
+    def acessar(self, pagina) -> int:
+        """
+        Registra um acesso.
+
+        Returns:
+            Distância de reuso (1 = a página mais recente) ou None no
+            primeiro acesso à página
+        """
+        if len(self.tempos) == self.capacidade:
+            self._compactar()
+
+        tempo = self.acessos
+        self.acessos += 1
+        anterior = self.ultimo.get(pagina)
+
+        if anterior is None:
+            self.primeiros += 1
+            distancia = None
+        else:
+            distancia = len(self.ultimo) - self._prefixo(anterior) + 1
+            self._somar(anterior, -1)
+            self.distancias[distancia] = self.distancias.get(distancia, 0) + 1
+            intervalo = tempo - self.tempos[anterior - 1]
+            self.intervalos[intervalo] = self.intervalos.get(intervalo, 0) + 1
+
+        self.tempos.append(tempo)
+        posicao = len(self.tempos)
+        self._somar(posicao, 1)
+        self.ultimo[pagina] = posicao
+        return distancia
+
+    def remover(self, pagina) -> None:
+        """Tira a página da pilha (ex.: processo removido)"""
+        posicao = self.ultimo.pop(pagina, None)
+        if posicao is not None:
+            self._somar(posicao, -1)
+
+    def conjunto_trabalho(self, janela: int) -> int:
+        """Páginas distintas tocadas nos últimos janela acessos"""
+        inicio = bisect_left(self.tempos, self.acessos - janela)
+        return len(self.ultimo) - self._prefixo(inicio)
+
+
+class AnalisadorReuso:
+    """Distâncias de reuso, curvas de falhas e conjuntos de trabalho de um rastro"""
+
+    def __init__(self, tamanho_pagina: int):
+        """
+        Args:
+            tamanho_pagina: Tamanho da página em bytes (potência de 2)
+
+        Raises:
+            ValueError: Se o tamanho da página não for potência de 2
+        """
+        if tamanho_pagina <= 0 or tamanho_pagina & (tamanho_pagina - 1):
+            raise ValueError("Tamanho da pagina deve ser potencia de 2")
+
+        self.tamanho_pagina = tamanho_pagina
+        self.bits_deslocamento = tamanho_pagina.bit_length() - 1
+        self.pilha_global = _PilhaReuso()
+        self.processos = {}  # id_processo -> _PilhaReuso
+        self.removidos = {}  # id_processo -> pilhas de processos já removidos (o id pode voltar)
+        self.tamanhos = {}  # id_processo -> tamanho em bytes
+        self.invalidos = 0
+        self.segundos = 0.0
+
+    def criar(self, id_processo: int, tamanho: int) -> None:
+        """Registra a criação de um processo (um id repetido é ignorado, como no gerenciador)"""
+        if id_processo in self.tamanhos:
+            self.invalidos += 1
+            return
+        self.tamanhos[id_processo] = tamanho
+        self.processos[id_processo] = _PilhaReuso()
+
+    def remover(self, id_processo: int) -> None:
+        """Registra a remoção de um processo: suas páginas saem da pilha global"""
+        pilha = self.processos.pop(id_processo, None)
+        if pilha is None:
+            self.invalidos += 1
+            return
+        for pagina in pilha.ultimo:
+            self.pilha_global.remover((id_processo, pagina))
+        del self.tamanhos[id_processo]
+        self.removidos.setdefault(id_processo, []).append(pilha)
+
+    def acessar(self, id_processo: int, endereco_logico: int) -> int:
+        """
+        Registra um acesso a um endereço lógico.
+
+        Returns:
+            Distância de reuso na pilha global, ou None no primeiro acesso à
+            página ou se o acesso for inválido (contado em invalidos)
+        """
+        tamanho = self.tamanhos.get(id_processo)
+        if tamanho is None or not 0 <= endereco_logico < tamanho:
+            self.invalidos += 1
+            return None
+
+        numero_pagina = endereco_logico >> self.bits_deslocamento
+        self.processos[id_processo].acessar(numero_pagina)
+        return self.pilha_global.acessar((id_processo, numero_pagina))
+
+    def processar_eventos(self, eventos) -> None:
+        """
+        Consome eventos (operacao, id_processo, valor) de um rastro.
+
+        Args:
+            eventos: Iterável de eventos, como os de rastro.ler_rastro
+        """
+        inicio = time.perf_counter()
+        for operacao, id_processo, valor in eventos:
+            if operacao == ACESSAR:
+                self.acessar(id_processo, valor)
+            elif operacao == CRIAR:
+                self.criar(id_processo, valor)
+            elif operacao == REMOVER:
+                self.remover(id_processo)
+        self.segundos += time.perf_counter() - inicio
+
+    def _pilhas(self, id_processo: int = None) -> list:
+        if id_processo is None:
+            return [self.pilha_global]
+        pilhas = list(self.removidos.get(id_processo, []))
+        if id_processo in self.processos:
+            pilhas.append(self.processos[id_processo])
+        return pilhas
+
+    def histograma_distancias(self, id_processo: int = None) -> dict:
+        """
+        Retorna o histograma das distâncias de reuso.
+
+        Args:
+            id_processo: Processo (pilha própria) ou None para a pilha global
+
+        Returns:
+            Dicionário distância -> ocorrências, em ordem crescente; os
+            primeiros acessos (distância infinita) ficam na chave None
+        """
+        histograma = {}
+        primeiros = 0
+        for pilha in self._pilhas(id_processo):
+            primeiros += pilha.primeiros
+            for distancia, ocorrencias in pilha.distancias.items():
+                histograma[distancia] = histograma.get(distancia, 0) + ocorrencias
+        histograma = dict(sorted(histograma.items()))
+        histograma[None] = primeiros
+        return histograma
+
+    def curva_falhas(self, id_processo: int = None) -> list:
+        """
+        Prevê a taxa de falhas do LRU para todos os tamanhos de memória.
+
+        A curva é obtida do histograma por uma soma acumulada: com C
+        quadros, falham os primeiros acessos e os de distância > C. Acima
+        da maior distância observada só restam as falhas compulsórias.
+
+        Args:
+            id_processo: Processo (memória só dele) ou None (memória global)
+
+        Returns:
+            Lista de dicionários com quadros, memoria (bytes), falhas e
+            taxa_falhas, de 1 quadro até a maior distância observada
+        """
+        histograma = self.histograma_distancias(id_processo)
+        primeiros = histograma.pop(None)
+        acessos = primeiros + sum(histograma.values())
+        if not acessos:
+            return []
+
+        maior = max(histograma, default=1)
+        falhas = acessos
+        curva = []
+        for quadros in range(1, maior + 1):
+            falhas -= histograma.get(quadros, 0)
+            curva.append({
+                'quadros': quadros,
+                'memoria': quadros * self.tamanho_pagina,
+                'falhas': falhas,
+                'taxa_falhas': falhas / acessos
+            })
+        return curva
+
+    def quadros_para_taxa(self, taxa_falhas: float, id_processo: int = None) -> int:
+        """
+        Menor número de quadros cuja taxa de falhas prevista é <= taxa_falhas.
+
+        Returns:
+            Número de quadros, ou None se nem a maior memória atinge a taxa
+            (as falhas compulsórias já a superam)
+        """
+        for ponto in self.curva_falhas(id_processo):
+            if ponto['taxa_falhas'] <= taxa_falhas:
+                return ponto['quadros']
+        return None
+
+    def conjunto_trabalho(self, janela: int, id_processo: int = None) -> int:
+        """
+        Tamanho atual do conjunto de trabalho W(t, janela) de Denning.
+
+        Args:
+            janela: Número de acessos considerados (do próprio processo, ou
+                de todos com id_processo None)
+            id_processo: Processo ativo ou None (todos os processos)
+
+        Returns:
+            Páginas distintas tocadas nos últimos janela acessos
+        """
+        pilha = self.pilha_global if id_processo is None else self.processos[id_processo]
+        return pilha.conjunto_trabalho(janela)
+
+    def conjunto_trabalho_medio(self, janelas, id_processo: int = None) -> dict:
+        """
+        Tamanho médio do conjunto de trabalho ao longo do rastro para cada janela.
+
+        Usa o histograma dos intervalos entre acessos à mesma página: cada
+        acesso contribui com min(intervalo, janela) e um primeiro acesso
+        com janela (Denning e Schwartz), também em uma única passada.
+
+        Args:
+            janelas: Tamanhos de janela, em acessos
+            id_processo: Processo ou None (todos os processos)
+
+        Returns:
+            Dicionário janela -> tamanho médio em páginas
+        """
+        pilhas = self._pilhas(id_processo)
+        acessos = sum(pilha.acessos for pilha in pilhas)
+        primeiros = sum(pilha.primeiros for pilha in pilhas)
+        intervalos = {}
+        for pilha in pilhas:
+            for intervalo, ocorrencias in pilha.intervalos.items():
+                intervalos[intervalo] = intervalos.get(intervalo, 0) + ocorrencias
+
+        medias = {}
+        for janela in janelas:
+            soma = primeiros * janela + sum(min(intervalo, janela) * ocorrencias
+                                            for intervalo, ocorrencias in intervalos.items())
+            medias[janela] = soma / acessos if acessos else 0.0
+        return medias
+
+    def resumo(self, janela: int = 10000) -> dict:
+        """
+        Resume a análise em um dicionário serializável.
+
+        Args:
+            janela: Janela do conjunto de trabalho, em acessos
+
+        Returns:
+            Dicionário com acessos, páginas distintas, memória para taxas de
+            falhas de 10% e 1%, memória a partir da qual só restam as falhas
+            compulsórias e conjunto de trabalho médio, global e por processo
+        """
+        def resumo_pilha(id_processo=None):
+            pilhas = self._pilhas(id_processo)
+            histograma = self.histograma_distancias(id_processo)
+            acessos = sum(pilha.acessos for pilha in pilhas)
+            primeiros = histograma[None]
+            memoria = {}
+            for rotulo, taxa in (('memoria_taxa_10', 0.10), ('memoria_taxa_1', 0.01)):
+                quadros = self.quadros_para_taxa(taxa, id_processo)
+                memoria[rotulo] = quadros * self.tamanho_pagina if quadros is not None else None
+            maior = max((distancia for distancia in histograma if distancia is not None), default=0)
+            return {
+                'acessos': acessos,
+                'paginas_distintas': primeiros,
+                'taxa_falhas_compulsorias': primeiros / acessos if acessos else 0.0,
+                **memoria,
+                'memoria_sem_falhas_de_capacidade': maior * self.tamanho_pagina,
+                'conjunto_trabalho_medio': self.conjunto_trabalho_medio([janela], id_processo)[janela]
+            }
+
+        ids = sorted(set(self.processos) | set(self.removidos))
+        return {
+            'tamanho_pagina': self.tamanho_pagina,
+            'janela': janela,
+            'invalidos': self.invalidos,
+            'segundos': self.segundos,
+            'acessos_por_segundo': self.pilha_global.acessos / self.segundos if self.segundos else 0.0,
+            'global': resumo_pilha(),
+            'processos': {id_processo: resumo_pilha(id_processo) for id_processo in ids}
+        }
+
+    def __repr__(self):
+        return (f"AnalisadorReuso(pagina={self.tamanho_pagina}, acessos={self.pilha_global.acessos}, "
+                f"processos={len(self.processos)})")
+
+
+def analisar_rastro(caminho: str, tamanho_pagina: int, formato: str = None) -> AnalisadorReuso:
+    """
+    Analisa um rastro inteiro em uma passada.
+
+    Args:
+        caminho: Arquivo de rastro (texto, CSV ou binário)
+        tamanho_pagina: Tamanho da página em bytes
+        formato: Formato do rastro (None = deduzido)
+
+    Returns:
+        AnalisadorReuso com o rastro processado
+    """
+    analisador = AnalisadorReuso(tamanho_pagina)
+    analisador.processar_eventos(ler_rastro(caminho, formato))
+    return analisador
+
+
+def escrever_curva(curva: list, caminho: str) -> None:
+    """
+    Grava uma curva de falhas em CSV ou JSON (pela extensão do arquivo).
+
+    Args:
+        curva: Pontos retornados por curva_falhas
+        caminho: Arquivo de saída ('.json' = JSON, demais = CSV)
+    """
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        if caminho.lower().endswith('.json'):
+            json.dump(curva, arquivo, indent=2)
+            arquivo.write('\n')
+        else:
+            escritor = csv.DictWriter(arquivo, fieldnames=('quadros', 'memoria', 'falhas', 'taxa_falhas'))
+            escritor.writeheader()
+            escritor.writerows(curva)
+
+
+def main():
+    """Analisa um rastro passado na linha de comando"""
+    parser = argparse.ArgumentParser(description="Distancias de reuso e curva de falhas de um rastro")
+    parser.add_argument('rastro', help="Arquivo de rastro (texto, CSV ou binario)")
+    parser.add_argument('--formato', help="Formato do rastro (padrao: deduzido)")
+    parser.add_argument('--pagina', type=int, default=4096, help="Tamanho da pagina em bytes")
+    parser.add_argument('--janela', type=int, default=10000, help="Janela do conjunto de trabalho (acessos)")
+    parser.add_argument('--processo', type=int, default=None,
+                        help="Curva de falhas de um processo (padrao: memoria global)")
+    parser.add_argument('--saida', help="Grava a curva de falhas (.csv ou .json)")
+    argumentos = parser.parse_args()
+
+    analisador = analisar_rastro(argumentos.rastro, argumentos.pagina, argumentos.formato)
+    resumo = analisador.resumo(argumentos.janela)
+
+    print("\n" + "=" * 50)
+    print("              ANALISE DE REUSO")
+    print("=" * 50)
+    print(f"Acessos: {resumo['global']['acessos']} em {resumo['segundos']:.3f} s "
+          f"({resumo['acessos_por_segundo']:,.0f} acessos/s)")
+    print(f"Acessos invalidos: {resumo['invalidos']}")
+    print(f"Paginas distintas: {resumo['global']['paginas_distintas']}")
+    for rotulo, chave in (("10%", 'memoria_taxa_10'), ("1%", 'memoria_taxa_1')):
+        memoria = resumo['global'][chave]
+        print(f"Memoria para {rotulo} de faltas: {memoria if memoria is not None else 'inatingivel'}")
+    print(f"Memoria sem faltas de capacidade: {resumo['global']['memoria_sem_falhas_de_capacidade']}")
+    for id_processo, dados in resumo['processos'].items():
+        print(f"Processo {id_processo}: {dados['acessos']} acessos, {dados['paginas_distintas']} paginas, "
+              f"conjunto de trabalho medio {dados['conjunto_trabalho_medio']:.1f} paginas")
+    print("=" * 50)
+
+    if argumentos.saida:
+        escrever_curva(analisador.curva_falhas(argumentos.processo), argumentos.saida)
+        print(f"Curva de falhas gravada em {argumentos.saida}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+Saída legível do simulador.
+
+Toda mensagem para o usuário é formatada aqui. O GerenciadorMemoria só
+entrega resultados e exceções, de modo que o uso como biblioteca (modo
+silencioso) não paga nenhum custo de formatação.
+"""
+
+from erros import ErroProcessoNaoEncontrado
+
+
+class Apresentador:
+    """Formata resultados, erros e o estado do gerenciador de memória"""
+
+    def __init__(self, saida=None):
+        """
+        Inicializa o apresentador.
+
+        Args:
+            saida: Arquivo de texto onde as mensagens são escritas (None = sys.stdout)
+        """
+        self.saida = saida
+
+    def _imprimir(self, *linhas) -> None:
+        for linha in linhas:
+            print(linha, file=self.saida)
+
+    def erro(self, erro) -> None:
+        """Exibe um erro (exceção ou mensagem)"""
+        self._imprimir(f"\n[ERRO] {erro}")
+
+    def aviso(self, mensagem: str) -> None:
+        """Exibe um aviso"""
+        self._imprimir(f"\n[AVISO] {mensagem}")
+
+    def processo_criado(self, resultado) -> None:
+        """Exibe o resultado de criar_processo"""
+        self._imprimir(f"\n[OK] Processo {resultado.id_processo} criado com sucesso!",
+                       f"   Tamanho: {resultado.tamanho} bytes",
+                       f"   Páginas alocadas: {resultado.paginas_alocadas}")
+        if resultado.paginas_grandes:
+            self._imprimir(f"   Páginas grandes: {resultado.paginas_grandes}")
+        if resultado.paginas_sob_demanda:
+            self._imprimir(f"   Páginas sob demanda: {resultado.paginas_sob_demanda}")
+
+    def processo_removido(self, resultado) -> None:
+        """Exibe o resultado de remover_processo"""
+        self._imprimir(f"\n[OK] Processo {resultado.id_processo} removido com sucesso!",
+                       f"   {resultado.quadros_liberados} quadros liberados")
+
+    def processo_bifurcado(self, resultado) -> None:
+        """Exibe o resultado de fork_processo"""
+        self._imprimir(f"\n[OK] Processo {resultado.id_filho} criado por fork de {resultado.id_pai}!",
+                       f"   Páginas: {resultado.num_paginas}",
+                       f"   Quadros compartilhados (cópia na escrita): {resultado.quadros_compartilhados}")
+        if resultado.paginas_swap_copiadas:
+            self._imprimir(f"   Páginas copiadas no swap: {resultado.paginas_swap_copiadas}")
+
+    def segmento_criado(self, resultado) -> None:
+        """Exibe o resultado de criar_segmento"""
+        self._imprimir(f"\n[OK] Segmento '{resultado.nome}' criado com sucesso!",
+                       f"   Tamanho: {resultado.tamanho} bytes",
+                       f"   Quadros reservados: {resultado.quadros}")
+
+    def segmento_anexado(self, resultado) -> None:
+        """Exibe o resultado de anexar_segmento"""
+        self._imprimir(f"\n[OK] Segmento '{resultado.nome}' anexado ao processo {resultado.id_processo}!",
+                       f"   Páginas: {resultado.pagina_inicial}-"
+                       f"{resultado.pagina_inicial + resultado.num_paginas - 1}",
+                       f"   Endereço inicial: {resultado.endereco_inicial}")
+
+    def segmento_removido(self, resultado) -> None:
+        """Exibe o resultado de remover_segmento"""
+        self._imprimir(f"\n[OK] Segmento '{resultado.nome}' removido com sucesso!",
+                       f"   {resultado.quadros} quadros liberados")
+
+    def escrita(self, resultado) -> None:
+        """Exibe o resultado de escrever_endereco"""
+        self._imprimir(f"\n[OK] Valor {resultado.valor} escrito no endereço lógico {resultado.endereco_logico}",
+                       f"   Quadro: {resultado.numero_quadro} (endereço físico {resultado.endereco_fisico})")
+        if resultado.copia_na_escrita:
+            self._imprimir("   Quadro compartilhado copiado na escrita")
+
+    def traducao(self, resultado) -> None:
+        """Exibe o resultado de traduzir_endereco"""
+        self._imprimir("\n" + "=" * 60,
+                       "RESULTADO DA TRADUÇÃO",
+                       "=" * 60,
+                       f"Endereço lógico:     {resultado.endereco_logico}",
+                       f"Número da página:    {resultado.numero_pagina}",
+                       f"Deslocamento:        {resultado.deslocamento}",
+                       f"Número do quadro:    {resultado.numero_quadro}",
+                       f"Endereço físico:     {resultado.endereco_fisico}",
+                       f"Valor armazenado:    0x{resultado.valor:02x} ({resultado.valor})",
+                       "=" * 60)
+
+    def memoria(self, gerenciador) -> None:
+        """Exibe o estado atual da memória física"""
+        quadros_livres = gerenciador.alocador.num_livres()
+        quadros_usados = gerenciador.total_quadros - quadros_livres
+        percentual_livre = (quadros_livres / gerenciador.total_quadros) * 100
+        percentual_usado = (quadros_usados / gerenciador.total_quadros) * 100
+        tamanho_pagina = gerenciador.tamanho_pagina
+
+        self._imprimir("\n" + "=" * 60,
+                       "                    MEMÓRIA FÍSICA",
+                       "=" * 60,
+                       f"Tamanho total: {len(gerenciador.memoria_fisica)} bytes",
+                       f"Tamanho do quadro: {tamanho_pagina} bytes",
+                       f"Total de quadros: {gerenciador.total_quadros}",
+                       f"Quadros livres: {quadros_livres} ({percentual_livre:.2f}%)",
+                       f"Quadros usados: {quadros_usados} ({percentual_usado:.2f}%)",
+                       "=" * 60)
+
+        for num_quadro in range(gerenciador.total_quadros):
+            endereco_inicio = num_quadro * tamanho_pagina
+            endereco_fim = endereco_inicio + tamanho_pagina - 1
+
+            livre = gerenciador.alocador.esta_livre(num_quadro)
+
+            if livre:
+                status = "LIVRE"
+            elif num_quadro in gerenciador.referencias_quadros:
+                status = f"COMPARTILHADO ({gerenciador.referencias_quadros[num_quadro]} referências)"
+            else:
+                pid = gerenciador.alocacao_quadros[num_quadro]
+                status = f"PID {pid}"
+
+            self._imprimir(f"\nQuadro {num_quadro:2d} [{endereco_inicio:4d}-{endereco_fim:4d}] - {status}")
+
+            # Mostrar primeiros bytes do quadro (apenas se estiver ocupado)
+            if not livre:
+                dados_quadro = gerenciador.obter_quadro(num_quadro)[:16]
+                valores_hex = " ".join(f"{byte:02x}" for byte in dados_quadro)
+                self._imprimir(f"  Dados: {valores_hex} ...")
+
+        self._imprimir("\n" + "=" * 60)
+
+    def tabela_paginas(self, gerenciador, id_processo: int) -> None:
+        """Exibe a tabela de páginas de um processo"""
+        if id_processo not in gerenciador.processos:
+            self.erro(ErroProcessoNaoEncontrado(id_processo))
+            return
+
+        processo = gerenciador.processos[id_processo]
+
+        self._imprimir("\n" + "=" * 50,
+                       f"        TABELA DE PÁGINAS - PROCESSO {id_processo}",
+                       "=" * 50,
+                       f"Tamanho do processo: {processo.tamanho} bytes",
+                       f"Número de páginas: {processo.num_paginas}",
+                       processo.tabela_paginas.exibir(),
+                       "=" * 50)
+
+    def processos(self, gerenciador) -> None:
+        """Lista todos os processos em execução"""
+        if not gerenciador.processos:
+            self.aviso("Nenhum processo em execução.")
+            return
+
+        self._imprimir("\n" + "=" * 50,
+                       "                PROCESSOS EM EXECUÇÃO",
+                       "=" * 50)
+
+        for id_processo, processo in sorted(gerenciador.processos.items()):
+            self._imprimir(f"\nProcesso ID: {id_processo}",
+                           f"  Tamanho: {processo.tamanho} bytes",
+                           f"  Páginas: {processo.num_paginas}",
+                           f"  Quadros: {processo.tabela_paginas.quadros_mapeados()}")
+
+            if gerenciador.swap is not None:
+                self._imprimir(f"  Faltas de página: {processo.faltas_pagina}",
+                               f"  Swap: {processo.bytes_swap_entrada} bytes lidos, "
+                               f"{processo.bytes_swap_saida} bytes gravados")
+
+        self._imprimir("\n" + "=" * 50)
@@ -0,0 +1,346 @@
+"""
+Cliente assíncrono do servidor do gerenciador de memória (servidor.py) e
+gerador de carga para medir a latência.
+
+Cada chamada do cliente devolve uma corrotina; várias podem ficar pendentes
+ao mesmo tempo na mesma conexão (pipelining). As requisições feitas na mesma
+volta do laço de eventos são juntadas em uma única escrita no socket.
+
+Gerador de carga (com um servidor já rodando, ou --embutido para subir um
+servidor no mesmo processo):
+    python3 cliente.py --unix /tmp/memoria.sock --conexoes 4 --requisicoes 20000 --profundidade 32
+    python3 cliente.py --embutido --mem 1048576 --page 4096 --lote 64
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import protocolo
+from configuracao import ConfiguracaoSistema
+from gerenciador_memoria import GerenciadorMemoria
+from resultados import ResultadoCriacao, ResultadoRemocao, ResultadoTraducao
+
+
+class ConexaoCliente(asyncio.Protocol):
+    """Separa os quadros de resposta e entrega cada um à requisição pendente"""
+
+    def __init__(self):
+        self.transporte = None
+        self.buffer = bytearray()
+        self.pendentes = {}
+        self.erro = None
+
+    def connection_made(self, transporte):
+        self.transporte = transporte
+
+    def connection_lost(self, excecao):
+        self.erro = excecao or ConnectionResetError("Conexao encerrada pelo servidor")
+        for futuro in self.pendentes.values():
+            if not futuro.done():
+                futuro.set_exception(self.erro)
+        self.pendentes.clear()
+
+    def data_received(self, dados):
+        self.buffer += dados
+        for corpo in protocolo.extrair_quadros(self.buffer):
+            id_requisicao, situacao = protocolo.CABECALHO_RESPOSTA.unpack_from(corpo)
+            futuro = self.pendentes.pop(id_requisicao, None)
+            if futuro is None or futuro.done():
+                continue
+
+            conteudo = corpo[protocolo.CABECALHO_RESPOSTA.size:]
+            if situacao == protocolo.OK:
+                futuro.set_result(conteudo)
+            else:
+                futuro.set_exception(protocolo.decodificar_erro(situacao, conteudo))
+
+
+class ClienteMemoria:
+    """
+    Cliente de um ServidorMemoria.
+
+    Os métodos espelham os do GerenciadorMemoria no modo silencioso:
+    devolvem os mesmos objetos de resultado e levantam as mesmas exceções.
+    """
+
+    def __init__(self, transporte, conexao: ConexaoCliente):
+        self._transporte = transporte
+        self._conexao = conexao
+        self._proximo_id = 0
+        self._saida = []
+        self._envio_agendado = False
+
+    @classmethod
+    async def conectar(cls, caminho_unix: str = None, host: str = '127.0.0.1', porta: int = None):
+        """
+        Abre uma conexão com o servidor.
+
+        Args:
+            caminho_unix: Caminho do socket Unix (se informado, host e porta
+                são ignorados)
+            host: Endereço TCP
+            porta: Porta TCP
+
+        Returns:
+            ClienteMemoria conectado
+        """
+        loop = asyncio.get_running_loop()
+        if caminho_unix is not None:
+            transporte, conexao = await loop.create_unix_connection(ConexaoCliente, caminho_unix)
+        else:
+            transporte, conexao = await loop.create_connection(ConexaoCliente, host, porta)
+        return cls(transporte, conexao)
+
+    async def fechar(self) -> None:
+        """Encerra a conexão"""
+        self._enviar()
+        self._transporte.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, tipo_excecao, excecao, rastreamento):
+        await self.fechar()
+
+    def _enviar(self) -> None:
+        """Escreve de uma vez todas as requisições acumuladas"""
+        self._envio_agendado = False
+        if self._saida:
+            self._transporte.write(b''.join(self._saida))
+            self._saida.clear()
+
+    async def _requisitar(self, operacao: int, argumentos: bytes = b'') -> bytes:
+        """
+        Envia uma requisição e espera a resposta.
+
+        Returns:
+            Conteúdo da resposta (sem o cabeçalho)
+        """
+        if self._conexao.erro is not None:
+            raise self._conexao.erro
+
+        id_requisicao = self._proximo_id
+        self._proximo_id = (self._proximo_id + 1) & 0xFFFFFFFF
+
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._conexao.pendentes[id_requisicao] = futuro
+        self._saida.append(protocolo.enquadrar(
+            protocolo.CABECALHO_REQUISICAO.pack(id_requisicao, operacao) + argumentos
+        ))
+
+        if not self._envio_agendado:
+            self._envio_agendado = True
+            loop.call_soon(self._enviar)
+
+        return await futuro
+
+    async def criar_processo(self, id_processo: int, tamanho: int) -> ResultadoCriacao:
+        """Cria um processo no servidor"""
+        conteudo = await self._requisitar(protocolo.CRIAR, protocolo.PROCESSO_VALOR.pack(id_processo, tamanho))
+        return ResultadoCriacao(id_processo, tamanho, *protocolo.RESPOSTA_CRIAR.unpack(conteudo))
+
+    async def remover_processo(self, id_processo: int) -> ResultadoRemocao:
+        """Remove um processo do servidor"""
+        conteudo = await self._requisitar(protocolo.REMOVER, protocolo.PROCESSO.pack(id_processo))
+        return ResultadoRemocao(id_processo, *protocolo.CONTAGEM.unpack(conteudo))
+
+    async def traduzir_endereco(self, id_processo: int, endereco_logico: int) -> ResultadoTraducao:
+        """Traduz um endereço lógico no servidor"""
+        conteudo = await self._requisitar(protocolo.TRADUZIR,
+                                          protocolo.PROCESSO_VALOR.pack(id_processo, endereco_logico))
+        numero_pagina, deslocamento, numero_quadro, endereco_fisico, valor, falta_pagina = \
+            protocolo.RESPOSTA_TRADUZIR.unpack(conteudo)
+        return ResultadoTraducao(endereco_logico, numero_pagina, deslocamento, numero_quadro,
+                                 endereco_fisico, valor, bool(falta_pagina))
+
+    async def traduzir_lote(self, pares) -> dict:
+        """
+        Traduz muitos endereços em uma única requisição.
+
+        Args:
+            pares: Pares (id_processo, endereco_logico)
+
+        Returns:
+            Dicionário com os arrays 'numero_quadro', 'endereco_fisico' e
+            'valor' (-1 nos endereços inválidos) e os totais 'faltas_pagina'
+            e 'invalidos'
+        """
+        pares = list(pares)
+        argumentos = protocolo.CONTAGEM.pack(len(pares)) + b''.join(
+            protocolo.PROCESSO_VALOR.pack(id_processo, endereco) for id_processo, endereco in pares
+        )
+        conteudo = await self._requisitar(protocolo.TRADUZIR_LOTE, argumentos)
+
+        n, faltas_pagina, invalidos = protocolo.RESPOSTA_LOTE.unpack_from(conteudo)
+        posicao = protocolo.RESPOSTA_LOTE.size
+        quadros, posicao = protocolo.decodificar_coluna('q', conteudo, posicao, n)
+        fisicos, posicao = protocolo.decodificar_coluna('q', conteudo, posicao, n)
+        valores, posicao = protocolo.decodificar_coluna('h', conteudo, posicao, n)
+
+        return {
+            'numero_quadro': quadros,
+            'endereco_fisico': fisicos,
+            'valor': valores,
+            'faltas_pagina': faltas_pagina,
+            'invalidos': invalidos
+        }
+
+    async def obter_estatisticas(self) -> dict:
+        """Estatísticas do gerenciador e do servidor"""
+        return json.loads(await self._requisitar(protocolo.ESTATISTICAS))
+
+
+def percentil(valores_ordenados: list, fracao: float) -> float:
+    """Percentil pelo posto mais próximo (valores já ordenados)"""
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, max(0, round(fracao * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+async def gerar_carga(cliente: ClienteMemoria, id_processo: int, tamanho_processo: int,
+                      requisicoes: int, profundidade: int, tamanho_lote: int = 0, semente: int = 0) -> list:
+    """
+    Cria um processo e dispara traduções aleatórias sobre ele, mantendo até
+    'profundidade' requisições pendentes.
+
+    Args:
+        cliente: Conexão usada pela carga
+        id_processo: Processo criado para a carga (removido no final)
+        tamanho_processo: Tamanho do processo em bytes
+        requisicoes: Número de requisições de tradução
+        profundidade: Requisições pendentes ao mesmo tempo
+        tamanho_lote: Endereços por requisição (0 = traduzir_endereco)
+        semente: Semente dos endereços aleatórios
+
+    Returns:
+        Latência de cada requisição em segundos
+    """
+    aleatorio = random.Random(semente)
+    latencias = []
+    await cliente.criar_processo(id_processo, tamanho_processo)
+
+    async def uma_requisicao():
+        inicio = time.perf_counter()
+        if tamanho_lote:
+            await cliente.traduzir_lote([(id_processo, aleatorio.randrange(tamanho_processo))
+                                         for _ in range(tamanho_lote)])
+        else:
+            await cliente.traduzir_endereco(id_processo, aleatorio.randrange(tamanho_processo))
+        latencias.append(time.perf_counter() - inicio)
+
+    async def fluxo(quantidade):
+        for _ in range(quantidade):
+            await uma_requisicao()
+
+    # 'profundidade' fluxos sequenciais = 'profundidade' requisições em voo
+    base, resto = divmod(requisicoes, profundidade)
+    await asyncio.gather(*(fluxo(base + (indice < resto)) for indice in range(profundidade)))
+
+    await cliente.remover_processo(id_processo)
+    return latencias
+
+
+async def executar_benchmark(caminho_unix: str = None, host: str = '127.0.0.1', porta: int = None,
+                             conexoes: int = 4, requisicoes: int = 10000, profundidade: int = 32,
+                             tamanho_processo: int = 65536, tamanho_lote: int = 0) -> dict:
+    """
+    Mede latência e vazão com várias conexões simultâneas.
+
+    Returns:
+        Dicionário com requisições, endereços, segundos, vazão e as
+        latências p50, p99, p999 e máxima em microssegundos
+    """
+    clientes = [await ClienteMemoria.conectar(caminho_unix, host, porta) for _ in range(conexoes)]
+
+    inicio = time.perf_counter()
+    try:
+        resultados = await asyncio.gather(*(
+            gerar_carga(cliente, 1_000_000 + indice, tamanho_processo, requisicoes, profundidade,
+                        tamanho_lote, semente=indice)
+            for indice, cliente in enumerate(clientes)
+        ))
+        segundos = time.perf_counter() - inicio
+        estatisticas = await clientes[0].obter_estatisticas()
+    finally:
+        for cliente in clientes:
+            await cliente.fechar()
+
+    latencias = sorted(latencia for lista in resultados for latencia in lista)
+    total = len(latencias)
+    enderecos = total * (tamanho_lote or 1)
+
+    return {
+        'conexoes': conexoes,
+        'profundidade': profundidade,
+        'tamanho_lote': tamanho_lote,
+        'requisicoes': total,
+        'enderecos': enderecos,
+        'segundos': segundos,
+        'requisicoes_por_segundo': total / segundos if segundos else 0.0,
+        'enderecos_por_segundo': enderecos / segundos if segundos else 0.0,
+        'latencia_p50_us': percentil(latencias, 0.50) * 1e6,
+        'latencia_p99_us': percentil(latencias, 0.99) * 1e6,
+        'latencia_p999_us': percentil(latencias, 0.999) * 1e6,
+        'latencia_maxima_us': latencias[-1] * 1e6 if latencias else 0.0,
+        'lotes_servidor': estatisticas['servidor']['lotes']
+    }
+
+
+async def _benchmark_embutido(argumentos) -> dict:
+    """Sobe um servidor no mesmo laço de eventos e roda a carga contra ele"""
+    from servidor import ServidorMemoria
+
+    configuracao = ConfiguracaoSistema(argumentos.mem, argumentos.page, argumentos.mem)
+    with GerenciadorMemoria(configuracao, silencioso=True, tamanho_swap=argumentos.swap,
+                            tlb=argumentos.tlb) as gerenciador:
+        servidor = ServidorMemoria(gerenciador)
+        endereco = await servidor.iniciar(argumentos.unix)
+        try:
+            if argumentos.unix:
+                return await _benchmark(argumentos, argumentos.unix, None)
+            return await _benchmark(argumentos, None, endereco[1])
+        finally:
+            await servidor.parar()
+
+
+async def _benchmark(argumentos, caminho_unix, porta) -> dict:
+    return await executar_benchmark(caminho_unix, porta=porta, conexoes=argumentos.conexoes,
+                                    requisicoes=argumentos.requisicoes,
+                                    profundidade=argumentos.profundidade,
+                                    tamanho_processo=argumentos.tamanho_processo,
+                                    tamanho_lote=argumentos.lote)
+
+
+def main():
+    """Roda o gerador de carga e imprime o resumo"""
+    parser = argparse.ArgumentParser(description="Gerador de carga do servidor do gerenciador de memoria")
+    parser.add_argument('--unix', help="Caminho do socket Unix")
+    parser.add_argument('--porta', type=int, help="Porta TCP em 127.0.0.1")
+    parser.add_argument('--embutido', action='store_true', help="Sobe o servidor no mesmo processo")
+    parser.add_argument('--mem', type=int, default=1 << 20, help="Memoria fisica do servidor embutido")
+    parser.add_argument('--page', type=int, default=4096, help="Tamanho da pagina do servidor embutido")
+    parser.add_argument('--swap', type=int, default=0, help="Swap do servidor embutido")
+    parser.add_argument('--tlb', type=int, default=None, help="TLB do servidor embutido")
+    parser.add_argument('--conexoes', type=int, default=4, help="Conexoes simultaneas")
+    parser.add_argument('--requisicoes', type=int, default=10000, help="Requisicoes por conexao")
+    parser.add_argument('--profundidade', type=int, default=32, help="Requisicoes pendentes por conexao")
+    parser.add_argument('--tamanho-processo', type=int, default=65536, help="Tamanho de cada processo")
+    parser.add_argument('--lote', type=int, default=0, help="Enderecos por requisicao (0 = um por vez)")
+    argumentos = parser.parse_args()
+
+    if argumentos.embutido:
+        resumo = asyncio.run(_benchmark_embutido(argumentos))
+    elif argumentos.unix or argumentos.porta:
+        resumo = asyncio.run(_benchmark(argumentos, argumentos.unix, argumentos.porta))
+    else:
+        parser.error("informe --unix, --porta ou --embutido")
+
+    print(json.dumps(resumo, indent=2))
+
+
+if __name__ == '__main__':
+    main()
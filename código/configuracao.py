@@ -1,24 +1,102 @@
 """
 Arquivo de configuração do simulador de gerenciamento de memória.
 Todos os tamanhos devem ser potências de 2.
-As configurações são definidas pelo usuário em tempo de execução.
+
+Cada GerenciadorMemoria é dono de uma ConfiguracaoSistema imutável, o que
+permite várias simulações com configurações diferentes no mesmo
+interpretador. A classe Configuracao mantém a API estática antiga.
 """
 
+from dataclasses import dataclass, field
+
+
+def eh_potencia_de_dois(n):
+    """Verifica se um número é potência de 2"""
+    return n > 0 and (n & (n - 1)) == 0
+
+
+@dataclass(frozen=True, slots=True)
+class ConfiguracaoSistema:
+    """
+    Configuração imutável de uma máquina simulada.
+
+    Os valores derivados (total de quadros, deslocamento e máscara da página)
+    são calculados uma única vez na criação.
+
+    tamanho_pagina_grande (0 = desligado) habilita páginas grandes: um
+    múltiplo potência de 2 da página base, usado pelo gerenciador para os
+    trechos alinhados dos processos que couberem em quadros contíguos.
+    """
+
+    tamanho_memoria_fisica: int
+    tamanho_pagina: int
+    tamanho_maximo_processo: int
+    tamanho_pagina_grande: int = 0
+    total_quadros: int = field(init=False)
+    bits_deslocamento: int = field(init=False)
+    mascara_deslocamento: int = field(init=False)
+    paginas_por_pagina_grande: int = field(init=False)
+
+    def __post_init__(self):
+        """
+        Valida os tamanhos e calcula os valores derivados.
+
+        Raises:
+            ValueError: Se algum valor não for potência de 2 ou inválido
+        """
+        if not eh_potencia_de_dois(self.tamanho_memoria_fisica):
+            raise ValueError("Tamanho da memoria fisica deve ser potencia de 2")
+
+        if not eh_potencia_de_dois(self.tamanho_pagina):
+            raise ValueError("Tamanho da pagina deve ser potencia de 2")
+
+        if not eh_potencia_de_dois(self.tamanho_maximo_processo):
+            raise ValueError("Tamanho maximo do processo deve ser potencia de 2")
+
+        if self.tamanho_maximo_processo > self.tamanho_memoria_fisica:
+            raise ValueError("Tamanho maximo do processo nao pode ser maior que a memoria fisica")
+
+        if self.tamanho_pagina > self.tamanho_memoria_fisica:
+            raise ValueError("Tamanho da pagina nao pode ser maior que a memoria fisica")
+
+        if self.tamanho_pagina_grande:
+            if not eh_potencia_de_dois(self.tamanho_pagina_grande):
+                raise ValueError("Tamanho da pagina grande deve ser potencia de 2")
+
+            if self.tamanho_pagina_grande <= self.tamanho_pagina:
+                raise ValueError("Tamanho da pagina grande deve ser maior que o da pagina")
+
+            if self.tamanho_pagina_grande > self.tamanho_memoria_fisica:
+                raise ValueError("Tamanho da pagina grande nao pode ser maior que a memoria fisica")
+
+        # Páginas são potências de 2: deslocamento e máscara substituem // e %
+        object.__setattr__(self, 'total_quadros', self.tamanho_memoria_fisica // self.tamanho_pagina)
+        object.__setattr__(self, 'bits_deslocamento', self.tamanho_pagina.bit_length() - 1)
+        object.__setattr__(self, 'mascara_deslocamento', self.tamanho_pagina - 1)
+        object.__setattr__(self, 'paginas_por_pagina_grande',
+                           max(self.tamanho_pagina_grande // self.tamanho_pagina, 1))
+
+
 class Configuracao:
-    """Configurações globais do simulador"""
+    """
+    Configurações globais do simulador (compatibilidade).
+
+    definir_configuracao cria uma ConfiguracaoSistema, guardada em
+    Configuracao.atual, e copia seus valores para os atributos de classe.
+    """
 
     # Configurações definidas pelo usuário (inicialmente None)
     TAMANHO_MEMORIA_FISICA = None
     TAMANHO_PAGINA = None
     TAMANHO_MAXIMO_PROCESSO = None
+    TAMANHO_PAGINA_GRANDE = 0
+    atual = None
 
-    @staticmethod
-    def eh_potencia_de_dois(n):
-        """Verifica se um número é potência de 2"""
-        return n > 0 and (n & (n - 1)) == 0
+    eh_potencia_de_dois = staticmethod(eh_potencia_de_dois)
 
     @staticmethod
-    def definir_configuracao(tamanho_memoria_fisica, tamanho_pagina, tamanho_maximo_processo):
+    def definir_configuracao(tamanho_memoria_fisica, tamanho_pagina, tamanho_maximo_processo,
+                             tamanho_pagina_grande=0):
         """
         Define as configurações do sistema.
 
@@ -26,28 +104,23 @@ class Configuracao:
             tamanho_memoria_fisica: Tamanho da memória física em bytes
             tamanho_pagina: Tamanho da página/quadro em bytes
             tamanho_maximo_processo: Tamanho máximo de um processo em bytes
+            tamanho_pagina_grande: Tamanho da página grande em bytes (0 = sem páginas grandes)
+
+        Returns:
+            A ConfiguracaoSistema criada
 
         Raises:
             ValueError: Se algum valor não for potência de 2 ou inválido
         """
-        if not Configuracao.eh_potencia_de_dois(tamanho_memoria_fisica):
-            raise ValueError("Tamanho da memoria fisica deve ser potencia de 2")
-
-        if not Configuracao.eh_potencia_de_dois(tamanho_pagina):
-            raise ValueError("Tamanho da pagina deve ser potencia de 2")
-
-        if not Configuracao.eh_potencia_de_dois(tamanho_maximo_processo):
-            raise ValueError("Tamanho maximo do processo deve ser potencia de 2")
-
-        if tamanho_maximo_processo > tamanho_memoria_fisica:
-            raise ValueError("Tamanho maximo do processo nao pode ser maior que a memoria fisica")
-
-        if tamanho_pagina > tamanho_memoria_fisica:
-            raise ValueError("Tamanho da pagina nao pode ser maior que a memoria fisica")
+        configuracao = ConfiguracaoSistema(tamanho_memoria_fisica, tamanho_pagina, tamanho_maximo_processo,
+                                           tamanho_pagina_grande)
 
+        Configuracao.atual = configuracao
         Configuracao.TAMANHO_MEMORIA_FISICA = tamanho_memoria_fisica
         Configuracao.TAMANHO_PAGINA = tamanho_pagina
         Configuracao.TAMANHO_MAXIMO_PROCESSO = tamanho_maximo_processo
+        Configuracao.TAMANHO_PAGINA_GRANDE = tamanho_pagina_grande
+        return configuracao
 
     @staticmethod
     def esta_configurado():
@@ -0,0 +1,217 @@
+"""
+Deduplicação de páginas por conteúdo, no estilo do KSM do Linux.
+
+O Deduplicador percorre as páginas residentes dos processos aos poucos
+(alguns passos por vez), calcula uma assinatura (CRC-32) do quadro de cada
+uma e procura outra página com a mesma assinatura:
+
+- estaveis: assinatura -> quadro já compartilhado (fork, segmento ou uma
+  mesclagem anterior). Uma página igual passa a mapear esse quadro.
+- instaveis: assinatura -> primeira página exclusiva vista na varredura
+  atual. Quando aparece uma segunda página igual, as duas passam a
+  compartilhar o quadro da primeira, que vira estável. Esta tabela é
+  refeita a cada varredura completa.
+
+A assinatura é calculada sem travas. A mesclagem confere, com as travas,
+que as páginas ainda mapeiam os mesmos quadros e que os bytes são iguais
+(colisões de CRC e escritas no meio tempo), e segura as travas só por uma
+página. Por isso a varredura pode rodar junto com as traduções sem
+pará-las. Um quadro mesclado fica compartilhado com contagem de
+referências, e a primeira escrita o separa de novo (cópia na escrita).
+"""
+
+import threading
+import time
+import zlib
+from resultados import ResultadoDeduplicacao
+
+
+class Deduplicador:
+    """Varredura incremental que mescla quadros de conteúdo idêntico"""
+
+    def __init__(self, gerenciador, paginas_por_passo: int = 256):
+        """
+        Args:
+            gerenciador: GerenciadorMemoria cujas páginas são varridas
+            paginas_por_passo: Páginas examinadas por chamada de passo()
+        """
+        self.gerenciador = gerenciador
+        self.paginas_por_passo = paginas_por_passo
+        self.estaveis = {}  # assinatura -> quadro compartilhado
+        self.instaveis = {}  # assinatura -> (processo, numero_pagina, numero_quadro)
+
+        self._fila = []  # processos ainda não varridos na varredura atual
+        self._processo = None
+        self._pagina = 0
+        self._trava = threading.Lock()  # um passo por vez
+        self._parar = threading.Event()
+        self._thread = None
+
+        self.paginas_varridas = 0
+        self.paginas_mescladas = 0
+        self.varreduras_completas = 0
+        self.bytes_hash = 0
+        self.segundos_hash = 0.0
+
+    def _proxima_pagina(self):
+        """
+        Avança o cursor da varredura.
+
+        Returns:
+            (processo, numero_pagina), ou None no fim da varredura
+        """
+        while True:
+            if self._processo is not None and self._pagina < self._processo.num_paginas:
+                self._pagina += 1
+                return self._processo, self._pagina - 1
+
+            if not self._fila:
+                self._processo = None
+                return None
+
+            self._processo = self._fila.pop()
+            self._pagina = 0
+            if self.gerenciador.processos.get(self._processo.id) is not self._processo:
+                self._processo = None  # removido depois do início da varredura
+
+    def passo(self, max_paginas: int = None) -> ResultadoDeduplicacao:
+        """
+        Examina até max_paginas páginas, continuando de onde parou.
+
+        Args:
+            max_paginas: Limite de páginas (padrão: paginas_por_passo)
+
+        Returns:
+            ResultadoDeduplicacao do passo; varredura_completa indica que o
+            passo chegou ao fim de uma varredura de todos os processos
+        """
+        gerenciador = self.gerenciador
+        limite = max_paginas or self.paginas_por_passo
+        varridas = mescladas = bytes_hash = 0
+        segundos_hash = 0.0
+        varredura_completa = False
+
+        with self._trava:
+            if self._processo is None and not self._fila:
+                self._fila = list(gerenciador.processos.values())[::-1]
+
+            while varridas < limite:
+                proxima = self._proxima_pagina()
+                if proxima is None:
+                    self.instaveis.clear()
+                    self.varreduras_completas += 1
+                    varredura_completa = True
+                    break
+
+                processo, numero_pagina = proxima
+                varridas += 1
+                tabela = processo.tabela_paginas
+                numero_quadro = tabela.obter_numero_quadro(numero_pagina)
+                if numero_quadro is None or not tabela.esta_carregada(numero_pagina):
+                    continue
+
+                inicio = time.perf_counter()
+                assinatura = zlib.crc32(gerenciador.obter_quadro(numero_quadro))
+                segundos_hash += time.perf_counter() - inicio
+                bytes_hash += gerenciador.tamanho_pagina
+
+                if numero_quadro in gerenciador.referencias_quadros:
+                    if self.estaveis.get(assinatura) not in gerenciador.referencias_quadros:
+                        self.estaveis[assinatura] = numero_quadro
+                    continue
+
+                estavel = self.estaveis.get(assinatura)
+                if estavel is not None:
+                    if gerenciador._mesclar_pagina(processo, numero_pagina, numero_quadro, estavel):
+                        mescladas += 1
+                        continue
+                    if estavel not in gerenciador.referencias_quadros:
+                        del self.estaveis[assinatura]  # o quadro deixou de ser compartilhado
+
+                candidata = self.instaveis.get(assinatura)
+                if candidata is not None and candidata[2] != numero_quadro:
+                    outro, outra_pagina, outro_quadro = candidata
+                    if gerenciador._mesclar_pagina(processo, numero_pagina, numero_quadro,
+                                                   outro_quadro, (outro, outra_pagina)):
+                        mescladas += 1
+                        self.estaveis[assinatura] = outro_quadro
+                        del self.instaveis[assinatura]
+                        continue
+
+                self.instaveis[assinatura] = (processo, numero_pagina, numero_quadro)
+
+            self.paginas_varridas += varridas
+            self.paginas_mescladas += mescladas
+            self.bytes_hash += bytes_hash
+            self.segundos_hash += segundos_hash
+
+        return ResultadoDeduplicacao(varridas, mescladas, bytes_hash, segundos_hash, varredura_completa)
+
+    def varrer_tudo(self) -> ResultadoDeduplicacao:
+        """
+        Executa passos até completar uma varredura de todos os processos.
+
+        Returns:
+            ResultadoDeduplicacao somando os passos executados
+        """
+        total = ResultadoDeduplicacao(0, 0, 0, 0.0, False)
+        while not total.varredura_completa:
+            resultado = self.passo()
+            total.paginas_varridas += resultado.paginas_varridas
+            total.paginas_mescladas += resultado.paginas_mescladas
+            total.bytes_hash += resultado.bytes_hash
+            total.segundos_hash += resultado.segundos_hash
+            total.varredura_completa = resultado.varredura_completa
+        return total
+
+    def iniciar(self, intervalo: float = 0.01) -> None:
+        """
+        Roda a varredura em uma thread, um passo a cada intervalo (como o ksmd).
+
+        Args:
+            intervalo: Pausa em segundos entre passos
+
+        Raises:
+            ValueError: Se o gerenciador não estiver no modo concorrente
+        """
+        if not self.gerenciador.concorrente:
+            raise ValueError("A deduplicacao em segundo plano requer o modo concorrente")
+        if self._thread is not None:
+            return
+
+        self._parar.clear()
+
+        def executar():
+            while not self._parar.wait(intervalo):
+                self.passo()
+
+        self._thread = threading.Thread(target=executar, name='deduplicacao', daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Interrompe a thread de segundo plano (se houver) e espera o passo atual"""
+        if self._thread is not None:
+            self._parar.set()
+            self._thread.join()
+            self._thread = None
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna os contadores acumulados da deduplicação.
+
+        Returns:
+            Dicionário com páginas varridas e mescladas, varreduras completas
+            e a vazão do cálculo das assinaturas
+        """
+        return {
+            'paginas_varridas': self.paginas_varridas,
+            'paginas_mescladas': self.paginas_mescladas,
+            'varreduras_completas': self.varreduras_completas,
+            'quadros_estaveis': len(self.estaveis),
+            'bytes_hash': self.bytes_hash,
+            'segundos_hash': self.segundos_hash,
+            'bytes_hash_por_segundo': self.bytes_hash / self.segundos_hash if self.segundos_hash else 0.0
+        }
+
+    def __repr__(self):
+        return f"Deduplicador(paginas_por_passo={self.paginas_por_passo})"
@@ -0,0 +1,122 @@
+"""
+Exceções levantadas pelo gerenciador de memória no modo silencioso.
+
+As mensagens só são formatadas quando a exceção é convertida em texto, de
+modo que quem trata o erro pelo tipo e pelos atributos não paga esse custo.
+"""
+
+
+class ErroGerenciadorMemoria(Exception):
+    """Base de todos os erros de operação do gerenciador de memória"""
+
+
+class ErroProcessoExistente(ErroGerenciadorMemoria):
+    """Já existe um processo com o identificador informado"""
+
+    def __init__(self, id_processo: int):
+        super().__init__(id_processo)
+        self.id_processo = id_processo
+
+    def __str__(self):
+        return f"Processo {self.id_processo} já existe!"
+
+
+class ErroProcessoNaoEncontrado(ErroGerenciadorMemoria):
+    """Não há processo com o identificador informado"""
+
+    def __init__(self, id_processo: int):
+        super().__init__(id_processo)
+        self.id_processo = id_processo
+
+    def __str__(self):
+        return f"Processo {self.id_processo} não encontrado!"
+
+
+class ErroTamanhoInvalido(ErroGerenciadorMemoria):
+    """O tamanho pedido para o processo não é positivo"""
+
+    def __init__(self, tamanho: int):
+        super().__init__(tamanho)
+        self.tamanho = tamanho
+
+    def __str__(self):
+        return f"Tamanho do processo deve ser positivo (recebido: {self.tamanho} bytes)"
+
+
+class ErroTamanhoExcedido(ErroGerenciadorMemoria):
+    """O tamanho pedido para o processo passa do máximo permitido"""
+
+    def __init__(self, tamanho: int, tamanho_maximo: int):
+        super().__init__(tamanho, tamanho_maximo)
+        self.tamanho = tamanho
+        self.tamanho_maximo = tamanho_maximo
+
+    def __str__(self):
+        return f"Tamanho excede o máximo permitido ({self.tamanho_maximo} bytes)"
+
+
+class ErroMemoriaInsuficiente(ErroGerenciadorMemoria):
+    """Não há quadros (ou, com swap, posições de swap) para todas as páginas"""
+
+    def __init__(self, necessario: int, disponivel: int, inclui_swap: bool = False):
+        super().__init__(necessario, disponivel, inclui_swap)
+        self.necessario = necessario
+        self.disponivel = disponivel
+        self.inclui_swap = inclui_swap
+
+    def __str__(self):
+        if self.inclui_swap:
+            return (f"Memória insuficiente (incluindo swap)!\n"
+                    f"   Necessário: {self.necessario} páginas\n"
+                    f"   Disponível: {self.disponivel} páginas")
+        return (f"Memória insuficiente!\n"
+                f"   Necessário: {self.necessario} quadros\n"
+                f"   Disponível: {self.disponivel} quadros")
+
+
+class ErroEnderecoInvalido(ErroGerenciadorMemoria):
+    """O endereço lógico está fora do espaço de endereçamento do processo"""
+
+    def __init__(self, id_processo: int, endereco_logico: int, tamanho: int):
+        super().__init__(id_processo, endereco_logico, tamanho)
+        self.id_processo = id_processo
+        self.endereco_logico = endereco_logico
+        self.tamanho = tamanho
+
+    def __str__(self):
+        return (f"Endereço lógico {self.endereco_logico} fora do espaço de endereçamento!\n"
+                f"   Espaço válido: 0-{self.tamanho - 1}")
+
+
+class ErroPaginaNaoEncontrada(ErroGerenciadorMemoria):
+    """A página não tem quadro e não pode ser trazida para a memória"""
+
+    def __init__(self, id_processo: int, numero_pagina: int):
+        super().__init__(id_processo, numero_pagina)
+        self.id_processo = id_processo
+        self.numero_pagina = numero_pagina
+
+    def __str__(self):
+        return f"Página {self.numero_pagina} não encontrada na tabela!"
+
+
+class ErroSegmentoExistente(ErroGerenciadorMemoria):
+    """Já existe um segmento compartilhado com o nome informado"""
+
+    def __init__(self, nome: str):
+        super().__init__(nome)
+        self.nome = nome
+
+    def __str__(self):
+        return f"Segmento '{self.nome}' já existe!"
+
+
+class ErroSegmentoNaoEncontrado(ErroGerenciadorMemoria):
+    """Não há segmento compartilhado com o nome informado"""
+
+    def __init__(self, nome: str):
+        super().__init__(nome)
+        self.nome = nome
+
+    def __str__(self):
+        return f"Segmento '{self.nome}' não encontrado!"
@@ -2,28 +2,352 @@
 Implementação do gerenciador de memória com paginação.
 """
 
+import mmap
+import os
+import threading
+from array import array
+from contextlib import ExitStack, nullcontext
+from itertools import compress
 from processo import Processo
+from alocador_quadros import criar_alocador
+from politicas_substituicao import PoliticaClock, criar_politica
+from swap import AreaSwap
+from tlb import TLB
+from tabela_paginas import TabelaInvertida
+from segmento import SegmentoCompartilhado
+from deduplicacao import Deduplicador
+from instrumentacao import Instrumentacao
+from configuracao import ConfiguracaoSistema
+from apresentador import Apresentador
+from erros import (
+    ErroGerenciadorMemoria, ErroProcessoExistente, ErroProcessoNaoEncontrado,
+    ErroTamanhoExcedido, ErroTamanhoInvalido, ErroMemoriaInsuficiente, ErroEnderecoInvalido,
+    ErroPaginaNaoEncontrada, ErroSegmentoExistente, ErroSegmentoNaoEncontrado
+)
+from resultados import (
+    ResultadoCriacao, ResultadoRemocao, ResultadoTraducao, ResultadoFork, ResultadoEscrita,
+    ResultadoSegmento, ResultadoAnexacao
+)
+
+_SEM_TRAVA = nullcontext()
 
 
 class GerenciadorMemoria:
     """Gerenciador de memória física com suporte a paginação"""
 
-    def __init__(self, tamanho_memoria_fisica: int, tamanho_pagina: int):
+    def __init__(self, tamanho_memoria_fisica, tamanho_pagina: int = None,
+                 arquivo_memoria: str = None, alocador='bitmap',
+                 memoria_preguicosa: bool = False, tamanho_swap: int = 0,
+                 arquivo_swap: str = None, politica_substituicao='fifo', tlb=None,
+                 tipo_tabela: str = 'lista', niveis_tabela: int = 2,
+                 silencioso: bool = False, apresentador: Apresentador = None,
+                 concorrente: bool = False):
         """
         Inicializa o gerenciador de memória.
 
         Args:
-            tamanho_memoria_fisica: Tamanho da memória física em bytes
+            tamanho_memoria_fisica: Tamanho da memória física em bytes ou uma
+                ConfiguracaoSistema (nesse caso tamanho_pagina é omitido)
             tamanho_pagina: Tamanho de cada página/quadro em bytes
+            arquivo_memoria: Caminho de um arquivo para mapear (mmap) como
+                memória física. Se None, a memória fica em um bytearray.
+            alocador: Nome do alocador de quadros livres ('bitmap', 'heap',
+                'conjunto', 'buddy') ou uma instância de AlocadorQuadros
+            memoria_preguicosa: Se True, as páginas de cada processo só são
+                geradas e copiadas para o quadro no primeiro acesso
+            tamanho_swap: Tamanho da área de swap em bytes. Se maior que zero,
+                ativa a paginação sob demanda e permite sobrecomprometer a memória
+            arquivo_swap: Caminho de um arquivo para a área de swap (por
+                padrão ela fica em um bytearray)
+            politica_substituicao: Política consultada quando não há quadro
+                livre ('fifo', 'lru', 'clock', 'arc') ou uma instância de
+                PoliticaSubstituicao
+            tlb: Número de entradas de uma TLB totalmente associativa ou uma
+                instância de TLB (None = sem TLB)
+            tipo_tabela: Implementação das tabelas de páginas: 'lista' (objetos
+                EntradaTabelaPaginas), 'compacta' (array('I') com flags),
+                'multinivel' (árvore de 2 ou 3 níveis) ou 'invertida' (uma
+                entrada por quadro, compartilhada por todos os processos)
+            niveis_tabela: Número de níveis da tabela multinível (2 ou 3)
+            silencioso: Se True, criar_processo, remover_processo e
+                traduzir_endereco não escrevem nada: devolvem resultados
+                tipados e levantam exceções de erros.py
+            apresentador: Apresentador usado pelas mensagens do modo não
+                silencioso e pelas funções exibir_* (padrão: sys.stdout)
+            concorrente: Se True, o gerenciador pode ser usado por várias
+                threads ao mesmo tempo (ver _iniciar_travas)
+
+        Raises:
+            ValueError: Se os tamanhos não formarem uma configuração válida
+                ou se o modo concorrente ou páginas grandes forem pedidos com
+                a tabela invertida
         """
-        self.tamanho_pagina = tamanho_pagina
-        self.total_quadros = tamanho_memoria_fisica // tamanho_pagina
-        self.memoria_fisica = [0] * tamanho_memoria_fisica
-        self.quadros_livres = set(range(self.total_quadros))
+        if isinstance(tamanho_memoria_fisica, ConfiguracaoSistema):
+            configuracao = tamanho_memoria_fisica
+        else:
+            # Sem limite explícito, um processo pode ocupar toda a memória física
+            configuracao = ConfiguracaoSistema(tamanho_memoria_fisica, tamanho_pagina, tamanho_memoria_fisica)
+
+        self.configuracao = configuracao
+        self.tamanho_pagina = configuracao.tamanho_pagina
+        self.total_quadros = configuracao.total_quadros
+        self.bits_deslocamento = configuracao.bits_deslocamento
+        self.mascara_deslocamento = configuracao.mascara_deslocamento
+        self.paginas_grandes = configuracao.paginas_por_pagina_grande
+        if self.paginas_grandes > 1 and tipo_tabela == 'invertida':
+            raise ValueError("A tabela invertida nao suporta paginas grandes")
+        self.arquivo_memoria = arquivo_memoria
+        self.memoria_preguicosa = memoria_preguicosa
+        self.tipo_tabela = tipo_tabela
+        self.niveis_tabela = niveis_tabela
+        self.silencioso = silencioso
+        self.apresentador = apresentador if apresentador is not None else Apresentador()
+        self._descritor_arquivo = None
+
+        if arquivo_memoria is None:
+            # Um byte do hospedeiro por byte simulado (uma lista gastaria ~8x mais)
+            self.memoria_fisica = bytearray(configuracao.tamanho_memoria_fisica)
+        else:
+            self.memoria_fisica = self._mapear_arquivo(arquivo_memoria, configuracao.tamanho_memoria_fisica)
+
+        self._visao_memoria = memoryview(self.memoria_fisica)
+        self._quadro_zerado = bytes(self.tamanho_pagina)
+        self.alocador = criar_alocador(alocador, self.total_quadros)
         self.processos = {}  # id_processo -> Processo
-        self.alocacao_quadros = {}  # numero_quadro -> id_processo
+        self.alocacao_quadros = {}  # numero_quadro -> id_processo (quadros exclusivos)
+        self.referencias_quadros = {}  # numero_quadro -> páginas que o mapeiam (cópia na escrita)
+        self.forks = 0
+        self.copias_na_escrita = 0
+        self.bytes_copiados = 0  # bytes copiados para memoria_fisica (cargas, swap, cópia na escrita, segmentos)
+        self.paginas_grandes_promovidas = 0
+        self.segmentos = {}  # nome -> SegmentoCompartilhado
+        self.deduplicador = None  # criado na primeira chamada de deduplicar
+        self.instrumentacao = None  # criada na primeira chamada de instrumentar
+        self.tabela_invertida = TabelaInvertida(self.total_quadros) if tipo_tabela == 'invertida' else None
+
+        # Paginação sob demanda: área de swap e política de substituição
+        self.swap = AreaSwap(tamanho_swap, self.tamanho_pagina, arquivo_swap) if tamanho_swap else None
+        self.paginas_comprometidas = 0
+        self.politica = None
+
+        if self.swap is not None:
+            self.politica = criar_politica(politica_substituicao, self.total_quadros)
+            if isinstance(self.politica, PoliticaClock):
+                self.politica.testar_e_limpar_referencia = self._testar_e_limpar_referencia
+
+        self.tlb = TLB(tlb) if isinstance(tlb, int) else tlb
+        if self.tlb is not None and self.paginas_grandes > 1:
+            self.tlb.usar_paginas_grandes(self.paginas_grandes)
+
+        self.concorrente = concorrente
+        self._iniciar_travas()
+
+    def _iniciar_travas(self) -> None:
+        """
+        Cria as travas do modo concorrente.
+
+        - _trava_alocador protege o alocador, alocacao_quadros,
+          referencias_quadros, processos e paginas_comprometidas; é mantida
+          só pelo tempo de reservar ou devolver quadros, nunca durante a
+          cópia das páginas.
+        - _trava_paginacao existe apenas com swap ou TLB, estruturas
+          compartilhadas por todos os processos (política, área de swap,
+          despejos que alteram a tabela de outro processo): nesse caso toda
+          tradução a toma.
+        - Sem _trava_paginacao, processo.trava (uma por processo) serializa a
+          primeira carga de páginas preguiçosas, as escritas, o fork, a
+          anexação de segmentos, a deduplicação e a remoção do processo
+          (é reentrante: a escrita pode disparar a primeira carga).
+
+        Sem swap nem TLB as traduções não tomam trava alguma: leem o
+        dicionário de processos e a tabela de páginas, que só mudam na
+        criação e na remoção. Uma tradução concorrente com a remoção do
+        próprio processo pode ver o estado anterior ou o posterior à remoção.
+
+        Ordem de aquisição: processo.trava -> _trava_paginacao -> _trava_alocador.
+        _trava_contadores protege só bytes_copiados; é a última de todas (pode
+        ser tomada segurando qualquer outra, e nenhuma é tomada com ela).
+        """
+        self._ids_em_transicao = set()  # processos sendo criados ou removidos
+
+        if not self.concorrente:
+            self._trava_alocador = _SEM_TRAVA
+            self._trava_paginacao = None
+            self._trava_contadores = _SEM_TRAVA
+            return
+
+        if self.tabela_invertida is not None:
+            raise ValueError("O modo concorrente nao suporta a tabela de paginas invertida")
+
+        self._trava_alocador = threading.Lock()
+        self._trava_contadores = threading.Lock()
+        self._trava_paginacao = (threading.RLock() if self.swap is not None or self.tlb is not None
+                                 else None)
+
+    def _mapear_arquivo(self, caminho: str, tamanho: int) -> mmap.mmap:
+        """
+        Mapeia um arquivo esparso como memória física.
+
+        Se o arquivo já existir com o tamanho correto, seu conteúdo é
+        preservado, permitindo reutilizá-lo como imagem entre execuções.
+        Caso contrário, ele é (re)dimensionado sem escrever dados, e o
+        sistema operacional só aloca os blocos realmente tocados.
+
+        Args:
+            caminho: Caminho do arquivo
+            tamanho: Tamanho da memória física em bytes
+
+        Returns:
+            Objeto mmap com acesso de leitura e escrita
+        """
+        descritor = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(descritor).st_size != tamanho:
+                os.ftruncate(descritor, tamanho)
+            memoria = mmap.mmap(descritor, tamanho, access=mmap.ACCESS_WRITE)
+        except OSError:
+            os.close(descritor)
+            raise
+
+        self._descritor_arquivo = descritor
+        return memoria
+
+    def sincronizar(self) -> None:
+        """Grava no arquivo as páginas alteradas da memória mapeada (se houver)"""
+        if isinstance(self.memoria_fisica, mmap.mmap):
+            self.memoria_fisica.flush()
+
+    def fechar(self) -> None:
+        """Libera a memória física, sincronizando e fechando o arquivo mapeado"""
+        if self.deduplicador is not None:
+            self.deduplicador.parar()
+
+        self._visao_memoria.release()
+
+        if isinstance(self.memoria_fisica, mmap.mmap):
+            self.memoria_fisica.flush()
+            self.memoria_fisica.close()
+
+        if self._descritor_arquivo is not None:
+            os.close(self._descritor_arquivo)
+            self._descritor_arquivo = None
+
+        if self.swap is not None:
+            self.swap.fechar()
+
+    @property
+    def quadros_livres(self) -> set:
+        """Conjunto dos quadros livres (cópia; custo O(total de quadros))"""
+        return self.alocador.quadros_livres()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_excecao, excecao, rastreamento):
+        self.fechar()
+
+    def _exportar_estado(self) -> dict:
+        """
+        Reúne o estado da máquina, exceto o conteúdo da memória física e do
+        swap (usado por instantaneo.py; o chamador segura as travas).
+
+        Returns:
+            Dicionário serializável com pickle
+        """
+        configuracao = self.configuracao
+        swap = None
+        if self.swap is not None:
+            swap = {
+                'tamanho': self.swap.total_posicoes * self.tamanho_pagina,
+                'posicoes': self.swap.posicoes,
+                'bytes_lidos': self.swap.bytes_lidos,
+                'bytes_gravados': self.swap.bytes_gravados
+            }
+
+        return {
+            'configuracao': (configuracao.tamanho_memoria_fisica, configuracao.tamanho_pagina,
+                             configuracao.tamanho_maximo_processo, configuracao.tamanho_pagina_grande),
+            'memoria_preguicosa': self.memoria_preguicosa,
+            'tipo_tabela': self.tipo_tabela,
+            'niveis_tabela': self.niveis_tabela,
+            'alocador': self.alocador,
+            'alocacao_quadros': self.alocacao_quadros,
+            'referencias_quadros': self.referencias_quadros,
+            'forks': self.forks,
+            'copias_na_escrita': self.copias_na_escrita,
+            'bytes_copiados': self.bytes_copiados,
+            'paginas_grandes_promovidas': self.paginas_grandes_promovidas,
+            'segmentos': self.segmentos,
+            'processos': self.processos,
+            'tabela_invertida': self.tabela_invertida,
+            'paginas_comprometidas': self.paginas_comprometidas,
+            'politica': self.politica,
+            'tlb': self.tlb,
+            'swap': swap
+        }
+
+    def _importar_estado(self, estado: dict) -> None:
+        """
+        Adota o estado de _exportar_estado em um gerenciador recém-criado com
+        a mesma configuração, alocador, política e TLB do estado.
+
+        Args:
+            estado: Dicionário devolvido por _exportar_estado
+        """
+        self.processos = estado['processos']
+        self.alocacao_quadros = estado['alocacao_quadros']
+        self.referencias_quadros = estado['referencias_quadros']
+        self.forks = estado['forks']
+        self.copias_na_escrita = estado['copias_na_escrita']
+        self.bytes_copiados = estado['bytes_copiados']
+        self.paginas_grandes_promovidas = estado['paginas_grandes_promovidas']
+        self.segmentos = estado['segmentos']
+        self.paginas_comprometidas = estado['paginas_comprometidas']
+
+        if estado['tabela_invertida'] is not None:
+            self.tabela_invertida = estado['tabela_invertida']
 
-    def criar_processo(self, id_processo: int, tamanho: int, tamanho_maximo_processo: int) -> bool:
+        if self.swap is not None:
+            self.swap.posicoes = estado['swap']['posicoes']
+            self.swap.bytes_lidos = estado['swap']['bytes_lidos']
+            self.swap.bytes_gravados = estado['swap']['bytes_gravados']
+
+        if self.concorrente and self._trava_paginacao is None:
+            for processo in self.processos.values():
+                processo.trava = threading.RLock()
+
+    def _adotar_memoria(self, memoria, descritor: int = None) -> None:
+        """
+        Troca o buffer da memória física (usado ao restaurar um instantâneo).
+
+        Args:
+            memoria: bytearray ou mmap do tamanho da memória física
+            descritor: Arquivo aberto por trás do mmap, fechado em fechar()
+        """
+        self._visao_memoria.release()
+        if isinstance(self.memoria_fisica, mmap.mmap):
+            self.memoria_fisica.close()
+        if self._descritor_arquivo is not None:
+            os.close(self._descritor_arquivo)
+
+        self.memoria_fisica = memoria
+        self._visao_memoria = memoryview(memoria)
+        self._descritor_arquivo = descritor
+
+    def obter_quadro(self, numero_quadro: int) -> memoryview:
+        """
+        Retorna uma visão (sem cópia) dos bytes de um quadro.
+
+        Args:
+            numero_quadro: Número do quadro na memória física
+
+        Returns:
+            memoryview sobre o quadro; escritas na visão alteram a memória física
+        """
+        inicio = numero_quadro * self.tamanho_pagina
+        return self._visao_memoria[inicio:inicio + self.tamanho_pagina]
+
+    def criar_processo(self, id_processo: int, tamanho: int, tamanho_maximo_processo: int = None):
         """
         Cria um novo processo e aloca memória para ele.
 
@@ -31,58 +355,292 @@ class GerenciadorMemoria:
             id_processo: Identificador do processo
             tamanho: Tamanho do processo em bytes
             tamanho_maximo_processo: Tamanho máximo permitido para um processo
+                (None = o da configuração do gerenciador)
 
         Returns:
-            True se o processo foi criado com sucesso, False caso contrário
+            No modo silencioso, um ResultadoCriacao; caso contrário, True se
+            o processo foi criado com sucesso e False se não foi
+
+        Raises:
+            ErroProcessoExistente, ErroTamanhoInvalido, ErroTamanhoExcedido,
+            ErroMemoriaInsuficiente: apenas no modo silencioso
         """
-        # Verificar se processo já existe
-        if id_processo in self.processos:
-            print(f"\n[ERRO] Processo {id_processo} já existe!")
-            return False
+        if tamanho_maximo_processo is None:
+            tamanho_maximo_processo = self.configuracao.tamanho_maximo_processo
 
-        # Verificar tamanho máximo
-        if tamanho > tamanho_maximo_processo:
-            print(f"\n[ERRO] Tamanho excede o máximo permitido ({tamanho_maximo_processo} bytes)")
+        if self.silencioso:
+            return self._criar_processo(id_processo, tamanho, tamanho_maximo_processo)
+
+        try:
+            resultado = self._criar_processo(id_processo, tamanho, tamanho_maximo_processo)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
             return False
 
-        # Criar processo
-        processo = Processo(id_processo, tamanho, self.tamanho_pagina)
+        self.apresentador.processo_criado(resultado)
+        return True
 
-        # Verificar se há quadros livres suficientes
-        if len(self.quadros_livres) < processo.num_paginas:
-            print(f"\n[ERRO] Memória insuficiente!")
-            print(f"   Necessário: {processo.num_paginas} quadros")
-            print(f"   Disponível: {len(self.quadros_livres)} quadros")
-            return False
+    def _criar_processo(self, id_processo: int, tamanho: int, tamanho_maximo_processo: int) -> ResultadoCriacao:
+        """Cria o processo ou levanta a exceção correspondente (ver criar_processo)"""
+        if tamanho <= 0:
+            raise ErroTamanhoInvalido(tamanho)
 
-        # Alocar quadros e carregar páginas
-        lista_quadros_livres = sorted(list(self.quadros_livres))
+        num_paginas = -(-tamanho // self.tamanho_pagina)
 
-        for num_pag in range(processo.num_paginas):
-            num_quadro = lista_quadros_livres[num_pag]
+        with self._trava_alocador:
+            # Verificar se processo já existe (ou está sendo criado por outra thread)
+            if id_processo in self.processos or id_processo in self._ids_em_transicao:
+                raise ErroProcessoExistente(id_processo)
 
-            # Remover quadro da lista de livres
-            self.quadros_livres.remove(num_quadro)
-            self.alocacao_quadros[num_quadro] = id_processo
+            # Verificar tamanho máximo
+            if tamanho > tamanho_maximo_processo:
+                raise ErroTamanhoExcedido(tamanho, tamanho_maximo_processo)
 
-            # Adicionar entrada na tabela de páginas
-            processo.tabela_paginas.adicionar_entrada(num_quadro)
+            # Verificar se há quadros livres suficientes antes de gerar a memória lógica
+            if self.swap is None:
+                if self.alocador.num_livres() < num_paginas:
+                    raise ErroMemoriaInsuficiente(num_paginas, self.alocador.num_livres())
+            else:
+                # Com swap, toda página precisa caber em um quadro ou em uma posição de swap
+                capacidade = self.total_quadros + self.swap.total_posicoes - self.paginas_comprometidas
+                if capacidade < num_paginas:
+                    raise ErroMemoriaInsuficiente(num_paginas, capacidade, inclui_swap=True)
 
-            # Carregar página na memória física
-            dados_pagina = processo.obter_dados_pagina(num_pag)
-            inicio_quadro = num_quadro * self.tamanho_pagina
+            # Promover a páginas grandes os trechos completos e alinhados do
+            # processo, enquanto houver blocos de quadros contíguos e alinhados
+            quadros = []
+            grandes = self.paginas_grandes
+            if grandes > 1:
+                for _ in range(num_paginas // grandes):
+                    primeiro = self.alocador.alocar_alinhado(grandes)
+                    if primeiro is None:
+                        break
+                    quadros.extend(range(primeiro, primeiro + grandes))
+                self.paginas_grandes_promovidas += len(quadros) // grandes
+            paginas_em_grandes = len(quadros)
 
-            for deslocamento, valor_byte in enumerate(dados_pagina):
-                self.memoria_fisica[inicio_quadro + deslocamento] = valor_byte
+            # Reservar os demais quadros (menor número primeiro); com swap, as
+            # páginas que não couberem ficam ausentes até a primeira falta
+            num_imediatas = min(num_paginas, paginas_em_grandes + self.alocador.num_livres())
+            if num_imediatas > paginas_em_grandes:
+                quadros.extend(self.alocador.alocar(num_imediatas - paginas_em_grandes))
 
-        # Adicionar processo ao dicionário
-        self.processos[id_processo] = processo
+            for num_quadro in quadros:
+                self.alocacao_quadros[num_quadro] = id_processo
 
-        print(f"\n[OK] Processo {id_processo} criado com sucesso!")
-        print(f"   Tamanho: {tamanho} bytes")
-        print(f"   Páginas alocadas: {processo.num_paginas}")
+            self.paginas_comprometidas += num_paginas
+            self._ids_em_transicao.add(id_processo)
 
-        return True
+        # Criar processo e carregar páginas fora da trava: os quadros já são dele.
+        # Se algo falhar antes da publicação, a reserva é desfeita
+        processo = None
+        try:
+            processo = Processo(id_processo, tamanho, self.tamanho_pagina,
+                                preguicoso=self.memoria_preguicosa, tipo_tabela=self.tipo_tabela,
+                                tabela_invertida=self.tabela_invertida, niveis_tabela=self.niveis_tabela,
+                                paginas_grandes=grandes)
+            if self.concorrente and self._trava_paginacao is None:
+                processo.trava = threading.RLock()
+
+            for num_pag, num_quadro in enumerate(quadros):
+                # Adicionar entrada na tabela de páginas (uma por página grande)
+                if num_pag >= paginas_em_grandes:
+                    processo.tabela_paginas.adicionar_entrada(
+                        num_quadro, carregada=not self.memoria_preguicosa
+                    )
+                elif not num_pag & (grandes - 1):
+                    processo.tabela_paginas.adicionar_entrada_grande(
+                        num_quadro, grandes, carregada=not self.memoria_preguicosa
+                    )
+
+                # Carregar página na memória física (no modo preguiçoso, só no primeiro acesso)
+                if not self.memoria_preguicosa:
+                    self._carregar_pagina(processo, num_pag, num_quadro)
+
+            for _ in range(num_imediatas, processo.num_paginas):
+                processo.tabela_paginas.adicionar_entrada(None)
+
+            with self._trava_paginacao or _SEM_TRAVA:
+                if self.politica is not None:
+                    for num_pag in range(num_imediatas):
+                        self.politica.registrar_carga((id_processo, num_pag), falta=False)
+
+                # Publicar o processo: a partir daqui ele pode ser traduzido
+                with self._trava_alocador:
+                    self.processos[id_processo] = processo
+                    self._ids_em_transicao.discard(id_processo)
+        except BaseException:
+            self._desfazer_criacao(id_processo, processo, quadros, num_paginas, num_imediatas,
+                                   paginas_em_grandes // grandes if grandes > 1 else 0)
+            raise
+
+        return ResultadoCriacao(id_processo, tamanho, processo.num_paginas, num_imediatas,
+                                paginas_em_grandes // grandes if grandes > 1 else 0)
+
+    def _desfazer_criacao(self, id_processo: int, processo: Processo, quadros: list, num_paginas: int,
+                          num_imediatas: int, paginas_grandes: int) -> None:
+        """
+        Desfaz a reserva de _criar_processo quando a criação falha depois dela:
+        devolve os quadros (zerados) e a contagem de páginas comprometidas e
+        libera o id para uma nova criação.
+
+        Args:
+            id_processo: Processo que estava sendo criado
+            processo: Processo já construído, ou None
+            quadros: Quadros reservados para o processo
+            num_paginas: Páginas somadas a paginas_comprometidas
+            num_imediatas: Páginas que podem ter sido registradas na política
+            paginas_grandes: Páginas grandes somadas a paginas_grandes_promovidas
+        """
+        with self._trava_paginacao or _SEM_TRAVA:
+            if self.politica is not None:
+                for num_pag in range(num_imediatas):
+                    self.politica.remover((id_processo, num_pag))
+            if processo is not None:
+                processo.tabela_paginas.descartar()
+
+            for num_quadro in quadros:
+                self.obter_quadro(num_quadro)[:] = self._quadro_zerado
+
+            with self._trava_alocador:
+                for num_quadro in quadros:
+                    del self.alocacao_quadros[num_quadro]
+                if quadros:
+                    self.alocador.liberar(quadros)
+                self.paginas_comprometidas -= num_paginas
+                self.paginas_grandes_promovidas -= paginas_grandes
+                self._ids_em_transicao.discard(id_processo)
+
+    def _carregar_pagina(self, processo: Processo, numero_pagina: int, numero_quadro: int) -> None:
+        """
+        Copia o conteúdo de uma página para o quadro (uma única cópia por página).
+
+        Args:
+            processo: Processo dono da página
+            numero_pagina: Número da página lógica
+            numero_quadro: Número do quadro de destino
+        """
+        dados_pagina = processo.obter_dados_pagina(numero_pagina)
+        inicio_quadro = numero_quadro * self.tamanho_pagina
+        self._visao_memoria[inicio_quadro:inicio_quadro + len(dados_pagina)] = dados_pagina
+        self._contar_copia(len(dados_pagina))
+
+    def _contar_copia(self, num_bytes: int) -> None:
+        """Soma bytes copiados para a memória física ao contador global"""
+        with self._trava_contadores:
+            self.bytes_copiados += num_bytes
+
+    def _tratar_falta_pagina(self, processo: Processo, numero_pagina: int) -> int:
+        """
+        Trata uma falta de página: obtém um quadro (despejando uma vítima se
+        necessário) e traz a página do swap ou da memória lógica do processo.
+
+        Args:
+            processo: Processo que causou a falta
+            numero_pagina: Número da página ausente
+
+        Returns:
+            Número do quadro onde a página foi carregada
+        """
+        with self._trava_alocador:
+            quadros = self.alocador.alocar(1)
+            if quadros:
+                self.alocacao_quadros[quadros[0]] = processo.id
+
+        tabela = processo.tabela_paginas
+        posicao_swap = tabela.obter_posicao_swap(numero_pagina)
+        pagina_lida = None
+
+        if quadros:
+            numero_quadro = quadros[0]
+        else:
+            if posicao_swap is not None:
+                # Ler a página e soltar sua posição antes do despejo: com o
+                # compromisso no limite (quadros + swap) o swap está cheio e
+                # a vítima precisa justamente dessa posição
+                pagina_lida = memoryview(bytearray(self.tamanho_pagina))
+                self.swap.ler(posicao_swap, pagina_lida)
+                self.swap.liberar_posicao(posicao_swap)
+                tabela.definir_posicao_swap(numero_pagina, None)
+
+            try:
+                numero_quadro = self._despejar_vitima((processo.id, numero_pagina), processo.id)
+            except ErroMemoriaInsuficiente:
+                if pagina_lida is not None:
+                    # Sem vítima: a página volta para o swap (a posição acabou de ser solta)
+                    posicao_swap = self.swap.alocar_posicao()
+                    self.swap.gravar(posicao_swap, pagina_lida)
+                    tabela.definir_posicao_swap(numero_pagina, posicao_swap)
+                raise
+
+        if posicao_swap is not None:
+            if pagina_lida is not None:
+                self.obter_quadro(numero_quadro)[:] = pagina_lida
+            else:
+                self.swap.ler(posicao_swap, self.obter_quadro(numero_quadro))
+                self.swap.liberar_posicao(posicao_swap)
+                tabela.definir_posicao_swap(numero_pagina, None)
+            processo.bytes_swap_entrada += self.tamanho_pagina
+            self._contar_copia(self.tamanho_pagina)
+        else:
+            self.obter_quadro(numero_quadro)[:] = self._quadro_zerado
+            self._carregar_pagina(processo, numero_pagina, numero_quadro)
+
+        tabela.mapear(numero_pagina, numero_quadro)
+        tabela.marcar_referenciada(numero_pagina)
+        self.politica.registrar_carga((processo.id, numero_pagina))
+        processo.faltas_pagina += 1
+
+        return numero_quadro
+
+    def _despejar_vitima(self, chave_entrante: tuple, novo_dono: int) -> int:
+        """
+        Retira da memória a página escolhida pela política de substituição,
+        gravando-a no swap se seu conteúdo já tiver sido carregado.
+
+        Args:
+            chave_entrante: (id_processo, numero_pagina) da página que causou a falta
+            novo_dono: Processo que passa a ocupar o quadro liberado
+
+        Returns:
+            Número do quadro liberado (não volta ao alocador; é reutilizado)
+
+        Raises:
+            ErroMemoriaInsuficiente: Se não houver vítima ou posição de swap
+                para ela (a vítima continua residente)
+        """
+        # Quadros compartilhados não estão na política: podem faltar vítimas
+        if not self.politica.num_residentes():
+            raise ErroMemoriaInsuficiente(1, 0, inclui_swap=True)
+
+        chave_vitima = self.politica.escolher_vitima(chave_entrante)
+        id_processo, numero_pagina = chave_vitima
+        processo = self.processos[id_processo]
+        tabela = processo.tabela_paginas
+        numero_quadro = tabela.obter_numero_quadro(numero_pagina)
+
+        posicao_swap = None
+        if tabela.esta_carregada(numero_pagina):
+            posicao_swap = self.swap.alocar_posicao()
+            if posicao_swap is None:
+                self.politica.registrar_carga(chave_vitima, falta=False)
+                raise ErroMemoriaInsuficiente(1, 0, inclui_swap=True)
+            self.swap.gravar(posicao_swap, self.obter_quadro(numero_quadro))
+            processo.bytes_swap_saida += self.tamanho_pagina
+
+        tabela.desmapear(numero_pagina, posicao_swap)
+        with self._trava_alocador:
+            self.alocacao_quadros[numero_quadro] = novo_dono
+
+        if self.tlb is not None:
+            self.tlb.invalidar(id_processo, numero_pagina)
+
+        return numero_quadro
+
+    def _testar_e_limpar_referencia(self, chave: tuple) -> bool:
+        """Lê e desliga o bit de referência de uma página (usado pelo Clock)"""
+        id_processo, numero_pagina = chave
+        return self.processos[id_processo].tabela_paginas.limpar_referenciada(numero_pagina)
 
     def remover_processo(self, id_processo: int) -> bool:
         """
@@ -92,34 +650,224 @@ class GerenciadorMemoria:
             id_processo: Identificador do processo
 
         Returns:
-            True se o processo foi removido com sucesso, False caso contrário
+            No modo silencioso, um ResultadoRemocao; caso contrário, True se
+            o processo foi removido com sucesso e False se não foi
+
+        Raises:
+            ErroProcessoNaoEncontrado: apenas no modo silencioso
         """
-        if id_processo not in self.processos:
-            print(f"\n[ERRO] Processo {id_processo} não encontrado!")
+        if self.silencioso:
+            return self._remover_processo(id_processo)
+
+        try:
+            resultado = self._remover_processo(id_processo)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
             return False
 
-        processo = self.processos[id_processo]
+        self.apresentador.processo_removido(resultado)
+        return True
+
+    def _remover_processo(self, id_processo: int) -> ResultadoRemocao:
+        """Remove o processo ou levanta a exceção correspondente (ver remover_processo)"""
+        with self._trava_paginacao or _SEM_TRAVA:
+            # Retirar o processo do dicionário primeiro: novas traduções já
+            # falham e a política não o escolhe mais como vítima
+            with self._trava_alocador:
+                processo = self.processos.pop(id_processo, None)
+                if processo is None:
+                    raise ErroProcessoNaoEncontrado(id_processo)
+                self._ids_em_transicao.add(id_processo)
+
+            # A trava do processo espera cargas preguiçosas em andamento
+            with processo.trava or _SEM_TRAVA:
+                # Liberar as posições de swap e retirar as páginas da política
+                if self.swap is not None:
+                    for posicao_swap in processo.tabela_paginas.posicoes_swap():
+                        self.swap.liberar_posicao(posicao_swap)
+                    for num_pag in range(processo.num_paginas):
+                        self.politica.remover((id_processo, num_pag))
+
+                if self.tlb is not None:
+                    self.tlb.invalidar_processo(id_processo)
 
-        # Liberar todos os quadros do processo
-        for entrada in processo.tabela_paginas.entradas:
-            num_quadro = entrada.numero_quadro
-            self.quadros_livres.add(num_quadro)
-            del self.alocacao_quadros[num_quadro]
+                # Liberar os quadros exclusivos do processo; nos compartilhados
+                # só a contagem de referências diminui
+                quadros = processo.tabela_paginas.quadros_mapeados()
+                compartilhados = []
+                if self.referencias_quadros:
+                    compartilhados = [num_quadro for num_quadro in quadros
+                                      if num_quadro in self.referencias_quadros]
+                    quadros = [num_quadro for num_quadro in quadros
+                               if num_quadro not in self.referencias_quadros]
 
-            # Limpar memória física (opcional, mas bom para segurança)
-            inicio_quadro = num_quadro * self.tamanho_pagina
-            for i in range(self.tamanho_pagina):
-                self.memoria_fisica[inicio_quadro + i] = 0
+                for num_quadro in quadros:
+                    # Limpar memória física (opcional, mas bom para segurança)
+                    self.obter_quadro(num_quadro)[:] = self._quadro_zerado
 
-        # Remover processo do dicionário
-        del self.processos[id_processo]
+                with self._trava_alocador:
+                    for num_quadro in quadros:
+                        del self.alocacao_quadros[num_quadro]
+                    for num_quadro in compartilhados:
+                        if self._soltar_referencia(num_quadro):
+                            quadros.append(num_quadro)
+                    self.alocador.liberar(quadros)
+                    self.paginas_comprometidas -= processo.num_paginas
+                    self._ids_em_transicao.discard(id_processo)
 
-        print(f"\n[OK] Processo {id_processo} removido com sucesso!")
-        print(f"   {processo.num_paginas} quadros liberados")
+                processo.tabela_paginas.descartar()
 
+        return ResultadoRemocao(id_processo, len(quadros))
+
+    def _soltar_referencia(self, numero_quadro: int) -> bool:
+        """
+        Retira uma referência de um quadro compartilhado (com _trava_alocador).
+
+        Returns:
+            True se era a última referência: o quadro foi zerado e deve ser
+            devolvido ao alocador pelo chamador
+        """
+        referencias = self.referencias_quadros[numero_quadro] - 1
+        if referencias:
+            self.referencias_quadros[numero_quadro] = referencias
+            return False
+
+        del self.referencias_quadros[numero_quadro]
+        self.obter_quadro(numero_quadro)[:] = self._quadro_zerado
         return True
 
-    def traduzir_endereco(self, id_processo: int, endereco_logico: int) -> dict:
+    def fork_processo(self, id_pai: int, id_filho: int):
+        """
+        Cria um processo filho que compartilha os quadros do pai (fork).
+
+        Os quadros residentes do pai passam a ser compartilhados, somente
+        leitura, com contagem de referências em referencias_quadros: o fork
+        copia apenas entradas de tabela de páginas, nenhum byte da memória
+        física. Um quadro só é copiado quando um dos processos escreve nele
+        (escrever_endereco). Páginas do pai que estão no swap são copiadas
+        para posições novas do swap do filho.
+
+        Quadros compartilhados ficam fixos na memória: não são candidatos a
+        despejo enquanto não forem copiados ou liberados.
+
+        Args:
+            id_pai: Processo a ser duplicado
+            id_filho: Identificador do novo processo
+
+        Returns:
+            No modo silencioso, um ResultadoFork; caso contrário, True se o
+            fork foi feito e False se não foi
+
+        Raises:
+            ErroProcessoNaoEncontrado, ErroProcessoExistente, ErroMemoriaInsuficiente:
+                apenas no modo silencioso
+            ValueError: Com a tabela de páginas invertida, que tem uma única
+                entrada por quadro e não permite compartilhá-lo
+        """
+        if self.silencioso:
+            return self._fork_processo(id_pai, id_filho)
+
+        try:
+            resultado = self._fork_processo(id_pai, id_filho)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
+            return False
+
+        self.apresentador.processo_bifurcado(resultado)
+        return True
+
+    def _fork_processo(self, id_pai: int, id_filho: int) -> ResultadoFork:
+        """Faz o fork ou levanta a exceção correspondente (ver fork_processo)"""
+        if self.tabela_invertida is not None:
+            raise ValueError("fork_processo nao suporta a tabela de paginas invertida")
+
+        with self._trava_paginacao or _SEM_TRAVA:
+            pai = self.processos.get(id_pai)
+            if pai is None:
+                raise ErroProcessoNaoEncontrado(id_pai)
+
+            # A trava do pai espera cargas preguiçosas e cópias na escrita
+            with pai.trava or _SEM_TRAVA:
+                if self.processos.get(id_pai) is not pai:
+                    raise ErroProcessoNaoEncontrado(id_pai)
+
+                tabela_pai = pai.tabela_paginas
+                quadros = [tabela_pai.obter_numero_quadro(num_pag) for num_pag in range(pai.num_paginas)]
+                posicoes_swap = {}
+                if self.swap is not None:
+                    for num_pag in range(pai.num_paginas):
+                        posicao_swap = tabela_pai.obter_posicao_swap(num_pag)
+                        if posicao_swap is not None:
+                            posicoes_swap[num_pag] = posicao_swap
+
+                with self._trava_alocador:
+                    if id_filho in self.processos or id_filho in self._ids_em_transicao:
+                        raise ErroProcessoExistente(id_filho)
+
+                    if self.swap is not None:
+                        # O filho compromete suas páginas como um processo novo:
+                        # cada cópia na escrita precisa de um quadro ou posição de swap
+                        capacidade = self.total_quadros + self.swap.total_posicoes - self.paginas_comprometidas
+                        if capacidade < pai.num_paginas:
+                            raise ErroMemoriaInsuficiente(pai.num_paginas, capacidade, inclui_swap=True)
+                        if self.swap.num_livres() < len(posicoes_swap):
+                            raise ErroMemoriaInsuficiente(len(posicoes_swap), self.swap.num_livres(),
+                                                          inclui_swap=True)
+
+                    # Posições de swap das cópias do filho, reservadas antes de
+                    # qualquer mudança no estado compartilhado
+                    novas_posicoes = {}
+                    for num_pag in posicoes_swap:
+                        nova_posicao = self.swap.alocar_posicao()
+                        if nova_posicao is None:
+                            for posicao_reservada in novas_posicoes.values():
+                                self.swap.liberar_posicao(posicao_reservada)
+                            raise ErroMemoriaInsuficiente(len(posicoes_swap), len(novas_posicoes),
+                                                          inclui_swap=True)
+                        novas_posicoes[num_pag] = nova_posicao
+
+                    for num_pag, num_quadro in enumerate(quadros):
+                        if num_quadro is None:
+                            continue
+                        if num_quadro in self.referencias_quadros:
+                            self.referencias_quadros[num_quadro] += 1
+                        else:
+                            # O quadro deixa de ser exclusivo do pai e sai da política
+                            del self.alocacao_quadros[num_quadro]
+                            self.referencias_quadros[num_quadro] = 2
+                            if self.politica is not None:
+                                self.politica.remover((id_pai, num_pag))
+
+                    self.paginas_comprometidas += pai.num_paginas
+                    self._ids_em_transicao.add(id_filho)
+
+                filho = pai.bifurcar(id_filho, self.tipo_tabela, self.niveis_tabela)
+                if self.concorrente and self._trava_paginacao is None:
+                    filho.trava = threading.RLock()
+
+                tabela_filho = filho.tabela_paginas
+                for num_pag, num_quadro in enumerate(quadros):
+                    tabela_filho.adicionar_entrada(
+                        num_quadro, carregada=num_quadro is not None and tabela_pai.esta_carregada(num_pag)
+                    )
+
+                if posicoes_swap:
+                    pagina = memoryview(bytearray(self.tamanho_pagina))
+                    for num_pag, posicao_swap in posicoes_swap.items():
+                        nova_posicao = novas_posicoes[num_pag]
+                        self.swap.ler(posicao_swap, pagina)
+                        self.swap.gravar(nova_posicao, pagina)
+                        tabela_filho.definir_posicao_swap(num_pag, nova_posicao)
+
+                with self._trava_alocador:
+                    self.processos[id_filho] = filho
+                    self._ids_em_transicao.discard(id_filho)
+                    self.forks += 1
+
+        quadros_compartilhados = len(quadros) - quadros.count(None)
+        return ResultadoFork(id_pai, id_filho, pai.num_paginas, quadros_compartilhados, len(posicoes_swap))
+
+    def traduzir_endereco(self, id_processo: int, endereco_logico: int) -> ResultadoTraducao:
         """
         Traduz um endereço lógico para endereço físico.
 
@@ -128,81 +876,707 @@ class GerenciadorMemoria:
             endereco_logico: Endereço lógico a ser traduzido
 
         Returns:
-            Dicionário com informações da tradução ou None se inválido
+            ResultadoTraducao com as informações da tradução; fora do modo
+            silencioso, None se o endereço for inválido
+
+        Raises:
+            ErroProcessoNaoEncontrado, ErroEnderecoInvalido, ErroPaginaNaoEncontrada:
+                apenas no modo silencioso
         """
-        if id_processo not in self.processos:
-            print(f"\n[ERRO] Processo {id_processo} não encontrado!")
+        if self.silencioso:
+            return self._traduzir_endereco(id_processo, endereco_logico)
+
+        try:
+            return self._traduzir_endereco(id_processo, endereco_logico)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
             return None
 
-        processo = self.processos[id_processo]
+    def _traduzir_endereco(self, id_processo: int, endereco_logico: int) -> ResultadoTraducao:
+        """Traduz o endereço ou levanta a exceção correspondente (ver traduzir_endereco)"""
+        processo = self.processos.get(id_processo)
+        if processo is None:
+            raise ErroProcessoNaoEncontrado(id_processo)
 
         # Verificar se endereço está dentro do espaço lógico
         if endereco_logico < 0 or endereco_logico >= processo.tamanho:
-            print(f"\n[ERRO] Endereço lógico {endereco_logico} fora do espaço de endereçamento!")
-            print(f"   Espaço válido: 0-{processo.tamanho - 1}")
-            return None
+            raise ErroEnderecoInvalido(id_processo, endereco_logico, processo.tamanho)
 
         # Calcular número da página e deslocamento
-        numero_pagina = endereco_logico // self.tamanho_pagina
-        deslocamento = endereco_logico % self.tamanho_pagina
+        numero_pagina = endereco_logico >> self.bits_deslocamento
+        deslocamento = endereco_logico & self.mascara_deslocamento
 
-        # Obter número do quadro da tabela de páginas
-        numero_quadro = processo.tabela_paginas.obter_numero_quadro(numero_pagina)
+        numero_quadro, falta_pagina, valor = self._ler_pagina(processo, numero_pagina, deslocamento)
 
         if numero_quadro is None:
-            print(f"\n[ERRO] Página {numero_pagina} não encontrada na tabela!")
-            return None
+            raise ErroPaginaNaoEncontrada(id_processo, numero_pagina)
 
         # Calcular endereço físico
-        endereco_fisico = numero_quadro * self.tamanho_pagina + deslocamento
+        endereco_fisico = (numero_quadro << self.bits_deslocamento) | deslocamento
+
+        return ResultadoTraducao(endereco_logico, numero_pagina, deslocamento, numero_quadro,
+                                 endereco_fisico, valor, falta_pagina)
+
+    def escrever_endereco(self, id_processo: int, endereco_logico: int, valor: int):
+        """
+        Escreve um byte no endereço lógico de um processo.
+
+        Se a página está em um quadro compartilhado (fork), o quadro é
+        copiado antes da escrita e a página passa a ter um quadro exclusivo.
+
+        Args:
+            id_processo: Identificador do processo
+            endereco_logico: Endereço lógico a ser escrito
+            valor: Byte a escrever (0-255)
+
+        Returns:
+            ResultadoEscrita; fora do modo silencioso, None se a escrita falhar
+
+        Raises:
+            ErroProcessoNaoEncontrado, ErroEnderecoInvalido, ErroPaginaNaoEncontrada,
+            ErroMemoriaInsuficiente: apenas no modo silencioso
+            ValueError: Se o valor não couber em um byte
+        """
+        if not 0 <= valor <= 255:
+            raise ValueError(f"Valor deve estar entre 0 e 255: {valor}")
+
+        if self.silencioso:
+            return self._escrever_endereco(id_processo, endereco_logico, valor)
+
+        try:
+            resultado = self._escrever_endereco(id_processo, endereco_logico, valor)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
+            return None
+
+        self.apresentador.escrita(resultado)
+        return resultado
+
+    def _escrever_endereco(self, id_processo: int, endereco_logico: int, valor: int) -> ResultadoEscrita:
+        """Escreve o byte ou levanta a exceção correspondente (ver escrever_endereco)"""
+        processo = self.processos.get(id_processo)
+        if processo is None:
+            raise ErroProcessoNaoEncontrado(id_processo)
+
+        if endereco_logico < 0 or endereco_logico >= processo.tamanho:
+            raise ErroEnderecoInvalido(id_processo, endereco_logico, processo.tamanho)
+
+        numero_pagina = endereco_logico >> self.bits_deslocamento
+        deslocamento = endereco_logico & self.mascara_deslocamento
+
+        # Tradução, cópia e escrita sem que um despejo, um fork ou a
+        # deduplicação compartilhe ou leve o quadro no meio
+        with self._trava_paginacao or processo.trava or _SEM_TRAVA:
+            if self.processos.get(id_processo) is not processo:
+                raise ErroProcessoNaoEncontrado(id_processo)
+
+            numero_quadro, falta_pagina = self._consultar_pagina(processo, numero_pagina)
+            if numero_quadro is None:
+                raise ErroPaginaNaoEncontrada(id_processo, numero_pagina)
+
+            copia_na_escrita = False
+            if numero_quadro in self.referencias_quadros:
+                numero_quadro, copia_na_escrita = self._quebrar_compartilhamento(
+                    processo, numero_pagina, numero_quadro
+                )
+
+            endereco_fisico = (numero_quadro << self.bits_deslocamento) | deslocamento
+            self.memoria_fisica[endereco_fisico] = valor
+
+        return ResultadoEscrita(endereco_logico, numero_pagina, numero_quadro, endereco_fisico,
+                                valor, falta_pagina, copia_na_escrita)
+
+    def _quebrar_compartilhamento(self, processo: Processo, numero_pagina: int, numero_quadro: int) -> tuple:
+        """
+        Dá à página um quadro exclusivo antes de uma escrita (cópia na escrita).
+
+        Se o processo é o último a mapear o quadro compartilhado, o quadro
+        volta a ser exclusivo sem cópia; senão a página é copiada para um
+        quadro novo (obtido do alocador ou por despejo).
+
+        Args:
+            processo: Processo que vai escrever
+            numero_pagina: Página a ser escrita
+            numero_quadro: Quadro compartilhado atual da página
+
+        Returns:
+            Tupla (quadro exclusivo da página, True se houve cópia)
+        """
+        chave = (processo.id, numero_pagina)
+        tabela = processo.tabela_paginas
+
+        with processo.trava or _SEM_TRAVA:
+            # Outra thread do mesmo processo pode ter feito a cópia
+            if tabela.obter_numero_quadro(numero_pagina) != numero_quadro:
+                return tabela.obter_numero_quadro(numero_pagina), False
+
+            with self._trava_alocador:
+                ultima_referencia = self.referencias_quadros[numero_quadro] == 1
+                novo_quadro = None
+
+                if ultima_referencia:
+                    del self.referencias_quadros[numero_quadro]
+                    self.alocacao_quadros[numero_quadro] = processo.id
+                else:
+                    novos = self.alocador.alocar(1)
+                    if novos:
+                        novo_quadro = novos[0]
+                        self.alocacao_quadros[novo_quadro] = processo.id
+                        self._copiar_quadro_compartilhado(tabela, numero_pagina, numero_quadro, novo_quadro)
+
+            if ultima_referencia:
+                # O quadro volta a ser exclusivo sem cópia
+                if self.politica is not None:
+                    self.politica.registrar_carga(chave, falta=False)
+                return numero_quadro, False
 
-        # Obter valor armazenado
-        valor = self.memoria_fisica[endereco_fisico]
+            if novo_quadro is None:
+                if self.swap is None:
+                    raise ErroMemoriaInsuficiente(1, 0)
+                novo_quadro = self._despejar_vitima(chave, processo.id)
+                with self._trava_alocador:
+                    self._copiar_quadro_compartilhado(tabela, numero_pagina, numero_quadro, novo_quadro)
+
+        if self.politica is not None:
+            self.politica.registrar_carga(chave, falta=False)
+        if self.tlb is not None:
+            self.tlb.invalidar(processo.id, numero_pagina)
+
+        return novo_quadro, True
+
+    def _copiar_quadro_compartilhado(self, tabela, numero_pagina: int, antigo: int, novo: int) -> None:
+        """
+        Copia a página para o quadro exclusivo e solta a referência ao
+        compartilhado (com _trava_alocador; é a cópia de uma única página).
+        """
+        self.obter_quadro(novo)[:] = self.obter_quadro(antigo)
+        tabela.mapear(numero_pagina, novo)
+        if self._soltar_referencia(antigo):
+            self.alocador.liberar((antigo,))
+        self.copias_na_escrita += 1
+        self._contar_copia(self.tamanho_pagina)
+
+    def criar_segmento(self, nome: str, tamanho: int):
+        """
+        Cria um segmento de memória compartilhada com nome.
+
+        Os quadros do segmento são reservados e preenchidos agora e ficam
+        fixos na memória, fora da política de substituição, enquanto o
+        segmento existir ou algum processo os mapear.
+
+        Args:
+            nome: Nome do segmento
+            tamanho: Tamanho do segmento em bytes
+
+        Returns:
+            No modo silencioso, um ResultadoSegmento; caso contrário, True se
+            o segmento foi criado e False se não foi
+
+        Raises:
+            ErroSegmentoExistente, ErroTamanhoExcedido, ErroMemoriaInsuficiente:
+                apenas no modo silencioso
+        """
+        if self.silencioso:
+            return self._criar_segmento(nome, tamanho)
+
+        try:
+            resultado = self._criar_segmento(nome, tamanho)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
+            return False
+
+        self.apresentador.segmento_criado(resultado)
+        return True
+
+    def _criar_segmento(self, nome: str, tamanho: int) -> ResultadoSegmento:
+        """Cria o segmento ou levanta a exceção correspondente (ver criar_segmento)"""
+        segmento = SegmentoCompartilhado(nome, tamanho, self.tamanho_pagina)
+        num_paginas = segmento.num_paginas
+
+        with self._trava_paginacao or _SEM_TRAVA:
+            with self._trava_alocador:
+                if nome in self.segmentos:
+                    raise ErroSegmentoExistente(nome)
+
+                if tamanho > self.configuracao.tamanho_maximo_processo:
+                    raise ErroTamanhoExcedido(tamanho, self.configuracao.tamanho_maximo_processo)
+
+                if self.swap is None:
+                    if self.alocador.num_livres() < num_paginas:
+                        raise ErroMemoriaInsuficiente(num_paginas, self.alocador.num_livres())
+                else:
+                    capacidade = self.total_quadros + self.swap.total_posicoes - self.paginas_comprometidas
+                    if capacidade < num_paginas:
+                        raise ErroMemoriaInsuficiente(num_paginas, capacidade, inclui_swap=True)
+
+                # O segmento é publicado já com seus quadros (cada um com a
+                # referência do próprio segmento), mas só pode ser anexado
+                # depois de preenchido
+                num_livres = min(num_paginas, self.alocador.num_livres())
+                quadros = self.alocador.alocar(num_livres) if num_livres else []
+                for num_quadro in quadros:
+                    self.referencias_quadros[num_quadro] = 1
+                segmento.quadros.extend(quadros)
+                self.paginas_comprometidas += num_paginas
+                self.segmentos[nome] = segmento
+
+            try:
+                # Com swap, os quadros que faltam vêm de despejos
+                while len(segmento.quadros) < num_paginas:
+                    num_quadro = self._despejar_vitima(None, None)
+                    with self._trava_alocador:
+                        del self.alocacao_quadros[num_quadro]
+                        self.referencias_quadros[num_quadro] = 1
+                    segmento.quadros.append(num_quadro)
+            except ErroMemoriaInsuficiente:
+                with self._trava_alocador:
+                    self._descartar_segmento(segmento)
+                raise
+
+            for num_pag, num_quadro in enumerate(segmento.quadros):
+                dados = segmento.gerar_pagina(num_pag)
+                quadro = self.obter_quadro(num_quadro)
+                quadro[:len(dados)] = dados
+                quadro[len(dados):] = self._quadro_zerado[len(dados):]
+                self._contar_copia(len(dados))
+
+            with self._trava_alocador:
+                segmento.pronto = True
+
+        return ResultadoSegmento(nome, tamanho, num_paginas, num_paginas)
+
+    def _descartar_segmento(self, segmento: SegmentoCompartilhado) -> int:
+        """
+        Retira o segmento e solta as referências dele (com _trava_alocador).
+
+        Returns:
+            Quadros devolvidos ao alocador (os que nenhum processo mapeia)
+        """
+        del self.segmentos[segmento.nome]
+        liberados = [num_quadro for num_quadro in segmento.quadros if self._soltar_referencia(num_quadro)]
+        self.alocador.liberar(liberados)
+        self.paginas_comprometidas -= segmento.num_paginas
+        return len(liberados)
+
+    def anexar_segmento(self, id_processo: int, nome: str):
+        """
+        Mapeia um segmento compartilhado no fim do espaço de endereçamento
+        do processo.
+
+        As páginas do segmento são acrescentadas à tabela de páginas do
+        processo apontando para os quadros do segmento; nenhum byte é
+        copiado. Uma escrita em uma delas dá ao processo uma cópia privada
+        da página (cópia na escrita).
+
+        Args:
+            id_processo: Identificador do processo
+            nome: Nome do segmento
+
+        Returns:
+            No modo silencioso, um ResultadoAnexacao; caso contrário, True se
+            o segmento foi anexado e False se não foi
+
+        Raises:
+            ErroProcessoNaoEncontrado, ErroSegmentoNaoEncontrado, ErroMemoriaInsuficiente:
+                apenas no modo silencioso
+            ValueError: Com a tabela de páginas invertida, que tem uma única
+                entrada por quadro e não permite compartilhá-lo
+        """
+        if self.silencioso:
+            return self._anexar_segmento(id_processo, nome)
+
+        try:
+            resultado = self._anexar_segmento(id_processo, nome)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
+            return False
+
+        self.apresentador.segmento_anexado(resultado)
+        return True
+
+    def _anexar_segmento(self, id_processo: int, nome: str) -> ResultadoAnexacao:
+        """Anexa o segmento ou levanta a exceção correspondente (ver anexar_segmento)"""
+        if self.tabela_invertida is not None:
+            raise ValueError("anexar_segmento nao suporta a tabela de paginas invertida")
+
+        with self._trava_paginacao or _SEM_TRAVA:
+            processo = self.processos.get(id_processo)
+            if processo is None:
+                raise ErroProcessoNaoEncontrado(id_processo)
+
+            with processo.trava or _SEM_TRAVA:
+                if self.processos.get(id_processo) is not processo:
+                    raise ErroProcessoNaoEncontrado(id_processo)
+
+                with self._trava_alocador:
+                    segmento = self.segmentos.get(nome)
+                    if segmento is None or not segmento.pronto:
+                        raise ErroSegmentoNaoEncontrado(nome)
+
+                    num_paginas = segmento.num_paginas
+                    if self.swap is not None:
+                        # Cada página anexada pode virar uma cópia privada
+                        capacidade = self.total_quadros + self.swap.total_posicoes - self.paginas_comprometidas
+                        if capacidade < num_paginas:
+                            raise ErroMemoriaInsuficiente(num_paginas, capacidade, inclui_swap=True)
+
+                    # Entradas antes do novo tamanho: traduções sem trava
+                    # nunca veem endereços sem entrada
+                    tabela = processo.tabela_paginas
+                    for num_quadro in segmento.quadros:
+                        self.referencias_quadros[num_quadro] += 1
+                        tabela.adicionar_entrada(num_quadro)
+
+                    self.paginas_comprometidas += num_paginas
+                    pagina_inicial = processo.anexar_segmento(nome, num_paginas)
+
+        return ResultadoAnexacao(id_processo, nome, pagina_inicial, num_paginas,
+                                 pagina_inicial << self.bits_deslocamento)
+
+    def remover_segmento(self, nome: str):
+        """
+        Remove um segmento compartilhado.
+
+        Os processos que o anexaram continuam mapeando suas páginas; cada
+        quadro volta ao alocador quando o último processo deixa de usá-lo.
+
+        Args:
+            nome: Nome do segmento
+
+        Returns:
+            No modo silencioso, um ResultadoSegmento com os quadros
+            liberados; caso contrário, True se o segmento foi removido e
+            False se não foi
+
+        Raises:
+            ErroSegmentoNaoEncontrado: apenas no modo silencioso
+        """
+        if self.silencioso:
+            return self._remover_segmento(nome)
+
+        try:
+            resultado = self._remover_segmento(nome)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
+            return False
+
+        self.apresentador.segmento_removido(resultado)
+        return True
+
+    def _remover_segmento(self, nome: str) -> ResultadoSegmento:
+        """Remove o segmento ou levanta a exceção correspondente (ver remover_segmento)"""
+        with self._trava_paginacao or _SEM_TRAVA, self._trava_alocador:
+            segmento = self.segmentos.get(nome)
+            if segmento is None or not segmento.pronto:
+                raise ErroSegmentoNaoEncontrado(nome)
+            liberados = self._descartar_segmento(segmento)
+
+        return ResultadoSegmento(nome, segmento.tamanho, segmento.num_paginas, liberados)
+
+    def deduplicar(self, max_paginas: int = None):
+        """
+        Executa um passo da deduplicação de páginas por conteúdo (ver
+        deduplicacao.py), continuando a varredura de onde o passo anterior
+        parou.
+
+        Args:
+            max_paginas: Páginas examinadas no passo (padrão: as do Deduplicador)
+
+        Returns:
+            ResultadoDeduplicacao do passo
+
+        Raises:
+            ValueError: Com a tabela de páginas invertida, que tem uma única
+                entrada por quadro e não permite compartilhá-lo
+        """
+        if self.tabela_invertida is not None:
+            raise ValueError("A deduplicacao nao suporta a tabela de paginas invertida")
+
+        with self._trava_alocador:
+            if self.deduplicador is None:
+                self.deduplicador = Deduplicador(self)
+
+        return self.deduplicador.passo(max_paginas)
+
+    def _mesclar_pagina(self, processo: Processo, numero_pagina: int, numero_quadro: int,
+                        destino: int, dono_destino: tuple = None) -> bool:
+        """
+        Faz uma página passar a mapear um quadro de conteúdo idêntico e
+        libera o quadro exclusivo dela (usado pela deduplicação).
+
+        Args:
+            processo: Processo da página
+            numero_pagina: Página a ser mesclada
+            numero_quadro: Quadro exclusivo atual da página
+            destino: Quadro que a página passa a mapear
+            dono_destino: (processo, numero_pagina) que mapeia o destino, se
+                ele ainda é exclusivo (passa a ser compartilhado); None se o
+                destino já é compartilhado
+
+        Returns:
+            True se a página foi mesclada; False se algo mudou desde que as
+            assinaturas foram calculadas (despejo, escrita, cópia, remoção)
+            ou se o conteúdo não é igual
+        """
+        travas = [processo.trava]
+        if dono_destino is not None and dono_destino[0] is not processo:
+            travas.append(dono_destino[0].trava)
+
+        with ExitStack() as pilha:
+            for trava in travas:
+                if trava is not None:
+                    pilha.enter_context(trava)
+            pilha.enter_context(self._trava_paginacao or _SEM_TRAVA)
+            pilha.enter_context(self._trava_alocador)
+
+            if (self.processos.get(processo.id) is not processo
+                    or processo.tabela_paginas.obter_numero_quadro(numero_pagina) != numero_quadro
+                    or self.alocacao_quadros.get(numero_quadro) != processo.id):
+                return False
+
+            if dono_destino is None:
+                if destino not in self.referencias_quadros:
+                    return False
+            else:
+                outro, outra_pagina = dono_destino
+                if (self.processos.get(outro.id) is not outro
+                        or outro.tabela_paginas.obter_numero_quadro(outra_pagina) != destino
+                        or self.alocacao_quadros.get(destino) != outro.id):
+                    return False
+
+            if self.obter_quadro(numero_quadro) != self.obter_quadro(destino):
+                return False
+
+            if dono_destino is not None:
+                # O quadro do outro processo deixa de ser exclusivo e sai da política
+                del self.alocacao_quadros[destino]
+                self.referencias_quadros[destino] = 1
+                if self.politica is not None:
+                    self.politica.remover((outro.id, outra_pagina))
+
+            self.referencias_quadros[destino] += 1
+            processo.tabela_paginas.mapear(numero_pagina, destino)
+            del self.alocacao_quadros[numero_quadro]
+            if self.politica is not None:
+                self.politica.remover((processo.id, numero_pagina))
+            if self.tlb is not None:
+                self.tlb.invalidar(processo.id, numero_pagina)
+
+            self.obter_quadro(numero_quadro)[:] = self._quadro_zerado
+            self.alocador.liberar((numero_quadro,))
+
+        return True
+
+    def traduzir_lote(self, enderecos, id_processo: int = None) -> dict:
+        """
+        Traduz muitos endereços de uma vez, devolvendo resultados em colunas.
+
+        Os endereços inválidos não interrompem o lote: suas colunas de quadro,
+        endereço físico e valor recebem -1.
+
+        Args:
+            enderecos: Endereços lógicos (se id_processo for informado) ou
+                pares (id_processo, endereco_logico)
+            id_processo: Processo dono de todos os endereços, ou None se
+                enderecos contiver pares
+
+        Returns:
+            Dicionário de arrays ('id_processo', 'endereco_logico',
+            'numero_pagina', 'deslocamento', 'numero_quadro',
+            'endereco_fisico', 'valor') e os totais 'faltas_pagina' e 'invalidos'
+        """
+        if id_processo is not None:
+            enderecos = array('q', enderecos)
+            ids_processo = array('q', [id_processo]) * len(enderecos)
+        else:
+            pares = list(enderecos)
+            ids_processo = array('q', [par[0] for par in pares])
+            enderecos = array('q', [par[1] for par in pares])
+
+        bits = self.bits_deslocamento
+        mascara = self.mascara_deslocamento
+        paginas = array('q', [endereco >> bits for endereco in enderecos])
+        deslocamentos = array('q', [endereco & mascara for endereco in enderecos])
+        memoria = self.memoria_fisica
+        # No modo concorrente o lote trabalha sobre uma cópia do dicionário
+        processos = self.processos.copy() if self.concorrente else self.processos
+        faltas_pagina = 0
+        invalidos = 0
+
+        if self.swap is None and self.tlb is None:
+            # Sem swap nem TLB os mapeamentos não mudam durante o lote: cada
+            # página distinta é resolvida uma única vez e o restante são
+            # deslocamentos e máscaras sobre as colunas
+            if id_processo is not None:
+                limite = processos[id_processo].tamanho if id_processo in processos else 0
+                validos = [0 <= endereco < limite for endereco in enderecos]
+                chaves = paginas
+            else:
+                limites = {pid: processo.tamanho for pid, processo in processos.items()}
+                validos = [0 <= endereco < limites.get(pid, 0)
+                           for pid, endereco in zip(ids_processo, enderecos)]
+                chaves = list(zip(ids_processo, paginas))
+
+            quadro_da_pagina = {}
+            for chave in set(compress(chaves, validos)):
+                pid, pagina = (id_processo, chave) if id_processo is not None else chave
+                numero_quadro = self._traduzir_pagina(processos[pid], pagina)[0]
+                quadro_da_pagina[chave] = -1 if numero_quadro is None else numero_quadro
+
+            quadros = array('q', [quadro_da_pagina[chave] if valido else -1
+                                  for chave, valido in zip(chaves, validos)])
+            fisicos = array('q', [(quadro << bits) | deslocamento if quadro >= 0 else -1
+                                  for quadro, deslocamento in zip(quadros, deslocamentos)])
+            valores = array('h', [memoria[fisico] if fisico >= 0 else -1 for fisico in fisicos])
+            invalidos = quadros.count(-1)
+        else:
+            quadros = array('q', [-1]) * len(enderecos)
+            fisicos = array('q', [-1]) * len(enderecos)
+            valores = array('h', [-1]) * len(enderecos)
+
+            for indice, (pid, endereco, pagina) in enumerate(zip(ids_processo, enderecos, paginas)):
+                processo = processos.get(pid)
+                if processo is None or endereco < 0 or endereco >= processo.tamanho:
+                    invalidos += 1
+                    continue
+
+                # O valor é lido junto com a tradução: uma falta adiante no
+                # lote (ou em outra thread) pode despejar o quadro
+                deslocamento = endereco & mascara
+                numero_quadro, falta_pagina, valor = self._ler_pagina(processo, pagina, deslocamento)
+                if numero_quadro is None:
+                    invalidos += 1
+                    continue
+
+                quadros[indice] = numero_quadro
+                fisicos[indice] = (numero_quadro << bits) | deslocamento
+                valores[indice] = valor
+                faltas_pagina += falta_pagina
 
         return {
-            'endereco_logico': endereco_logico,
-            'numero_pagina': numero_pagina,
-            'deslocamento': deslocamento,
-            'numero_quadro': numero_quadro,
-            'endereco_fisico': endereco_fisico,
-            'valor': valor
+            'id_processo': ids_processo,
+            'endereco_logico': enderecos,
+            'numero_pagina': paginas,
+            'deslocamento': deslocamentos,
+            'numero_quadro': quadros,
+            'endereco_fisico': fisicos,
+            'valor': valores,
+            'faltas_pagina': faltas_pagina,
+            'invalidos': invalidos
         }
 
-    def exibir_memoria(self) -> None:
-        """Exibe o estado atual da memória física"""
-        quadros_usados = self.total_quadros - len(self.quadros_livres)
-        percentual_livre = (len(self.quadros_livres) / self.total_quadros) * 100
-        percentual_usado = (quadros_usados / self.total_quadros) * 100
-
-        print("\n" + "=" * 60)
-        print("                    MEMÓRIA FÍSICA")
-        print("=" * 60)
-        print(f"Tamanho total: {len(self.memoria_fisica)} bytes")
-        print(f"Tamanho do quadro: {self.tamanho_pagina} bytes")
-        print(f"Total de quadros: {self.total_quadros}")
-        print(f"Quadros livres: {len(self.quadros_livres)} ({percentual_livre:.2f}%)")
-        print(f"Quadros usados: {quadros_usados} ({percentual_usado:.2f}%)")
-        print("=" * 60)
-
-        for num_quadro in range(self.total_quadros):
-            endereco_inicio = num_quadro * self.tamanho_pagina
-            endereco_fim = endereco_inicio + self.tamanho_pagina - 1
-
-            if num_quadro in self.quadros_livres:
-                status = "LIVRE"
-            else:
-                pid = self.alocacao_quadros[num_quadro]
-                status = f"PID {pid}"
+    def _traduzir_pagina(self, processo: Processo, numero_pagina: int) -> tuple:
+        """
+        Obtém o quadro de uma página consultando a TLB e, na falta, a tabela
+        de páginas; registra o acesso na política de substituição.
 
-            print(f"\nQuadro {num_quadro:2d} [{endereco_inicio:4d}-{endereco_fim:4d}] - {status}")
+        Args:
+            processo: Processo dono da página
+            numero_pagina: Número da página lógica
 
-            # Mostrar primeiros bytes do quadro (apenas se estiver ocupado)
-            if num_quadro not in self.quadros_livres:
-                dados_quadro = self.memoria_fisica[endereco_inicio:endereco_inicio + 16]
-                valores_hex = " ".join(f"{byte:02x}" for byte in dados_quadro)
-                print(f"  Dados: {valores_hex} ...")
+        Returns:
+            Tupla (numero_quadro, falta_pagina); numero_quadro é None se a
+            página não existir (ou o processo tiver sido removido)
+        """
+        if self._trava_paginacao is not None:
+            with self._trava_paginacao:
+                # O processo pode ter sido removido enquanto a trava era esperada
+                if self.processos.get(processo.id) is not processo:
+                    return None, False
+                return self._consultar_pagina(processo, numero_pagina)
 
-        print("\n" + "=" * 60)
+        return self._consultar_pagina(processo, numero_pagina)
+
+    def _ler_pagina(self, processo: Processo, numero_pagina: int, deslocamento: int) -> tuple:
+        """
+        Como _traduzir_pagina, mas também lê o byte do deslocamento ainda com
+        _trava_paginacao: depois de soltá-la, um despejo de outra thread
+        pode pôr outra página no quadro antes da leitura.
+
+        Returns:
+            Tupla (numero_quadro, falta_pagina, valor); numero_quadro e valor
+            são None se a página não existir (ou o processo tiver sido removido)
+        """
+        if self._trava_paginacao is not None:
+            with self._trava_paginacao:
+                if self.processos.get(processo.id) is not processo:
+                    return None, False, None
+                numero_quadro, falta_pagina = self._consultar_pagina(processo, numero_pagina)
+                if numero_quadro is None:
+                    return None, falta_pagina, None
+                return (numero_quadro, falta_pagina,
+                        self.memoria_fisica[(numero_quadro << self.bits_deslocamento) | deslocamento])
+
+        numero_quadro, falta_pagina = self._consultar_pagina(processo, numero_pagina)
+        if numero_quadro is None:
+            return None, falta_pagina, None
+        return (numero_quadro, falta_pagina,
+                self.memoria_fisica[(numero_quadro << self.bits_deslocamento) | deslocamento])
+
+    def _consultar_pagina(self, processo: Processo, numero_pagina: int) -> tuple:
+        """Corpo de _traduzir_pagina, executado já com as travas necessárias"""
+        numero_quadro = self.tlb.buscar(processo.id, numero_pagina) if self.tlb is not None else None
+        falta_pagina = False
+
+        if numero_quadro is None:
+            numero_quadro, falta_pagina = self._resolver_pagina(processo, numero_pagina)
+
+            if numero_quadro is None:
+                return None, False
+
+        if not falta_pagina and self.politica is not None and numero_quadro not in self.referencias_quadros:
+            processo.tabela_paginas.marcar_referenciada(numero_pagina)
+            self.politica.registrar_acesso((processo.id, numero_pagina))
+
+        return numero_quadro, falta_pagina
+
+    def _resolver_pagina(self, processo: Processo, numero_pagina: int) -> tuple:
+        """
+        Percorre a tabela de páginas, tratando faltas de página e a primeira
+        carga de páginas preguiçosas, e guarda a tradução na TLB.
+
+        Args:
+            processo: Processo dono da página
+            numero_pagina: Número da página lógica
+
+        Returns:
+            Tupla (numero_quadro, falta_pagina); numero_quadro é None se a
+            página não existir
+        """
+        tabela = processo.tabela_paginas
+        numero_quadro = tabela.obter_numero_quadro(numero_pagina)
+        falta_pagina = False
+
+        if numero_quadro is None:
+            # Página válida mas ausente: falta de página
+            if self.swap is None or numero_pagina >= processo.num_paginas:
+                return None, False
+            numero_quadro = self._tratar_falta_pagina(processo, numero_pagina)
+            falta_pagina = True
+        elif not tabela.esta_carregada(numero_pagina):
+            # Primeiro acesso a uma página preguiçosa: materializar e carregar
+            # (a página grande inteira, e só então marcá-la como carregada)
+            with processo.trava or _SEM_TRAVA:
+                if processo.trava is not None and self.processos.get(processo.id) is not processo:
+                    return None, False
+                if not tabela.esta_carregada(numero_pagina):
+                    inicio, paginas = tabela.extensao(numero_pagina)
+                    for num_pag in range(inicio, inicio + paginas):
+                        self._carregar_pagina(processo, num_pag, tabela.obter_numero_quadro(num_pag))
+                    for num_pag in range(inicio, inicio + paginas):
+                        tabela.marcar_carregada(num_pag)
+
+        if self.tlb is not None:
+            if self.paginas_grandes > 1 and tabela.extensao(numero_pagina)[1] > 1:
+                self.tlb.inserir_grande(processo.id, numero_pagina, numero_quadro)
+            else:
+                self.tlb.inserir(processo.id, numero_pagina, numero_quadro)
+
+        return numero_quadro, falta_pagina
+
+    def exibir_memoria(self) -> None:
+        """Exibe o estado atual da memória física"""
+        self.apresentador.memoria(self)
 
     def exibir_tabela_paginas(self, id_processo: int) -> None:
         """
@@ -211,40 +1585,100 @@ class GerenciadorMemoria:
         Args:
             id_processo: Identificador do processo
         """
-        if id_processo not in self.processos:
-            print(f"\n[ERRO] Processo {id_processo} não encontrado!")
-            return
-
-        processo = self.processos[id_processo]
-
-        print("\n" + "=" * 50)
-        print(f"        TABELA DE PÁGINAS - PROCESSO {id_processo}")
-        print("=" * 50)
-        print(f"Tamanho do processo: {processo.tamanho} bytes")
-        print(f"Número de páginas: {processo.num_paginas}")
-        print(processo.tabela_paginas.exibir())
-        print("=" * 50)
+        self.apresentador.tabela_paginas(self, id_processo)
 
     def listar_processos(self) -> None:
         """Lista todos os processos em execução"""
-        if not self.processos:
-            print("\n[AVISO] Nenhum processo em execução.")
-            return
+        self.apresentador.processos(self)
 
-        print("\n" + "=" * 50)
-        print("                PROCESSOS EM EXECUÇÃO")
-        print("=" * 50)
+    def verificar_consistencia(self) -> list:
+        """
+        Confere a posse dos quadros: cada quadro exclusivo tem exatamente um
+        dono, o dono em alocacao_quadros é o processo que o mapeia, cada
+        quadro compartilhado tem tantas referências quanto mapeamentos
+        (contando a referência do segmento compartilhado que o reservou) e
+        as contagens de quadros livres e ocupados fecham com o total.
 
-        for id_processo, processo in sorted(self.processos.items()):
-            print(f"\nProcesso ID: {id_processo}")
-            print(f"  Tamanho: {processo.tamanho} bytes")
-            print(f"  Páginas: {processo.num_paginas}")
+        No modo concorrente a verificação toma as travas e pode rodar com
+        outras threads ativas.
 
-            # Mostrar quadros alocados
-            quadros = [entrada.numero_quadro for entrada in processo.tabela_paginas.entradas]
-            print(f"  Quadros: {quadros}")
+        Returns:
+            Lista de inconsistências encontradas (vazia se tudo estiver correto)
+        """
+        with self._trava_paginacao or _SEM_TRAVA, self._trava_alocador:
+            problemas = []
+            ocupados = len(self.alocacao_quadros) + len(self.referencias_quadros)
+
+            if self.alocador.num_livres() + ocupados != self.total_quadros:
+                problemas.append(f"{self.alocador.num_livres()} quadros livres + "
+                                 f"{ocupados} ocupados != {self.total_quadros}")
+
+            for numero_quadro, id_processo in self.alocacao_quadros.items():
+                if self.alocador.esta_livre(numero_quadro):
+                    problemas.append(f"Quadro {numero_quadro} do processo {id_processo} está livre no alocador")
+                if numero_quadro in self.referencias_quadros:
+                    problemas.append(f"Quadro {numero_quadro} é exclusivo de {id_processo} e compartilhado")
+
+            for numero_quadro in self.referencias_quadros:
+                if self.alocador.esta_livre(numero_quadro):
+                    problemas.append(f"Quadro compartilhado {numero_quadro} está livre no alocador")
+
+            mapeados = {}
+            for id_processo, processo in self.processos.items():
+                for numero_quadro in processo.tabela_paginas.quadros_mapeados():
+                    mapeados.setdefault(numero_quadro, []).append(id_processo)
+            for nome, segmento in self.segmentos.items():
+                for numero_quadro in segmento.quadros:
+                    mapeados.setdefault(numero_quadro, []).append(f"segmento '{nome}'")
+
+            for numero_quadro, processos in mapeados.items():
+                referencias = self.referencias_quadros.get(numero_quadro)
+                if referencias is not None:
+                    if referencias != len(processos) and not self._ids_em_transicao:
+                        problemas.append(f"Quadro compartilhado {numero_quadro} tem {referencias} "
+                                         f"referências e {len(processos)} mapeamentos")
+                    continue
 
-        print("\n" + "=" * 50)
+                if len(processos) > 1:
+                    problemas.append(f"Quadro {numero_quadro} mapeado pelos processos "
+                                     f"{', '.join(map(str, processos))}")
+
+                dono = self.alocacao_quadros.get(numero_quadro)
+                if dono != processos[0]:
+                    problemas.append(f"Quadro {numero_quadro} mapeado pelo processo {processos[0]} "
+                                     f"pertence a {dono}")
+
+            for numero_quadro, id_processo in self.alocacao_quadros.items():
+                if numero_quadro not in mapeados and id_processo not in self._ids_em_transicao:
+                    problemas.append(f"Quadro {numero_quadro} do processo {id_processo} não está mapeado")
+
+            for numero_quadro in self.referencias_quadros:
+                if numero_quadro not in mapeados and not self._ids_em_transicao:
+                    problemas.append(f"Quadro compartilhado {numero_quadro} não está mapeado")
+
+            return problemas
+
+    def instrumentar(self, ativa: bool = True) -> Instrumentacao:
+        """
+        Liga ou desliga a instrumentação de criar_processo, remover_processo,
+        traduzir_endereco e traduzir_lote (contagens, histogramas de latência,
+        bytes copiados e passos de busca do alocador). Desligada, as chamadas
+        não pagam custo algum; as medições acumuladas são mantidas.
+
+        Args:
+            ativa: True para ligar, False para desligar
+
+        Returns:
+            A Instrumentacao do gerenciador (exportar_json, exportar_prometheus)
+        """
+        if self.instrumentacao is None:
+            self.instrumentacao = Instrumentacao(self)
+
+        if ativa:
+            self.instrumentacao.ligar()
+        else:
+            self.instrumentacao.desligar()
+        return self.instrumentacao
 
     def obter_estatisticas(self) -> dict:
         """
@@ -253,13 +1687,141 @@ class GerenciadorMemoria:
         Returns:
             Dicionário com estatísticas
         """
-        quadros_usados = self.total_quadros - len(self.quadros_livres)
+        with self._trava_paginacao or _SEM_TRAVA, self._trava_alocador:
+            return self._obter_estatisticas()
+
+    def _obter_estatisticas(self) -> dict:
+        quadros_livres = self.alocador.num_livres()
+        quadros_usados = self.total_quadros - quadros_livres
 
         return {
             'total_quadros': self.total_quadros,
-            'quadros_livres': len(self.quadros_livres),
+            'quadros_livres': quadros_livres,
             'quadros_usados': quadros_usados,
-            'percentual_livre': (len(self.quadros_livres) / self.total_quadros) * 100,
+            'percentual_livre': (quadros_livres / self.total_quadros) * 100,
             'percentual_usado': (quadros_usados / self.total_quadros) * 100,
-            'num_processos': len(self.processos)
+            'num_processos': len(self.processos),
+            'alocador': self.alocador.estatisticas(),
+            'fragmentacao': self.obter_fragmentacao(),
+            'faltas_pagina': sum(p.faltas_pagina for p in self.processos.values()),
+            'swap': self.swap.estatisticas() if self.swap is not None else None,
+            'substituicao': self.politica.estatisticas() if self.politica is not None else None,
+            'tlb': self.tlb.estatisticas() if self.tlb is not None else None,
+            'tabelas_paginas': self.obter_estatisticas_tabelas(),
+            'paginas_grandes': self.obter_estatisticas_paginas_grandes() if self.paginas_grandes > 1 else None,
+            'compartilhamento': self.obter_estatisticas_compartilhamento(),
+            'deduplicacao': self.deduplicador.estatisticas() if self.deduplicador is not None else None,
+            'bytes_copiados': self.bytes_copiados,
+            'instrumentacao': self.instrumentacao.exportar() if self.instrumentacao is not None else None,
+            'processos': {
+                id_processo: {
+                    'faltas_pagina': processo.faltas_pagina,
+                    'bytes_swap_entrada': processo.bytes_swap_entrada,
+                    'bytes_swap_saida': processo.bytes_swap_saida
+                }
+                for id_processo, processo in self.processos.items()
+            }
+        }
+
+    def obter_estatisticas_compartilhamento(self) -> dict:
+        """
+        Mede a memória economizada pelos quadros compartilhados (fork,
+        segmentos compartilhados e deduplicação).
+
+        Returns:
+            Dicionário com os quadros compartilhados, as páginas que os
+            mapeiam, os quadros e bytes economizados e as cópias na escrita
+        """
+        quadros_segmentos = {numero_quadro for segmento in self.segmentos.values()
+                             for numero_quadro in segmento.quadros}
+        mapeamentos = sum(self.referencias_quadros.values()) - len(quadros_segmentos)
+        # Um quadro mapeado por n páginas evita n - 1 cópias
+        economizados = sum(max(referencias - (numero_quadro in quadros_segmentos) - 1, 0)
+                           for numero_quadro, referencias in self.referencias_quadros.items())
+        return {
+            'forks': self.forks,
+            'segmentos': len(self.segmentos),
+            'quadros_segmentos': len(quadros_segmentos),
+            'quadros_compartilhados': len(self.referencias_quadros),
+            'paginas_compartilhadas': mapeamentos,
+            'quadros_economizados': economizados,
+            'bytes_economizados': economizados * self.tamanho_pagina,
+            'copias_na_escrita': self.copias_na_escrita,
+            'bytes_copiados_na_escrita': self.copias_na_escrita * self.tamanho_pagina
         }
+
+    def obter_estatisticas_tabelas(self) -> dict:
+        """
+        Mede o custo das tabelas de páginas em espaço e em tempo de percurso.
+
+        Returns:
+            Dicionário com o tipo de tabela, a memória do hospedeiro ocupada
+            por todas as tabelas e a profundidade média de percurso
+        """
+        tabelas = [processo.tabela_paginas for processo in self.processos.values()]
+        tamanho_bytes = sum(tabela.tamanho_bytes() for tabela in tabelas)
+
+        if self.tabela_invertida is not None:
+            tamanho_bytes += self.tabela_invertida.tamanho_bytes()
+            profundidade = self.tabela_invertida.profundidade_percurso()
+        else:
+            profundidade = (sum(tabela.profundidade_percurso() for tabela in tabelas) / len(tabelas)
+                            if tabelas else 0.0)
+
+        return {
+            'tipo': self.tipo_tabela,
+            'tamanho_bytes': tamanho_bytes,
+            'profundidade_percurso': profundidade
+        }
+
+    def obter_estatisticas_paginas_grandes(self) -> dict:
+        """
+        Mede o uso e a economia das páginas grandes.
+
+        Returns:
+            Dicionário com as páginas grandes promovidas na criação dos
+            processos, as que continuam mapeadas, as divididas (nos processos
+            existentes), as entradas e bytes de tabela economizados e o
+            alcance da TLB com e sem as entradas de páginas grandes
+        """
+        tabelas = [processo.tabela_paginas for processo in self.processos.values()]
+        mapeadas = sum(tabela.num_paginas_grandes() for tabela in tabelas)
+        estatisticas = {
+            'tamanho_pagina_grande': self.configuracao.tamanho_pagina_grande,
+            'paginas_por_pagina_grande': self.paginas_grandes,
+            'promovidas': self.paginas_grandes_promovidas,
+            'mapeadas': mapeadas,
+            'divididas': sum(tabela.divisoes for tabela in tabelas),
+            # Uma entrada no lugar de paginas_grandes entradas por página grande
+            'entradas_economizadas': mapeadas * (self.paginas_grandes - 1),
+            'bytes_tabela_economizados': sum(tabela.bytes_economizados_paginas_grandes() for tabela in tabelas)
+        }
+
+        if self.tlb is not None:
+            tlb = self.tlb.estatisticas()
+            estatisticas['acertos_tlb_grandes'] = tlb['acertos_grandes']
+            estatisticas['alcance_tlb_bytes'] = tlb['alcance_paginas'] * self.tamanho_pagina
+            estatisticas['alcance_tlb_sem_paginas_grandes_bytes'] = tlb['entradas_ocupadas'] * self.tamanho_pagina
+        return estatisticas
+
+    def obter_fragmentacao(self) -> dict:
+        """
+        Mede a fragmentação da memória física.
+
+        Returns:
+            Dicionário com a fragmentação externa do alocador e a média de
+            extensões físicas contíguas por processo (1.0 = tudo contíguo)
+        """
+        fragmentacao = self.alocador.estatisticas_fragmentacao()
+
+        total_extensoes = 0
+        for processo in self.processos.values():
+            quadros = processo.tabela_paginas.quadros_mapeados()
+            total_extensoes += bool(quadros) + sum(
+                1 for anterior, atual in zip(quadros, quadros[1:]) if atual != anterior + 1
+            )
+
+        fragmentacao['extensoes_por_processo'] = (
+            total_extensoes / len(self.processos) if self.processos else 0.0
+        )
+        return fragmentacao
@@ -0,0 +1,275 @@
+"""
+Instantâneos (snapshots) do estado completo de um GerenciadorMemoria.
+
+Um instantâneo guarda a memória física, a área de swap, o alocador de
+quadros, alocacao_quadros, os processos com suas tabelas de páginas, a
+política de substituição e a TLB. Restaurá-lo devolve a máquina aquecida
+sem reproduzir de novo o rastro que a levou até ali.
+
+Formato do arquivo (inteiros little-endian):
+
+    cabeçalho     assinatura b'INST', versão (uint16), flags (uint16) e
+                  (deslocamento, tamanho) de cada seção (3 x 2 x uint64),
+                  completado com zeros até ALINHAMENTO bytes
+    memória       imagem da memória física, gravada de uma vez
+    swap          conteúdo da área de swap (vazia sem swap)
+    estado        demais estruturas, serializadas com pickle
+
+A seção de memória começa em um múltiplo de mmap.ALLOCATIONGRANULARITY:
+sem compressão, carregar_instantaneo mapeia a imagem com mmap
+(ACCESS_COPY) em vez de lê-la. As páginas só são lidas do disco quando
+tocadas, e as escritas ficam na cópia privada, sem alterar o arquivo. Com
+compressão (zlib) as seções ficam menores, mas a memória precisa ser
+descomprimida na carga.
+
+O estado é desserializado com pickle: carregue apenas instantâneos de
+origem confiável.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import time
+import zlib
+from contextlib import contextmanager, nullcontext
+from configuracao import ConfiguracaoSistema
+from gerenciador_memoria import GerenciadorMemoria
+
+ASSINATURA = b'INST'
+VERSAO = 1
+COMPRIMIDO = 0x1  # flag: seções comprimidas com zlib
+
+CABECALHO = struct.Struct('<4sHH6Q')
+ALINHAMENTO = max(mmap.ALLOCATIONGRANULARITY, CABECALHO.size)
+TAMANHO_BLOCO = 1 << 24  # 16 MiB por leitura/compressão
+NIVEL_COMPRESSAO = 1  # a memória simulada é quase toda aleatória: níveis altos pouco ganham
+
+
+@contextmanager
+def _estado_estavel(gerenciador: GerenciadorMemoria):
+    """
+    Toma as travas do gerenciador em um momento sem processos sendo criados
+    ou removidos (no modo não concorrente, não faz nada).
+    """
+    while True:
+        with gerenciador._trava_paginacao or nullcontext():
+            with gerenciador._trava_alocador:
+                if not gerenciador._ids_em_transicao:
+                    yield
+                    return
+        time.sleep(0)
+
+
+def _gravar_secao(arquivo, blocos, comprimir: bool) -> tuple:
+    """
+    Grava uma seção a partir da posição atual do arquivo.
+
+    Returns:
+        Tupla (deslocamento, tamanho em bytes no arquivo)
+    """
+    deslocamento = arquivo.tell()
+    compressor = zlib.compressobj(NIVEL_COMPRESSAO) if comprimir else None
+
+    for bloco in blocos:
+        arquivo.write(compressor.compress(bloco) if compressor else bloco)
+    if compressor:
+        arquivo.write(compressor.flush())
+
+    return deslocamento, arquivo.tell() - deslocamento
+
+
+def _copiar_secao(descritor: int, deslocamento: int, tamanho: int, comprimida: bool,
+                  gravar, tamanho_esperado: int) -> None:
+    """
+    Lê uma seção em blocos e entrega os bytes (descomprimidos) a gravar.
+
+    Args:
+        descritor: Arquivo do instantâneo
+        deslocamento: Início da seção
+        tamanho: Tamanho da seção no arquivo
+        comprimida: Se a seção está comprimida
+        gravar: Função gravar(posicao, dados) do destino
+        tamanho_esperado: Bytes que a seção deve produzir
+
+    Raises:
+        ValueError: Se a seção estiver truncada ou corrompida
+    """
+    descompressor = zlib.decompressobj() if comprimida else None
+    posicao = 0
+
+    try:
+        for inicio in range(0, tamanho, TAMANHO_BLOCO):
+            dados = os.pread(descritor, min(TAMANHO_BLOCO, tamanho - inicio), deslocamento + inicio)
+            if descompressor is None:
+                pedacos = (dados,)
+            else:
+                pedacos = _descomprimir(descompressor, dados)
+
+            for pedaco in pedacos:
+                if posicao + len(pedaco) > tamanho_esperado:
+                    raise ValueError("Instantaneo corrompido: secao maior que o esperado")
+                gravar(posicao, pedaco)
+                posicao += len(pedaco)
+    except zlib.error as erro:
+        raise ValueError(f"Instantaneo corrompido: {erro}") from None
+
+    if posicao != tamanho_esperado:
+        raise ValueError("Instantaneo corrompido: secao truncada")
+
+
+def _descomprimir(descompressor, dados: bytes):
+    """Descomprime limitando cada pedaço a TAMANHO_BLOCO (páginas zeradas comprimem muito)"""
+    while dados:
+        yield descompressor.decompress(dados, TAMANHO_BLOCO)
+        dados = descompressor.unconsumed_tail
+    yield descompressor.flush()
+
+
+def salvar_instantaneo(gerenciador: GerenciadorMemoria, caminho: str, comprimir: bool = False) -> dict:
+    """
+    Grava o estado completo do gerenciador em um arquivo.
+
+    No modo concorrente, as travas do gerenciador são mantidas durante a
+    gravação: as demais threads esperam até o instantâneo terminar.
+
+    Args:
+        gerenciador: Gerenciador de memória
+        caminho: Arquivo de destino (sobrescrito)
+        comprimir: Se True, comprime as seções com zlib (a memória deixa de
+            poder ser mapeada na carga)
+
+    Returns:
+        Dicionário com os bytes de cada seção, o tamanho do arquivo e o tempo
+    """
+    inicio = time.perf_counter()
+
+    with _estado_estavel(gerenciador):
+        estado = pickle.dumps(gerenciador._exportar_estado(), protocol=pickle.HIGHEST_PROTOCOL)
+        memoria = gerenciador._visao_memoria
+        swap = gerenciador.swap
+
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(bytes(ALINHAMENTO))
+
+            if comprimir:
+                blocos_memoria = (memoria[posicao:posicao + TAMANHO_BLOCO]
+                                  for posicao in range(0, len(memoria), TAMANHO_BLOCO))
+            else:
+                blocos_memoria = (memoria,)
+            secao_memoria = _gravar_secao(arquivo, blocos_memoria, comprimir)
+
+            blocos_swap = ()
+            if swap is not None:
+                tamanho_swap = swap.total_posicoes * swap.tamanho_pagina
+                blocos_swap = (swap.ler_bloco(posicao, min(TAMANHO_BLOCO, tamanho_swap - posicao))
+                               for posicao in range(0, tamanho_swap, TAMANHO_BLOCO))
+            secao_swap = _gravar_secao(arquivo, blocos_swap, comprimir)
+
+            secao_estado = _gravar_secao(arquivo, (estado,), comprimir)
+            tamanho_arquivo = arquivo.tell()
+
+            arquivo.seek(0)
+            arquivo.write(CABECALHO.pack(ASSINATURA, VERSAO, COMPRIMIDO if comprimir else 0,
+                                         *secao_memoria, *secao_swap, *secao_estado))
+
+    return {
+        'bytes_memoria': secao_memoria[1],
+        'bytes_swap': secao_swap[1],
+        'bytes_estado': secao_estado[1],
+        'tamanho_arquivo': tamanho_arquivo,
+        'comprimido': comprimir,
+        'segundos': time.perf_counter() - inicio
+    }
+
+
+def carregar_instantaneo(caminho: str, arquivo_memoria: str = None, arquivo_swap: str = None,
+                         silencioso: bool = False, apresentador=None,
+                         concorrente: bool = False) -> GerenciadorMemoria:
+    """
+    Recria um gerenciador a partir de um instantâneo.
+
+    Sem compressão e sem arquivo_memoria, a memória física é o próprio
+    arquivo mapeado com ACCESS_COPY: a carga não lê a imagem, e as páginas
+    alteradas ficam em uma cópia privada do processo.
+
+    Args:
+        caminho: Arquivo gravado por salvar_instantaneo
+        arquivo_memoria: Se informado, a imagem é copiada para esse arquivo,
+            que passa a ser a memória física (como em GerenciadorMemoria)
+        arquivo_swap: Arquivo para a área de swap (padrão: bytearray)
+        silencioso: Modo silencioso do gerenciador restaurado
+        apresentador: Apresentador do gerenciador restaurado
+        concorrente: Modo concorrente do gerenciador restaurado
+
+    Returns:
+        GerenciadorMemoria no mesmo estado do momento da gravação
+
+    Raises:
+        ValueError: Se o arquivo não for um instantâneo válido
+    """
+    descritor = os.open(caminho, os.O_RDONLY)
+    descritor_adotado = False
+    gerenciador = None
+
+    try:
+        cabecalho = os.pread(descritor, CABECALHO.size, 0)
+        if len(cabecalho) < CABECALHO.size:
+            raise ValueError(f"{caminho}: arquivo muito curto para um instantaneo")
+
+        (assinatura, versao, flags, deslocamento_memoria, tamanho_memoria, deslocamento_swap,
+         tamanho_swap, deslocamento_estado, tamanho_estado) = CABECALHO.unpack(cabecalho)
+        if assinatura != ASSINATURA:
+            raise ValueError(f"{caminho}: nao e um instantaneo do gerenciador de memoria")
+        if versao != VERSAO:
+            raise ValueError(f"{caminho}: versao de instantaneo nao suportada: {versao}")
+        comprimido = bool(flags & COMPRIMIDO)
+
+        dados_estado = os.pread(descritor, tamanho_estado, deslocamento_estado)
+        try:
+            estado = pickle.loads(zlib.decompress(dados_estado) if comprimido else dados_estado)
+        except (zlib.error, pickle.UnpicklingError, EOFError) as erro:
+            raise ValueError(f"{caminho}: estado corrompido: {erro}") from None
+
+        configuracao = ConfiguracaoSistema(*estado['configuracao'])
+        swap = estado['swap']
+        gerenciador = GerenciadorMemoria(
+            configuracao, arquivo_memoria=arquivo_memoria, alocador=estado['alocador'],
+            memoria_preguicosa=estado['memoria_preguicosa'],
+            tamanho_swap=swap['tamanho'] if swap else 0, arquivo_swap=arquivo_swap,
+            politica_substituicao=estado['politica'] or 'fifo', tlb=estado['tlb'],
+            tipo_tabela=estado['tipo_tabela'], niveis_tabela=estado['niveis_tabela'],
+            silencioso=silencioso, apresentador=apresentador, concorrente=concorrente
+        )
+        gerenciador._importar_estado(estado)
+
+        if swap:
+            _copiar_secao(descritor, deslocamento_swap, tamanho_swap, comprimido,
+                          gerenciador.swap.gravar_bloco, swap['tamanho'])
+
+        if comprimido or arquivo_memoria is not None:
+            visao = gerenciador._visao_memoria
+
+            def gravar(posicao, dados):
+                visao[posicao:posicao + len(dados)] = dados
+
+            _copiar_secao(descritor, deslocamento_memoria, tamanho_memoria, comprimido,
+                          gravar, configuracao.tamanho_memoria_fisica)
+        else:
+            if tamanho_memoria != configuracao.tamanho_memoria_fisica:
+                raise ValueError(f"{caminho}: imagem da memoria com tamanho inesperado")
+            memoria = mmap.mmap(descritor, tamanho_memoria, access=mmap.ACCESS_COPY,
+                                offset=deslocamento_memoria)
+            gerenciador._adotar_memoria(memoria, descritor)
+            descritor_adotado = True
+
+    except BaseException:
+        if gerenciador is not None:
+            gerenciador.fechar()
+        raise
+
+    finally:
+        if not descritor_adotado:
+            os.close(descritor)
+
+    return gerenciador
@@ -0,0 +1,396 @@
+"""
+Instrumentação por operação do gerenciador de memória: contagens,
+histogramas de latência no estilo HDR, bytes copiados para a memória física
+e passos de busca do alocador, exportáveis em JSON ou no formato de texto
+do Prometheus.
+
+A instrumentação liga e desliga em tempo de execução. Ligada, ela substitui
+os métodos públicos medidos por versões envolvidas no próprio objeto do
+gerenciador (atributos de instância escondem os da classe); desligada, os
+atributos são apagados e as chamadas voltam a ir direto aos métodos da
+classe, sem custo algum.
+"""
+
+import functools
+import json
+import math
+import threading
+import time
+from contextlib import nullcontext
+
+# Métodos públicos do gerenciador medidos pela instrumentação
+OPERACOES = ('criar_processo', 'remover_processo', 'traduzir_endereco', 'traduzir_lote')
+
+# Quantis exportados (fração, rótulo)
+QUANTIS = ((0.5, 'p50'), (0.9, 'p90'), (0.99, 'p99'), (0.999, 'p999'))
+
+PREFIXO_METRICAS = 'gerenciador_memoria'
+
+_SEM_TRAVA = nullcontext()
+
+
+class Histograma:
+    """
+    Histograma log-linear no estilo HDR para inteiros não negativos.
+
+    Valores menores que 2 ** (bits_precisao + 1) têm um balde cada (exatos);
+    acima disso, cada potência de 2 é dividida em 2 ** bits_precisao baldes
+    iguais, então o erro relativo de qualquer valor registrado fica abaixo
+    de 1 / 2 ** bits_precisao. O vetor de contagens cresce sob demanda até
+    o balde do maior valor visto.
+    """
+
+    def __init__(self, bits_precisao: int = 7):
+        """
+        Inicializa o histograma vazio.
+
+        Args:
+            bits_precisao: Bits de mantissa por potência de 2 (7 = erro < 0,8%)
+
+        Raises:
+            ValueError: Se bits_precisao não for positivo
+        """
+        if bits_precisao <= 0:
+            raise ValueError("Bits de precisao do histograma devem ser positivos")
+
+        self.bits_precisao = bits_precisao
+        self.sub_baldes = 1 << bits_precisao
+        self.contagens = [0] * (2 * self.sub_baldes)  # a faixa exata; o resto cresce sob demanda
+        self.total = 0
+        self.soma = 0
+        self.minimo = None
+        self.maximo = 0
+
+    def _indice(self, valor: int) -> int:
+        deslocamento = valor.bit_length() - self.bits_precisao - 1
+        if deslocamento <= 0:
+            return valor
+        return (deslocamento << self.bits_precisao) + (valor >> deslocamento)
+
+    def _limites(self, indice: int) -> tuple:
+        """Menor e maior valor que caem no balde indice"""
+        if indice < 2 * self.sub_baldes:
+            return indice, indice
+        deslocamento = (indice >> self.bits_precisao) - 1
+        inferior = (indice - (deslocamento << self.bits_precisao)) << deslocamento
+        return inferior, inferior + (1 << deslocamento) - 1
+
+    def registrar(self, valor: int) -> None:
+        """
+        Registra um valor.
+
+        Args:
+            valor: Inteiro não negativo (negativos contam como 0)
+        """
+        if valor < 0:
+            valor = 0
+
+        # _indice expandido: registrar roda a cada chamada medida
+        bits = self.bits_precisao
+        deslocamento = valor.bit_length() - bits - 1
+        indice = valor if deslocamento <= 0 else (deslocamento << bits) + (valor >> deslocamento)
+        try:
+            self.contagens[indice] += 1
+        except IndexError:
+            self.contagens.extend([0] * (indice + 1 - len(self.contagens)))
+            self.contagens[indice] += 1
+
+        self.total += 1
+        self.soma += valor
+        if valor > self.maximo:
+            self.maximo = valor
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+
+    def percentil(self, fracao: float) -> int:
+        """
+        Estima o valor abaixo do qual está a fração pedida dos registros.
+
+        Args:
+            fracao: Entre 0 e 1 (0.99 = p99)
+
+        Returns:
+            Maior valor equivalente do balde do quantil (limitado ao máximo
+            registrado), ou 0 se o histograma estiver vazio
+        """
+        if not self.total:
+            return 0
+
+        alvo = max(1, math.ceil(self.total * fracao))
+        acumulado = 0
+        for indice, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return max(min(self._limites(indice)[1], self.maximo), self.minimo)
+        return self.maximo
+
+    def media(self) -> float:
+        """Média dos valores registrados (0.0 se vazio)"""
+        return self.soma / self.total if self.total else 0.0
+
+    def baldes(self) -> list:
+        """
+        Lista os baldes não vazios.
+
+        Returns:
+            Lista de pares (maior_valor_do_balde, contagem) em ordem crescente
+        """
+        return [(self._limites(indice)[1], contagem)
+                for indice, contagem in enumerate(self.contagens) if contagem]
+
+    def mesclar(self, outro: 'Histograma') -> None:
+        """
+        Soma outro histograma (de mesma precisão) a este.
+
+        Raises:
+            ValueError: Se as precisões forem diferentes
+        """
+        if outro.bits_precisao != self.bits_precisao:
+            raise ValueError("Histogramas com precisoes diferentes")
+
+        if len(outro.contagens) > len(self.contagens):
+            self.contagens.extend([0] * (len(outro.contagens) - len(self.contagens)))
+        for indice, contagem in enumerate(outro.contagens):
+            self.contagens[indice] += contagem
+
+        self.total += outro.total
+        self.soma += outro.soma
+        self.maximo = max(self.maximo, outro.maximo)
+        if outro.minimo is not None and (self.minimo is None or outro.minimo < self.minimo):
+            self.minimo = outro.minimo
+
+    def resumo(self) -> dict:
+        """
+        Resume o histograma.
+
+        Returns:
+            Dicionário com total, soma, mínimo, máximo, média, os quantis
+            de QUANTIS e os baldes não vazios
+        """
+        resumo = {
+            'total': self.total,
+            'soma': self.soma,
+            'minimo': self.minimo if self.minimo is not None else 0,
+            'maximo': self.maximo,
+            'media': self.media()
+        }
+        for fracao, rotulo in QUANTIS:
+            resumo[rotulo] = self.percentil(fracao)
+        resumo['baldes'] = self.baldes()
+        return resumo
+
+    def __repr__(self):
+        return f"Histograma(total={self.total}, bits_precisao={self.bits_precisao})"
+
+
+class MedicoesOperacao:
+    """Contadores e histogramas de uma operação medida"""
+
+    def __init__(self, bits_precisao: int):
+        self.bits_precisao = bits_precisao
+        self.zerar()
+
+    def zerar(self) -> None:
+        self.contagem = 0
+        self.erros = 0
+        self.bytes_copiados = 0
+        self.latencia_ns = Histograma(self.bits_precisao)
+        self.passos_busca = Histograma(self.bits_precisao)
+
+    def registrar(self, latencia_ns: int, passos_busca: int, bytes_copiados: int, erro: bool) -> None:
+        self.contagem += 1
+        self.erros += erro
+        self.bytes_copiados += bytes_copiados
+        self.latencia_ns.registrar(latencia_ns)
+        if passos_busca:
+            self.passos_busca.registrar(passos_busca)
+        else:
+            # A maioria das traduções não toca no alocador: atalho para o balde 0
+            passos = self.passos_busca
+            passos.contagens[0] += 1
+            passos.total += 1
+            passos.minimo = 0
+
+
+class Instrumentacao:
+    """
+    Mede as operações públicas de um gerenciador de memória.
+
+    Cada chamada medida registra a latência (time.perf_counter_ns), se falhou
+    (exceção no modo silencioso; False ou None fora dele), os passos de busca
+    do alocador e os bytes copiados para memoria_fisica durante a chamada
+    (diferenças de alocador.passos_busca e gerenciador.bytes_copiados).
+
+    No modo concorrente os registros são serializados por uma trava própria.
+    As diferenças são medidas nos contadores globais, então passos e bytes de
+    operações simultâneas entram também na conta das outras; o total global
+    (bytes_copiados_memoria) continua exato.
+    """
+
+    def __init__(self, gerenciador, bits_precisao: int = 7):
+        """
+        Cria a instrumentação desligada.
+
+        Args:
+            gerenciador: GerenciadorMemoria a medir
+            bits_precisao: Precisão dos histogramas (ver Histograma)
+        """
+        self.gerenciador = gerenciador
+        self.bits_precisao = bits_precisao
+        self.ativa = False
+        self.operacoes = {nome: MedicoesOperacao(bits_precisao) for nome in OPERACOES}
+        self._trava = threading.Lock() if gerenciador.concorrente else None
+        self._ligada_em = None
+        self.segundos_ativa = 0.0
+
+    def ligar(self) -> None:
+        """Passa a medir as operações (não faz nada se já estiver ligada)"""
+        if self.ativa:
+            return
+
+        for nome in OPERACOES:
+            metodo = getattr(type(self.gerenciador), nome).__get__(self.gerenciador)
+            setattr(self.gerenciador, nome, self._envolver(metodo, self.operacoes[nome]))
+        self.ativa = True
+        self._ligada_em = time.perf_counter()
+
+    def desligar(self) -> None:
+        """Para de medir e devolve os métodos originais (os dados são mantidos)"""
+        if not self.ativa:
+            return
+
+        for nome in OPERACOES:
+            self.gerenciador.__dict__.pop(nome, None)
+        self.ativa = False
+        self.segundos_ativa += time.perf_counter() - self._ligada_em
+        self._ligada_em = None
+
+    def zerar(self) -> None:
+        """Descarta as medições acumuladas"""
+        with self._trava or _SEM_TRAVA:
+            for medicoes in self.operacoes.values():
+                medicoes.zerar()
+            self.segundos_ativa = 0.0
+            if self.ativa:
+                self._ligada_em = time.perf_counter()
+
+    def _envolver(self, metodo, medicoes: MedicoesOperacao):
+        """Cria a versão medida de um método do gerenciador"""
+        gerenciador = self.gerenciador
+        alocador = gerenciador.alocador
+        trava = self._trava
+        relogio = time.perf_counter_ns
+
+        @functools.wraps(metodo)
+        def medido(*argumentos, **opcoes):
+            passos = alocador.passos_busca
+            copiados = gerenciador.bytes_copiados
+            erro = True
+            inicio = relogio()
+            try:
+                resultado = metodo(*argumentos, **opcoes)
+                erro = resultado is None or resultado is False
+                return resultado
+            finally:
+                latencia = relogio() - inicio
+                if trava is None:
+                    medicoes.registrar(latencia, alocador.passos_busca - passos,
+                                       gerenciador.bytes_copiados - copiados, erro)
+                else:
+                    with trava:
+                        medicoes.registrar(latencia, alocador.passos_busca - passos,
+                                           gerenciador.bytes_copiados - copiados, erro)
+
+        return medido
+
+    def exportar(self) -> dict:
+        """
+        Reúne as medições.
+
+        Returns:
+            Dicionário com o estado, o tempo ligada, os bytes copiados para a
+            memória física desde a criação do gerenciador e, por operação,
+            contagem, erros, bytes copiados e os resumos dos histogramas de
+            latência (ns) e de passos de busca do alocador
+        """
+        with self._trava or _SEM_TRAVA:
+            segundos = self.segundos_ativa
+            if self.ativa:
+                segundos += time.perf_counter() - self._ligada_em
+
+            return {
+                'ativa': self.ativa,
+                'segundos_ativa': segundos,
+                'bytes_copiados_memoria': self.gerenciador.bytes_copiados,
+                'operacoes': {
+                    nome: {
+                        'contagem': medicoes.contagem,
+                        'erros': medicoes.erros,
+                        'bytes_copiados': medicoes.bytes_copiados,
+                        'latencia_ns': medicoes.latencia_ns.resumo(),
+                        'passos_busca': medicoes.passos_busca.resumo()
+                    }
+                    for nome, medicoes in self.operacoes.items()
+                }
+            }
+
+    def exportar_json(self, indentacao: int = 2) -> str:
+        """Medições de exportar() como texto JSON"""
+        return json.dumps(self.exportar(), indent=indentacao)
+
+    def exportar_prometheus(self) -> str:
+        """
+        Formata as medições no formato de texto de exposição do Prometheus.
+
+        Contagens, erros e bytes viram counters; latência (em segundos) e
+        passos de busca viram summaries com os quantis de QUANTIS.
+
+        Returns:
+            Texto pronto para servir em /metrics ou gravar para o
+            node_exporter (textfile collector)
+        """
+        dados = self.exportar()
+        operacoes = dados['operacoes']
+        linhas = []
+
+        def metrica(nome, tipo, ajuda, amostras):
+            linhas.append(f"# HELP {PREFIXO_METRICAS}_{nome} {ajuda}")
+            linhas.append(f"# TYPE {PREFIXO_METRICAS}_{nome} {tipo}")
+            for sufixo, rotulos, valor in amostras:
+                texto_rotulos = ','.join(f'{chave}="{valor_rotulo}"' for chave, valor_rotulo in rotulos)
+                linhas.append(f"{PREFIXO_METRICAS}_{nome}{sufixo}{{{texto_rotulos}}} {valor!r}"
+                              if rotulos else f"{PREFIXO_METRICAS}_{nome}{sufixo} {valor!r}")
+
+        def resumo(chave, converter):
+            amostras = []
+            for nome, valores in operacoes.items():
+                histograma = valores[chave]
+                for fracao, rotulo in QUANTIS:
+                    amostras.append(('', (('operacao', nome), ('quantile', str(fracao))),
+                                     converter(histograma[rotulo])))
+                amostras.append(('_sum', (('operacao', nome),), converter(histograma['soma'])))
+                amostras.append(('_count', (('operacao', nome),), histograma['total']))
+            return amostras
+
+        metrica('operacoes_total', 'counter', "Chamadas das operacoes medidas.",
+                [('', (('operacao', nome),), valores['contagem']) for nome, valores in operacoes.items()])
+        metrica('erros_total', 'counter', "Chamadas que falharam.",
+                [('', (('operacao', nome),), valores['erros']) for nome, valores in operacoes.items()])
+        metrica('latencia_segundos', 'summary', "Latencia das operacoes medidas.",
+                resumo('latencia_ns', lambda nanossegundos: nanossegundos / 1e9))
+        metrica('passos_busca_alocador', 'summary', "Passos de busca do alocador por chamada.",
+                resumo('passos_busca', int))
+        metrica('bytes_copiados_total', 'counter', "Bytes copiados para a memoria fisica durante as chamadas.",
+                [('', (('operacao', nome),), valores['bytes_copiados']) for nome, valores in operacoes.items()])
+        metrica('bytes_copiados_memoria_total', 'counter',
+                "Bytes copiados para a memoria fisica desde a criacao do gerenciador.",
+                [('', (), dados['bytes_copiados_memoria'])])
+        metrica('instrumentacao_ativa', 'gauge', "1 se a instrumentacao esta ligada.",
+                [('', (), int(dados['ativa']))])
+
+        return '\n'.join(linhas) + '\n'
+
+    def __repr__(self):
+        estado = 'ligada' if self.ativa else 'desligada'
+        return f"Instrumentacao({estado}, chamadas={sum(m.contagem for m in self.operacoes.values())})"
+
@@ -4,14 +4,291 @@ Ponto de entrada principal do simulador de gerenciamento de memória.
 Para executar:
     python main.py
 
+Sem argumentos o simulador abre o menu interativo. Com --mem e --page ele
+roda sem interação sobre um script de comandos ou um rastro e termina
+escrevendo um resumo em JSON:
+
+    python main.py --mem 1048576 --page 4096 --max-proc 65536 --script comandos.txt
+    python main.py --mem 1048576 --page 4096 --rastro carga.bin --salvar aquecida.inst
+    python main.py --restaurar aquecida.inst --script comandos.txt
+    python main.py --mem 1048576 --page 4096 --rastro carga.bin --metricas metricas.prom
+
+O script tem um comando por linha ('#' inicia comentário):
+
+    criar <id_processo> <tamanho>      (ou C)
+    remover <id_processo>              (ou R)
+    traduzir <id_processo> <endereco>  (ou A)
+    fork <id_pai> <id_filho>           (ou F)
+    escrever <id_processo> <endereco> <valor>  (ou W)
+
 Você pode modificar as configurações no arquivo configuracao.py
 """
 
+import argparse
+import json
+import sys
+import time
+from configuracao import ConfiguracaoSistema
+from erros import ErroGerenciadorMemoria
+from gerenciador_memoria import GerenciadorMemoria
+from instantaneo import carregar_instantaneo, salvar_instantaneo
+from rastro import CRIAR, REMOVER, ACESSAR, ler_rastro, reproduzir_rastro
 from simulador import Simulador
 
+# Comandos só de script (os rastros não têm fork nem escrita)
+FORK = 'F'
+ESCREVER = 'W'
+
+COMANDOS_SCRIPT = {
+    'criar': CRIAR, 'c': CRIAR,
+    'remover': REMOVER, 'r': REMOVER,
+    'traduzir': ACESSAR, 'a': ACESSAR,
+    'fork': FORK, 'f': FORK,
+    'escrever': ESCREVER, 'w': ESCREVER
+}
+
+NUM_ARGUMENTOS = {CRIAR: 2, REMOVER: 1, ACESSAR: 2, FORK: 2, ESCREVER: 3}
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Define os argumentos aceitos pelo modo não interativo"""
+    parser = argparse.ArgumentParser(
+        description="Simulador de gerenciamento de memoria com paginacao. "
+                    "Sem argumentos, abre o menu interativo."
+    )
+    parser.add_argument('--mem', type=int, help="Tamanho da memoria fisica em bytes (potencia de 2)")
+    parser.add_argument('--page', type=int, help="Tamanho da pagina em bytes (potencia de 2)")
+    parser.add_argument('--max-proc', type=int, help="Tamanho maximo de um processo (padrao: --mem)")
+    parser.add_argument('--pagina-grande', type=int, default=0,
+                        help="Tamanho da pagina grande em bytes (multiplo potencia de 2 de --page; 0 = desligado)")
+
+    entrada = parser.add_mutually_exclusive_group()
+    entrada.add_argument('--script', help="Arquivo de comandos ('-' = entrada padrao)")
+    entrada.add_argument('--rastro', help="Arquivo de rastro (texto, CSV ou binario)")
+
+    parser.add_argument('--formato', help="Formato do rastro (padrao: deduzido)")
+    parser.add_argument('--alocador', default='bitmap', help="Alocador de quadros livres")
+    parser.add_argument('--swap', type=int, default=0, help="Tamanho da area de swap em bytes")
+    parser.add_argument('--politica', default='fifo', help="Politica de substituicao")
+    parser.add_argument('--tlb', type=int, default=None, help="Entradas da TLB")
+    parser.add_argument('--tabela', default='lista', help="Tipo de tabela de paginas")
+    parser.add_argument('--saida', help="Arquivo para o resumo JSON (padrao: saida padrao)")
+    parser.add_argument('--restaurar', help="Comeca do estado de um instantaneo (dispensa --mem e --page)")
+    parser.add_argument('--salvar', help="Grava um instantaneo do estado ao final")
+    parser.add_argument('--comprimir', action='store_true', help="Comprime o instantaneo gravado com --salvar")
+    parser.add_argument('--instrumentar', action='store_true',
+                        help="Mede latencias, bytes copiados e passos do alocador por operacao")
+    parser.add_argument('--metricas', help="Grava as medicoes no formato de texto do Prometheus (implica --instrumentar)")
+    return parser
+
+
+def _ler_comandos(arquivo):
+    """
+    Lê os comandos de um script.
+
+    Uma linha malformada não interrompe a leitura: ela é entregue com
+    operacao None e o ValueError no lugar dos argumentos.
+
+    Yields:
+        Tuplas (numero_linha, operacao, argumentos)
+    """
+    for numero_linha, linha in enumerate(arquivo, 1):
+        campos = linha.split('#', 1)[0].split()
+        if not campos:
+            continue
+
+        operacao = COMANDOS_SCRIPT.get(campos[0].lower())
+        if operacao is None:
+            yield numero_linha, None, ValueError(f"Comando desconhecido na linha {numero_linha}: {campos[0]}")
+            continue
+
+        try:
+            argumentos = [int(campo, 0) for campo in campos[1:]]
+        except ValueError:
+            yield numero_linha, None, ValueError(f"Numero invalido na linha {numero_linha}: {linha.strip()}")
+            continue
+
+        if len(argumentos) != NUM_ARGUMENTOS[operacao]:
+            yield numero_linha, None, ValueError(
+                f"Numero de argumentos invalido na linha {numero_linha}: {linha.strip()}"
+            )
+            continue
+
+        yield numero_linha, operacao, argumentos
+
+
+def executar_script(gerenciador: GerenciadorMemoria, arquivo, tamanho_maximo_processo: int) -> dict:
+    """
+    Executa um script de comandos em um gerenciador silencioso.
+
+    Args:
+        gerenciador: Gerenciador de memória no modo silencioso
+        arquivo: Arquivo de texto aberto com os comandos
+        tamanho_maximo_processo: Limite passado a criar_processo
 
-def main():
+    Returns:
+        Dicionário com contadores, o resultado de cada comando e os erros
+        (de execução e de linhas malformadas, contadas em linhas_invalidas)
+    """
+    resultados = []
+    erros = []
+    linhas_invalidas = 0
+    inicio = time.perf_counter()
+
+    for numero_linha, operacao, argumentos in _ler_comandos(arquivo):
+        if operacao is None:
+            linhas_invalidas += 1
+            erros.append({'linha': numero_linha, 'erro': type(argumentos).__name__, 'mensagem': str(argumentos)})
+            continue
+
+        try:
+            if operacao == CRIAR:
+                resultado = gerenciador.criar_processo(*argumentos, tamanho_maximo_processo)
+                resultados.append({'linha': numero_linha, 'comando': 'criar',
+                                   'id_processo': resultado.id_processo,
+                                   'paginas_alocadas': resultado.paginas_alocadas,
+                                   'paginas_sob_demanda': resultado.paginas_sob_demanda})
+            elif operacao == REMOVER:
+                resultado = gerenciador.remover_processo(*argumentos)
+                resultados.append({'linha': numero_linha, 'comando': 'remover',
+                                   'id_processo': resultado.id_processo,
+                                   'quadros_liberados': resultado.quadros_liberados})
+            elif operacao == FORK:
+                resultado = gerenciador.fork_processo(*argumentos)
+                resultados.append({'linha': numero_linha, 'comando': 'fork',
+                                   'id_pai': resultado.id_pai, 'id_filho': resultado.id_filho,
+                                   'quadros_compartilhados': resultado.quadros_compartilhados,
+                                   'paginas_swap_copiadas': resultado.paginas_swap_copiadas})
+            elif operacao == ESCREVER:
+                resultado = gerenciador.escrever_endereco(*argumentos)
+                resultados.append({'linha': numero_linha, 'comando': 'escrever',
+                                   'id_processo': argumentos[0],
+                                   'endereco_logico': resultado.endereco_logico,
+                                   'numero_quadro': resultado.numero_quadro,
+                                   'endereco_fisico': resultado.endereco_fisico,
+                                   'valor': resultado.valor,
+                                   'falta_pagina': resultado.falta_pagina,
+                                   'copia_na_escrita': resultado.copia_na_escrita})
+            else:
+                resultado = gerenciador.traduzir_endereco(*argumentos)
+                resultados.append({'linha': numero_linha, 'comando': 'traduzir',
+                                   'id_processo': argumentos[0],
+                                   'endereco_logico': resultado.endereco_logico,
+                                   'numero_pagina': resultado.numero_pagina,
+                                   'numero_quadro': resultado.numero_quadro,
+                                   'endereco_fisico': resultado.endereco_fisico,
+                                   'valor': resultado.valor,
+                                   'falta_pagina': resultado.falta_pagina})
+        except (ErroGerenciadorMemoria, ValueError) as erro:
+            erros.append({'linha': numero_linha, 'erro': type(erro).__name__, 'mensagem': str(erro)})
+
+    segundos = time.perf_counter() - inicio
+    comandos = len(resultados) + len(erros)
+
+    return {
+        'comandos': comandos,
+        'falhas': len(erros),
+        'linhas_invalidas': linhas_invalidas,
+        'segundos': segundos,
+        'comandos_por_segundo': comandos / segundos if segundos else 0.0,
+        'resultados': resultados,
+        'erros': erros
+    }
+
+
+def executar_lote(argumentos) -> int:
+    """
+    Roda o simulador sem interação e escreve o resumo JSON.
+
+    Returns:
+        Código de saída do programa
+    """
+    try:
+        if argumentos.restaurar:
+            gerenciador = carregar_instantaneo(argumentos.restaurar, silencioso=True)
+        else:
+            configuracao = ConfiguracaoSistema(argumentos.mem, argumentos.page,
+                                               argumentos.max_proc if argumentos.max_proc is not None
+                                               else argumentos.mem, argumentos.pagina_grande)
+            gerenciador = GerenciadorMemoria(configuracao, alocador=argumentos.alocador,
+                                             tamanho_swap=argumentos.swap,
+                                             politica_substituicao=argumentos.politica,
+                                             tlb=argumentos.tlb, tipo_tabela=argumentos.tabela,
+                                             silencioso=True)
+    except (OSError, ValueError) as erro:
+        print(json.dumps({'erro': str(erro)}), file=sys.stderr)
+        return 2
+
+    configuracao = gerenciador.configuracao
+    tamanho_maximo_processo = configuracao.tamanho_maximo_processo
+    if argumentos.instrumentar or argumentos.metricas:
+        gerenciador.instrumentar()
+
+    with gerenciador:
+        try:
+            if argumentos.rastro:
+                execucao = reproduzir_rastro(gerenciador, ler_rastro(argumentos.rastro, argumentos.formato),
+                                             tamanho_maximo_processo)
+            elif argumentos.script == '-':
+                execucao = executar_script(gerenciador, sys.stdin, tamanho_maximo_processo)
+            else:
+                with open(argumentos.script, 'r', encoding='utf-8') as arquivo:
+                    execucao = executar_script(gerenciador, arquivo, tamanho_maximo_processo)
+        except (OSError, ValueError) as erro:
+            print(json.dumps({'erro': str(erro)}), file=sys.stderr)
+            return 1
+
+        swap = gerenciador.swap
+        resumo = {
+            'configuracao': {
+                'tamanho_memoria_fisica': configuracao.tamanho_memoria_fisica,
+                'tamanho_pagina': configuracao.tamanho_pagina,
+                'tamanho_maximo_processo': tamanho_maximo_processo,
+                'alocador': gerenciador.alocador.nome,
+                'tamanho_swap': swap.total_posicoes * swap.tamanho_pagina if swap is not None else 0,
+                'politica_substituicao': gerenciador.politica.nome if gerenciador.politica is not None else None,
+                'tlb': gerenciador.tlb.num_entradas if gerenciador.tlb is not None else None,
+                'tipo_tabela': gerenciador.tipo_tabela,
+                'instantaneo_restaurado': argumentos.restaurar
+            },
+            'execucao': execucao,
+            'estatisticas': gerenciador.obter_estatisticas()
+        }
+
+        try:
+            if argumentos.salvar:
+                resumo['instantaneo'] = salvar_instantaneo(gerenciador, argumentos.salvar, argumentos.comprimir)
+            if argumentos.metricas:
+                with open(argumentos.metricas, 'w', encoding='utf-8') as arquivo:
+                    arquivo.write(gerenciador.instrumentacao.exportar_prometheus())
+        except OSError as erro:
+            print(json.dumps({'erro': str(erro)}), file=sys.stderr)
+            return 1
+
+    texto = json.dumps(resumo, indent=2, ensure_ascii=False)
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+
+    # Linhas malformadas no script: o resumo sai completo, mas a execução falha
+    return 1 if execucao.get('linhas_invalidas') else 0
+
+
+def main(argv=None):
     """Função principal"""
+    parser = criar_parser()
+    argumentos = parser.parse_args(argv)
+
+    if argumentos.script or argumentos.rastro:
+        if argumentos.restaurar is None and (argumentos.mem is None or argumentos.page is None):
+            parser.error("--mem e --page (ou --restaurar) sao obrigatorios com --script ou --rastro")
+        return executar_lote(argumentos)
+
+    if any(valor is not None for valor in (argumentos.mem, argumentos.page, argumentos.restaurar, argumentos.salvar)):
+        parser.error("informe --script ou --rastro para rodar sem interacao")
+
     try:
         simulador = Simulador()
         simulador.executar()
@@ -21,6 +298,8 @@ def main():
         print(f"\n[ERRO] Erro inesperado: {e}\n")
         raise
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Políticas de substituição de páginas consultadas pelo gerenciador de
+memória quando não há quadro livre para atender uma falta de página.
+
+Cada página residente é identificada pela chave (id_processo, numero_pagina).
+"""
+
+from collections import OrderedDict
+
+
+class PoliticaSubstituicao:
+    """Interface comum das políticas de substituição"""
+
+    nome = None
+
+    def __init__(self, capacidade: int):
+        """
+        Inicializa a política.
+
+        Args:
+            capacidade: Número de quadros da memória física
+        """
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.faltas = 0
+        self.despejos = 0
+
+    def registrar_carga(self, chave: tuple, falta: bool = True) -> None:
+        """
+        Registra que uma página passou a ocupar um quadro.
+
+        Args:
+            chave: (id_processo, numero_pagina)
+            falta: True se a carga foi causada por uma falta de página
+        """
+        if falta:
+            self.faltas += 1
+        self._inserir(chave)
+
+    def registrar_acesso(self, chave: tuple) -> None:
+        """Registra um acesso a uma página residente (acerto)"""
+        self.acertos += 1
+        self._acessar(chave)
+
+    def escolher_vitima(self, chave_entrante: tuple = None) -> tuple:
+        """
+        Escolhe e deixa de acompanhar a página a ser despejada.
+
+        Args:
+            chave_entrante: Página que causou a falta (usada pelo ARC)
+
+        Returns:
+            Chave da página vítima
+        """
+        self.despejos += 1
+        return self._escolher(chave_entrante)
+
+    def remover(self, chave: tuple) -> None:
+        """Deixa de acompanhar uma página (ex.: processo removido)"""
+        raise NotImplementedError
+
+    def num_residentes(self) -> int:
+        """Retorna quantas páginas residentes podem ser escolhidas como vítima"""
+        raise NotImplementedError
+
+    def _inserir(self, chave: tuple) -> None:
+        raise NotImplementedError
+
+    def _acessar(self, chave: tuple) -> None:
+        raise NotImplementedError
+
+    def _escolher(self, chave_entrante: tuple) -> tuple:
+        raise NotImplementedError
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna os contadores de acertos, faltas e despejos.
+
+        Returns:
+            Dicionário com contadores e taxa de acerto
+        """
+        total = self.acertos + self.faltas
+        return {
+            'tipo': self.nome,
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'despejos': self.despejos,
+            'taxa_acerto': self.acertos / total if total else 0.0
+        }
+
+    def __repr__(self):
+        return f"{type(self).__name__}(capacidade={self.capacidade})"
+
+
+class PoliticaFIFO(PoliticaSubstituicao):
+    """Despeja a página carregada há mais tempo"""
+
+    nome = 'fifo'
+
+    def __init__(self, capacidade: int):
+        super().__init__(capacidade)
+        self.fila = OrderedDict()
+
+    def _inserir(self, chave: tuple) -> None:
+        self.fila[chave] = None
+
+    def _acessar(self, chave: tuple) -> None:
+        pass
+
+    def _escolher(self, chave_entrante: tuple) -> tuple:
+        chave, _ = self.fila.popitem(last=False)
+        return chave
+
+    def remover(self, chave: tuple) -> None:
+        self.fila.pop(chave, None)
+
+    def num_residentes(self) -> int:
+        return len(self.fila)
+
+
+class PoliticaLRU(PoliticaSubstituicao):
+    """LRU exato em O(1): OrderedDict com a página menos recente no início"""
+
+    nome = 'lru'
+
+    def __init__(self, capacidade: int):
+        super().__init__(capacidade)
+        self.paginas = OrderedDict()
+
+    def _inserir(self, chave: tuple) -> None:
+        self.paginas[chave] = None
+
+    def _acessar(self, chave: tuple) -> None:
+        self.paginas.move_to_end(chave)
+
+    def _escolher(self, chave_entrante: tuple) -> tuple:
+        chave, _ = self.paginas.popitem(last=False)
+        return chave
+
+    def remover(self, chave: tuple) -> None:
+        self.paginas.pop(chave, None)
+
+    def num_residentes(self) -> int:
+        return len(self.paginas)
+
+
+class PoliticaClock(PoliticaSubstituicao):
+    """
+    Clock (segunda chance).
+
+    Usa o bit de referência das entradas da tabela de páginas, lido e
+    limpo pela função testar_e_limpar_referencia(chave) fornecida pelo
+    gerenciador de memória.
+    """
+
+    nome = 'clock'
+
+    def __init__(self, capacidade: int, testar_e_limpar_referencia=None):
+        super().__init__(capacidade)
+        self.testar_e_limpar_referencia = testar_e_limpar_referencia
+        self.anel = []  # chaves em ordem circular (None = posição vaga)
+        self.posicao = {}  # chave -> índice no anel
+        self.vagas = []
+        self.ponteiro = 0
+
+    def _inserir(self, chave: tuple) -> None:
+        if self.vagas:
+            indice = self.vagas.pop()
+            self.anel[indice] = chave
+        else:
+            indice = len(self.anel)
+            self.anel.append(chave)
+        self.posicao[chave] = indice
+
+    def _acessar(self, chave: tuple) -> None:
+        # O bit de referência é ligado pelo gerenciador na própria entrada
+        pass
+
+    def _escolher(self, chave_entrante: tuple) -> tuple:
+        while True:
+            if self.ponteiro >= len(self.anel):
+                self.ponteiro = 0
+
+            chave = self.anel[self.ponteiro]
+            self.ponteiro += 1
+
+            if chave is None:
+                continue
+            if self.testar_e_limpar_referencia and self.testar_e_limpar_referencia(chave):
+                continue
+
+            self.remover(chave)
+            return chave
+
+    def remover(self, chave: tuple) -> None:
+        indice = self.posicao.pop(chave, None)
+        if indice is not None:
+            self.anel[indice] = None
+            self.vagas.append(indice)
+
+    def num_residentes(self) -> int:
+        return len(self.posicao)
+
+    def __getstate__(self):
+        # A função de teste pertence ao gerenciador, que a religa ao restaurar
+        estado = self.__dict__.copy()
+        estado['testar_e_limpar_referencia'] = None
+        return estado
+
+
+class PoliticaARC(PoliticaSubstituicao):
+    """
+    ARC (Adaptive Replacement Cache, Megiddo e Modha).
+
+    T1 guarda páginas vistas uma vez e T2 páginas vistas mais de uma vez;
+    B1 e B2 são listas fantasmas com as chaves despejadas de cada uma. Um
+    acerto em B1 aumenta o alvo p para T1, e um acerto em B2 o diminui.
+    """
+
+    nome = 'arc'
+
+    def __init__(self, capacidade: int):
+        super().__init__(capacidade)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.p = 0
+        self._adaptada = None  # chave cuja adaptação de p já foi feita
+
+    def _adaptar(self, chave: tuple) -> None:
+        if self._adaptada == chave:
+            return
+        self._adaptada = chave
+
+        if chave in self.b1:
+            self.p = min(self.capacidade, self.p + max(len(self.b2) // len(self.b1), 1))
+        elif chave in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+
+    def _inserir(self, chave: tuple) -> None:
+        self._adaptar(chave)
+        self._adaptada = None
+
+        if chave in self.b1 or chave in self.b2:
+            self.b1.pop(chave, None)
+            self.b2.pop(chave, None)
+            self.t2[chave] = None
+        else:
+            self.t1[chave] = None
+
+        # Manter |T1| + |B1| <= c e o total <= 2c descartando fantasmas antigos
+        while self.b1 and len(self.t1) + len(self.b1) > self.capacidade:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * self.capacidade:
+            self.b2.popitem(last=False)
+
+    def _acessar(self, chave: tuple) -> None:
+        if chave in self.t1:
+            del self.t1[chave]
+            self.t2[chave] = None
+        elif chave in self.t2:
+            self.t2.move_to_end(chave)
+
+    def _escolher(self, chave_entrante: tuple) -> tuple:
+        if chave_entrante is not None:
+            self._adaptar(chave_entrante)
+
+        if self.t1 and (len(self.t1) > self.p or
+                        (chave_entrante in self.b2 and len(self.t1) == self.p) or
+                        not self.t2):
+            chave, _ = self.t1.popitem(last=False)
+            self.b1[chave] = None
+        else:
+            chave, _ = self.t2.popitem(last=False)
+            self.b2[chave] = None
+
+        return chave
+
+    def remover(self, chave: tuple) -> None:
+        for lista in (self.t1, self.t2, self.b1, self.b2):
+            lista.pop(chave, None)
+
+    def num_residentes(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+
+POLITICAS = {
+    PoliticaFIFO.nome: PoliticaFIFO,
+    PoliticaLRU.nome: PoliticaLRU,
+    PoliticaClock.nome: PoliticaClock,
+    PoliticaARC.nome: PoliticaARC
+}
+
+
+def criar_politica(tipo, capacidade: int) -> PoliticaSubstituicao:
+    """
+    Cria uma política a partir do nome ou retorna a instância recebida.
+
+    Args:
+        tipo: Nome da política (ver POLITICAS) ou instância de PoliticaSubstituicao
+        capacidade: Número de quadros da memória física
+
+    Returns:
+        Instância de PoliticaSubstituicao
+
+    Raises:
+        ValueError: Se o nome da política for desconhecido
+    """
+    if isinstance(tipo, PoliticaSubstituicao):
+        return tipo
+
+    if tipo not in POLITICAS:
+        raise ValueError(f"Politica desconhecida: {tipo} (opcoes: {', '.join(POLITICAS)})")
+
+    return POLITICAS[tipo](capacidade)
@@ -4,13 +4,15 @@ Implementação da classe Processo.
 
 import random
 import math
-from tabela_paginas import TabelaPaginas
+from tabela_paginas import criar_tabela_paginas
 
 
 class Processo:
     """Representa um processo com sua memória lógica e tabela de páginas"""
 
-    def __init__(self, id_processo: int, tamanho: int, tamanho_pagina: int):
+    def __init__(self, id_processo: int, tamanho: int, tamanho_pagina: int,
+                 preguicoso: bool = False, semente=None, tipo_tabela: str = 'lista',
+                 tabela_invertida=None, niveis_tabela: int = 2, paginas_grandes: int = 1):
         """
         Inicializa um processo.
 
@@ -18,15 +20,38 @@ class Processo:
             id_processo: Identificador único do processo
             tamanho: Tamanho da memória lógica em bytes
             tamanho_pagina: Tamanho de cada página em bytes
+            preguicoso: Se True, cada página só é gerada no primeiro acesso
+            semente: Semente opcional; com ela o conteúdo de cada página é
+                determinístico e igual nos modos preguiçoso e imediato
+            tipo_tabela: Implementação da tabela de páginas ('lista', 'compacta',
+                'multinivel' ou 'invertida')
+            tabela_invertida: Tabela invertida global (para tipo_tabela='invertida')
+            niveis_tabela: Número de níveis da tabela multinível
+            paginas_grandes: Páginas base por página grande (tamanho das
+                folhas da tabela multinível; 1 = sem páginas grandes)
         """
         self.id = id_processo
+        self.id_origem = id_processo  # processo cujo conteúdo inicial este compartilha (fork)
         self.tamanho = tamanho
+        self.tamanho_privado = tamanho  # sem os segmentos compartilhados anexados
         self.tamanho_pagina = tamanho_pagina
-        self.tabela_paginas = TabelaPaginas()
+        self.preguicoso = preguicoso
+        self.semente = semente
         self.num_paginas = math.ceil(tamanho / tamanho_pagina)
-        self.memoria_logica = self._inicializar_memoria_logica(tamanho)
+        self.tabela_paginas = criar_tabela_paginas(tipo_tabela, self.num_paginas, id_processo,
+                                                   tabela_invertida, niveis_tabela, paginas_grandes)
+        self.paginas_materializadas = {}  # numero_pagina -> bytes (modo preguiçoso)
+        self.segmentos = {}  # nome do segmento compartilhado -> primeira página
+        self.memoria_logica = None if preguicoso else self._inicializar_memoria_logica(tamanho)
 
-    def _inicializar_memoria_logica(self, tamanho: int) -> list:
+        self.trava = None  # threading.Lock no modo concorrente do gerenciador
+
+        # Estatísticas de paginação sob demanda
+        self.faltas_pagina = 0
+        self.bytes_swap_entrada = 0
+        self.bytes_swap_saida = 0
+
+    def _inicializar_memoria_logica(self, tamanho: int) -> bytearray:
         """
         Inicializa a memória lógica com valores aleatórios.
 
@@ -34,11 +59,36 @@ class Processo:
             tamanho: Tamanho da memória em bytes
 
         Returns:
-            Lista de bytes com valores aleatórios (0-255)
+            bytearray com valores aleatórios (0-255)
+        """
+        if self.semente is None:
+            return bytearray(random.randbytes(tamanho))
+
+        return bytearray().join(
+            self._gerar_pagina(num_pag) for num_pag in range(self.num_paginas)
+        )
+
+    def _gerar_pagina(self, numero_pagina: int) -> bytes:
+        """
+        Gera em bloco o conteúdo aleatório de uma página.
+
+        Args:
+            numero_pagina: Número da página
+
+        Returns:
+            bytes com valores aleatórios (0-255)
         """
-        return [random.randint(0, 255) for _ in range(tamanho)]
+        inicio = numero_pagina * self.tamanho_pagina
+        tamanho = min(self.tamanho_pagina, self.tamanho_privado - inicio)
 
-    def obter_dados_pagina(self, numero_pagina: int) -> list:
+        if self.semente is None:
+            return random.randbytes(tamanho)
+
+        # Semente própria por página: o conteúdo não depende da ordem de acesso
+        gerador = random.Random(f"{self.semente}:{self.id_origem}:{numero_pagina}")
+        return gerador.randbytes(tamanho)
+
+    def obter_dados_pagina(self, numero_pagina: int) -> bytearray:
         """
         Retorna os dados de uma página específica.
 
@@ -46,14 +96,78 @@ class Processo:
             numero_pagina: Número da página
 
         Returns:
-            Lista de bytes da página ou None se inválida
+            Bytes da página ou None se inválida (no modo preguiçoso, a página
+            é materializada no primeiro acesso); páginas de segmentos
+            compartilhados não têm conteúdo lógico próprio
         """
-        if numero_pagina < 0 or numero_pagina >= self.num_paginas:
+        if numero_pagina < 0 or numero_pagina * self.tamanho_pagina >= self.tamanho_privado:
             return None
 
+        if self.preguicoso:
+            dados = self.paginas_materializadas.get(numero_pagina)
+            if dados is None:
+                dados = self._gerar_pagina(numero_pagina)
+                self.paginas_materializadas[numero_pagina] = dados
+            return dados
+
         inicio = numero_pagina * self.tamanho_pagina
-        fim = min(inicio + self.tamanho_pagina, self.tamanho)
+        fim = min(inicio + self.tamanho_pagina, self.tamanho_privado)
         return self.memoria_logica[inicio:fim]
 
+    def anexar_segmento(self, nome: str, num_paginas: int) -> int:
+        """
+        Estende o espaço de endereçamento com as páginas de um segmento.
+
+        As páginas do segmento ficam depois das páginas já existentes; o
+        gerenciador acrescenta as entradas correspondentes na tabela de
+        páginas antes de chamar este método.
+
+        Args:
+            nome: Nome do segmento compartilhado
+            num_paginas: Páginas do segmento
+
+        Returns:
+            Número da primeira página do segmento no processo
+        """
+        pagina_inicial = self.num_paginas
+        self.segmentos[nome] = pagina_inicial
+        self.num_paginas += num_paginas
+        self.tamanho = self.num_paginas * self.tamanho_pagina
+        return pagina_inicial
+
+    def bifurcar(self, id_filho: int, tipo_tabela: str = 'lista', niveis_tabela: int = 2) -> 'Processo':
+        """
+        Cria um processo filho com o mesmo conteúdo lógico (fork).
+
+        O filho compartilha com o pai a origem do conteúdo (memória lógica e
+        páginas materializadas), que não muda depois da criação: as escritas
+        vão para os quadros da memória física. A tabela de páginas do filho
+        começa vazia e é preenchida pelo gerenciador.
+
+        Args:
+            id_filho: Identificador do processo filho
+            tipo_tabela: Implementação da tabela de páginas do filho
+            niveis_tabela: Número de níveis da tabela multinível
+
+        Returns:
+            Processo filho
+        """
+        filho = Processo(id_filho, self.tamanho_privado, self.tamanho_pagina, preguicoso=True,
+                         semente=self.semente, tipo_tabela=tipo_tabela, niveis_tabela=niveis_tabela)
+        filho.tamanho = self.tamanho
+        filho.num_paginas = self.num_paginas
+        filho.segmentos = dict(self.segmentos)
+        filho.preguicoso = self.preguicoso
+        filho.id_origem = self.id_origem
+        filho.memoria_logica = self.memoria_logica
+        filho.paginas_materializadas = self.paginas_materializadas
+        return filho
+
+    def __getstate__(self):
+        # A trava não é serializável; o gerenciador cria outra ao restaurar
+        estado = self.__dict__.copy()
+        estado['trava'] = None
+        return estado
+
     def __repr__(self):
         return f"Processo(id={self.id}, tamanho={self.tamanho}, paginas={self.num_paginas})"
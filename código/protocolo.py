@@ -0,0 +1,143 @@
+"""
+Protocolo binário entre servidor.py e cliente.py.
+
+Cada mensagem é um quadro: comprimento do corpo (uint32) seguido do corpo.
+Todos os inteiros são little-endian.
+
+Requisição: id_requisicao (uint32), operação (uint8) e os argumentos:
+
+    CRIAR           id_processo (uint32), tamanho (int64)
+    REMOVER         id_processo (uint32)
+    TRADUZIR        id_processo (uint32), endereco (int64)
+    TRADUZIR_LOTE   n (uint32) e n pares id_processo (uint32), endereco (int64)
+    ESTATISTICAS    sem argumentos
+
+Resposta: id_requisicao (uint32), situação (uint8) e o conteúdo:
+
+    CRIAR           num_paginas (uint32), paginas_alocadas (uint32)
+    REMOVER         quadros_liberados (uint32)
+    TRADUZIR        numero_pagina (int64), deslocamento (uint32), numero_quadro (int64),
+                    endereco_fisico (int64), valor (uint8), falta (uint8)
+    TRADUZIR_LOTE   n (uint32), faltas (uint32), invalidos (uint32) e as colunas
+                    numero_quadro (n x int64), endereco_fisico (n x int64), valor (n x int16)
+    ESTATISTICAS    JSON (UTF-8) de GerenciadorMemoria.obter_estatisticas()
+
+Com situação diferente de OK o conteúdo é um JSON com os argumentos da
+exceção, de modo que o cliente recria a mesma exceção de erros.py.
+
+Um cliente pode enviar várias requisições sem esperar as respostas
+(pipelining): elas são respondidas na ordem de chegada e associadas pelo
+id_requisicao.
+"""
+
+import json
+import struct
+import sys
+from array import array
+import erros
+
+CRIAR = 1
+REMOVER = 2
+TRADUZIR = 3
+TRADUZIR_LOTE = 4
+ESTATISTICAS = 5
+
+OK = 0
+ERRO_REQUISICAO = 255  # requisição malformada ou operação desconhecida
+
+# Código de situação de cada exceção do gerenciador (0 = OK); novas
+# exceções entram no fim para não mudar os códigos existentes
+ERROS = (
+    erros.ErroProcessoExistente,
+    erros.ErroProcessoNaoEncontrado,
+    erros.ErroTamanhoExcedido,
+    erros.ErroMemoriaInsuficiente,
+    erros.ErroEnderecoInvalido,
+    erros.ErroPaginaNaoEncontrada,
+    erros.ErroTamanhoInvalido
+)
+CODIGO_ERRO = {classe: codigo for codigo, classe in enumerate(ERROS, 1)}
+
+COMPRIMENTO = struct.Struct('<I')
+CABECALHO_REQUISICAO = struct.Struct('<IB')
+CABECALHO_RESPOSTA = struct.Struct('<IB')
+PROCESSO = struct.Struct('<I')
+PROCESSO_VALOR = struct.Struct('<Iq')
+CONTAGEM = struct.Struct('<I')
+RESPOSTA_CRIAR = struct.Struct('<II')
+RESPOSTA_TRADUZIR = struct.Struct('<qIqqBB')
+RESPOSTA_LOTE = struct.Struct('<III')
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def enquadrar(corpo: bytes) -> bytes:
+    """Prefixa o corpo com seu comprimento"""
+    return COMPRIMENTO.pack(len(corpo)) + corpo
+
+
+def extrair_quadros(buffer: bytearray) -> list:
+    """
+    Retira do buffer todos os quadros completos.
+
+    Args:
+        buffer: Bytes recebidos e ainda não processados (é consumido)
+
+    Returns:
+        Lista com o corpo de cada quadro completo
+    """
+    quadros = []
+    inicio = 0
+    tamanho_prefixo = COMPRIMENTO.size
+
+    while len(buffer) - inicio >= tamanho_prefixo:
+        comprimento, = COMPRIMENTO.unpack_from(buffer, inicio)
+        fim = inicio + tamanho_prefixo + comprimento
+        if fim > len(buffer):
+            break
+        quadros.append(bytes(buffer[inicio + tamanho_prefixo:fim]))
+        inicio = fim
+
+    del buffer[:inicio]
+    return quadros
+
+
+def codificar_colunas(*colunas) -> bytes:
+    """Serializa arrays em little-endian"""
+    partes = []
+    for coluna in colunas:
+        if not _LITTLE_ENDIAN:
+            coluna = array(coluna.typecode, coluna)
+            coluna.byteswap()
+        partes.append(coluna.tobytes())
+    return b''.join(partes)
+
+
+def decodificar_coluna(tipo: str, dados, inicio: int, n: int) -> tuple:
+    """
+    Lê uma coluna de n elementos do tipo indicado.
+
+    Returns:
+        Tupla (array, posição seguinte)
+    """
+    coluna = array(tipo)
+    fim = inicio + n * coluna.itemsize
+    coluna.frombytes(dados[inicio:fim])
+    if not _LITTLE_ENDIAN:
+        coluna.byteswap()
+    return coluna, fim
+
+
+def codificar_erro(id_requisicao: int, erro: Exception) -> bytes:
+    """Monta a resposta de erro para uma exceção"""
+    codigo = CODIGO_ERRO.get(type(erro), ERRO_REQUISICAO)
+    argumentos = list(erro.args) if codigo != ERRO_REQUISICAO else [str(erro)]
+    return enquadrar(CABECALHO_RESPOSTA.pack(id_requisicao, codigo) + json.dumps(argumentos).encode())
+
+
+def decodificar_erro(codigo: int, conteudo: bytes) -> Exception:
+    """Recria a exceção enviada pelo servidor"""
+    argumentos = json.loads(conteudo)
+    if codigo == ERRO_REQUISICAO or not 1 <= codigo <= len(ERROS):
+        return ValueError(*argumentos)
+    return ERROS[codigo - 1](*argumentos)
@@ -0,0 +1,391 @@
+"""
+Leitura e reprodução de rastros (traces) de carga sobre o gerenciador de memória.
+
+Um rastro é uma sequência de eventos (operacao, id_processo, valor):
+
+    C <id_processo> <tamanho>     cria um processo
+    R <id_processo>               remove um processo
+    A <id_processo> <endereco>    acessa (traduz) um endereço lógico
+
+No formato texto cada linha traz um evento com os campos separados por
+espaços; linhas vazias e o que vier depois de '#' são ignorados. No formato
+CSV as colunas são operacao,id_processo,valor (cabeçalho opcional). Números
+aceitam os prefixos 0x, 0o e 0b.
+
+O formato binário tem um cabeçalho de 16 bytes (assinatura b'RAST', versão e
+tamanho do registro) seguido de registros de largura fixa com 16 bytes em
+little-endian: código da operação (1 byte, o próprio caractere C/R/A), 3 bytes
+de preenchimento, id_processo (uint32) e valor (int64). Ele é lido com mmap e
+decodificado sem cópias por struct.iter_unpack, dispensando a análise de texto.
+
+Os leitores são geradores: o arquivo é percorrido linha a linha e nunca é
+carregado inteiro na memória, o que permite reproduzir rastros de vários GB.
+
+Executar:
+    python3 rastro.py carga.txt --memoria 1048576 --pagina 4096
+    python3 rastro.py carga.txt --converter carga.bin
+"""
+
+import argparse
+import csv
+import mmap
+import struct
+import time
+from itertools import islice
+from gerenciador_memoria import GerenciadorMemoria
+from erros import ErroGerenciadorMemoria
+
+CRIAR = 'C'
+REMOVER = 'R'
+ACESSAR = 'A'
+OPERACOES = (CRIAR, REMOVER, ACESSAR)
+
+ASSINATURA_BINARIA = b'RAST'
+VERSAO_BINARIA = 1
+CABECALHO_BINARIO = struct.Struct('<4sHH8x')
+REGISTRO_BINARIO = struct.Struct('<B3xIq')
+_OPERACAO_POR_CODIGO = {ord(operacao): operacao for operacao in OPERACOES}
+
+
+def _analisar_evento(campos: list, numero_linha: int) -> tuple:
+    """
+    Converte os campos de uma linha em um evento.
+
+    Raises:
+        ValueError: Se a operação ou os números forem inválidos
+    """
+    operacao = campos[0].strip().upper()
+
+    if operacao not in OPERACOES or len(campos) < (2 if operacao == REMOVER else 3):
+        raise ValueError(f"Evento invalido na linha {numero_linha}: {' '.join(campos)}")
+
+    try:
+        id_processo = int(campos[1], 0)
+        valor = int(campos[2], 0) if operacao != REMOVER else 0
+    except ValueError:
+        raise ValueError(f"Numero invalido na linha {numero_linha}: {' '.join(campos)}") from None
+
+    return operacao, id_processo, valor
+
+
+def ler_eventos_texto(caminho: str):
+    """
+    Lê um rastro em formato texto.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Yields:
+        Tuplas (operacao, id_processo, valor)
+    """
+    with open(caminho, 'r', encoding='ascii') as arquivo:
+        for numero_linha, linha in enumerate(arquivo, 1):
+            campos = linha.split('#', 1)[0].split()
+            if campos:
+                yield _analisar_evento(campos, numero_linha)
+
+
+def ler_eventos_csv(caminho: str):
+    """
+    Lê um rastro em formato CSV (operacao,id_processo,valor).
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Yields:
+        Tuplas (operacao, id_processo, valor)
+    """
+    with open(caminho, 'r', encoding='ascii', newline='') as arquivo:
+        for numero_linha, campos in enumerate(csv.reader(arquivo), 1):
+            if not campos or campos[0].startswith('#'):
+                continue
+            if numero_linha == 1 and campos[0].strip().upper() not in OPERACOES:
+                continue  # cabeçalho
+            yield _analisar_evento(campos, numero_linha)
+
+
+def ler_eventos_binario(caminho: str):
+    """
+    Lê um rastro em formato binário mapeando o arquivo com mmap.
+
+    Os registros são decodificados diretamente do mapeamento por
+    struct.iter_unpack, sem ler o arquivo para buffers intermediários.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Yields:
+        Tuplas (operacao, id_processo, valor)
+
+    Raises:
+        ValueError: Se o cabeçalho, o tamanho do arquivo ou uma operação forem inválidos
+    """
+    with open(caminho, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        if len(mapa) < CABECALHO_BINARIO.size:
+            raise ValueError(f"Rastro binario sem cabecalho: {caminho}")
+
+        assinatura, versao, tamanho_registro = CABECALHO_BINARIO.unpack_from(mapa)
+        if assinatura != ASSINATURA_BINARIA or versao != VERSAO_BINARIA:
+            raise ValueError(f"Rastro binario invalido: {caminho}")
+        if (tamanho_registro != REGISTRO_BINARIO.size or
+                (len(mapa) - CABECALHO_BINARIO.size) % tamanho_registro):
+            raise ValueError(f"Rastro binario truncado ou com registro desconhecido: {caminho}")
+
+        if hasattr(mapa, 'madvise'):
+            mapa.madvise(mmap.MADV_SEQUENTIAL)
+
+        visao = memoryview(mapa)[CABECALHO_BINARIO.size:]
+        registros = REGISTRO_BINARIO.iter_unpack(visao)
+        operacoes = _OPERACAO_POR_CODIGO
+
+        try:
+            for codigo, id_processo, valor in registros:
+                operacao = operacoes.get(codigo)
+                if operacao is None:
+                    raise ValueError(f"Operacao binaria desconhecida: {codigo}")
+                yield operacao, id_processo, valor
+        finally:
+            # O iterador segura o buffer; ele deve ser solto antes do mapeamento
+            registros = None
+            visao.release()
+
+
+def converter_rastro(origem: str, destino: str, formato: str = None,
+                     registros_por_bloco: int = 65536) -> int:
+    """
+    Converte um rastro em texto ou CSV para o formato binário.
+
+    Args:
+        origem: Arquivo de rastro de entrada
+        destino: Arquivo binário a ser criado
+        formato: Formato da entrada (None = deduzido, ver ler_rastro)
+        registros_por_bloco: Registros acumulados antes de cada escrita
+
+    Returns:
+        Número de eventos convertidos
+
+    Raises:
+        ValueError: Se algum evento não couber no registro binário
+    """
+    empacotar = REGISTRO_BINARIO.pack
+    total = 0
+
+    with open(destino, 'wb') as arquivo:
+        arquivo.write(CABECALHO_BINARIO.pack(ASSINATURA_BINARIA, VERSAO_BINARIA, REGISTRO_BINARIO.size))
+        bloco = []
+
+        for operacao, id_processo, valor in ler_rastro(origem, formato):
+            try:
+                bloco.append(empacotar(ord(operacao), id_processo, valor))
+            except struct.error:
+                raise ValueError(f"Evento fora dos limites do formato binario: "
+                                 f"{operacao} {id_processo} {valor}") from None
+
+            if len(bloco) >= registros_por_bloco:
+                arquivo.write(b''.join(bloco))
+                total += len(bloco)
+                bloco = []
+
+        arquivo.write(b''.join(bloco))
+        total += len(bloco)
+
+    return total
+
+
+def eh_rastro_binario(caminho: str) -> bool:
+    """Verifica se o arquivo começa com a assinatura do formato binário"""
+    with open(caminho, 'rb') as arquivo:
+        return arquivo.read(len(ASSINATURA_BINARIA)) == ASSINATURA_BINARIA
+
+
+LEITORES = {
+    'texto': ler_eventos_texto,
+    'csv': ler_eventos_csv,
+    'binario': ler_eventos_binario
+}
+
+
+def ler_rastro(caminho: str, formato: str = None):
+    """
+    Abre um rastro com o leitor adequado.
+
+    Args:
+        caminho: Caminho do arquivo
+        formato: Nome do formato (ver LEITORES); se None, é deduzido pela
+            assinatura binária ou pela extensão ('.csv' = CSV, demais = texto)
+
+    Returns:
+        Gerador de tuplas (operacao, id_processo, valor)
+
+    Raises:
+        ValueError: Se o formato for desconhecido
+    """
+    if formato is None:
+        if eh_rastro_binario(caminho):
+            formato = 'binario'
+        else:
+            formato = 'csv' if caminho.lower().endswith('.csv') else 'texto'
+
+    if formato not in LEITORES:
+        raise ValueError(f"Formato de rastro desconhecido: {formato} (opcoes: {', '.join(LEITORES)})")
+
+    return LEITORES[formato](caminho)
+
+
+def agrupar_acessos(eventos, tamanho_lote: int = 4096):
+    """
+    Junta acessos consecutivos em lotes para GerenciadorMemoria.traduzir_lote.
+
+    Criações e remoções passam adiante sem alteração e encerram o lote
+    corrente, preservando a ordem do rastro.
+
+    Args:
+        eventos: Iterável de tuplas (operacao, id_processo, valor)
+        tamanho_lote: Número máximo de acessos por lote
+
+    Yields:
+        Eventos de criação/remoção e tuplas (ACESSAR, None, [(id_processo, endereco), ...])
+    """
+    lote = []
+
+    for evento in eventos:
+        if evento[0] == ACESSAR:
+            lote.append((evento[1], evento[2]))
+            if len(lote) >= tamanho_lote:
+                yield ACESSAR, None, lote
+                lote = []
+        else:
+            if lote:
+                yield ACESSAR, None, lote
+                lote = []
+            yield evento
+
+    if lote:
+        yield ACESSAR, None, lote
+
+
+def reproduzir_rastro(gerenciador: GerenciadorMemoria, eventos, tamanho_maximo_processo: int = None,
+                      tamanho_lote: int = 4096, limite_eventos: int = None) -> dict:
+    """
+    Aplica os eventos de um rastro ao gerenciador de memória.
+
+    Eventos que falham (processo repetido, memória insuficiente, endereço
+    inválido) são contados e a reprodução continua.
+
+    Args:
+        gerenciador: Gerenciador de memória alvo
+        eventos: Iterável de tuplas (operacao, id_processo, valor)
+        tamanho_maximo_processo: Limite passado a criar_processo (None = sem limite)
+        tamanho_lote: Número máximo de acessos traduzidos por chamada
+        limite_eventos: Reproduz apenas os primeiros N eventos (None = todos)
+
+    Returns:
+        Dicionário com contadores de eventos, falhas, faltas de página,
+        tempo decorrido e vazão em eventos por segundo
+    """
+    if limite_eventos is not None:
+        eventos = islice(eventos, limite_eventos)
+
+    resultado = {
+        'eventos': 0,
+        'criacoes': 0,
+        'remocoes': 0,
+        'acessos': 0,
+        'falhas': 0,
+        'invalidos': 0,
+        'faltas_pagina': 0
+    }
+    limite = tamanho_maximo_processo
+
+    # Durante a reprodução o gerenciador fica silencioso: erros viram exceções contadas
+    silencioso = gerenciador.silencioso
+    gerenciador.silencioso = True
+    inicio = time.perf_counter()
+
+    try:
+        for operacao, id_processo, valor in agrupar_acessos(eventos, tamanho_lote):
+            if operacao == ACESSAR:
+                lote = gerenciador.traduzir_lote(valor)
+                resultado['acessos'] += len(valor)
+                resultado['invalidos'] += lote['invalidos']
+                resultado['faltas_pagina'] += lote['faltas_pagina']
+                continue
+
+            try:
+                if operacao == CRIAR:
+                    gerenciador.criar_processo(id_processo, valor, valor if limite is None else limite)
+                    resultado['criacoes'] += 1
+                else:
+                    gerenciador.remover_processo(id_processo)
+                    resultado['remocoes'] += 1
+            except ErroGerenciadorMemoria:
+                resultado['falhas'] += 1
+    finally:
+        gerenciador.silencioso = silencioso
+
+    segundos = time.perf_counter() - inicio
+    resultado['eventos'] = (resultado['acessos'] + resultado['criacoes'] +
+                            resultado['remocoes'] + resultado['falhas'])
+    resultado['segundos'] = segundos
+    resultado['eventos_por_segundo'] = resultado['eventos'] / segundos if segundos else 0.0
+    return resultado
+
+
+def main():
+    """Reproduz um rastro passado na linha de comando e exibe a vazão"""
+    parser = argparse.ArgumentParser(description="Reproduz um rastro de eventos no gerenciador de memoria")
+    parser.add_argument('rastro', help="Arquivo de rastro")
+    parser.add_argument('--formato', choices=sorted(LEITORES), help="Formato do rastro (padrao: pela extensao)")
+    parser.add_argument('--memoria', type=int, default=1 << 20, help="Memoria fisica em bytes")
+    parser.add_argument('--pagina', type=int, default=4096, help="Tamanho da pagina em bytes")
+    parser.add_argument('--max-processo', type=int, default=None, help="Tamanho maximo de um processo")
+    parser.add_argument('--swap', type=int, default=0, help="Tamanho da area de swap em bytes")
+    parser.add_argument('--politica', default='fifo', help="Politica de substituicao")
+    parser.add_argument('--tlb', type=int, default=None, help="Entradas da TLB")
+    parser.add_argument('--tabela', default='lista', help="Tipo de tabela de paginas")
+    parser.add_argument('--lote', type=int, default=4096, help="Acessos por lote")
+    parser.add_argument('--converter', metavar='DESTINO',
+                        help="Apenas converte o rastro para o formato binario em DESTINO")
+    argumentos = parser.parse_args()
+
+    if argumentos.converter:
+        inicio = time.perf_counter()
+        total = converter_rastro(argumentos.rastro, argumentos.converter, argumentos.formato)
+        print(f"{total} eventos convertidos para {argumentos.converter} "
+              f"em {time.perf_counter() - inicio:.3f} s")
+        return
+
+    gerenciador = GerenciadorMemoria(argumentos.memoria, argumentos.pagina, silencioso=True,
+                                     tamanho_swap=argumentos.swap,
+                                     politica_substituicao=argumentos.politica,
+                                     tlb=argumentos.tlb, tipo_tabela=argumentos.tabela)
+
+    with gerenciador:
+        resultado = reproduzir_rastro(gerenciador, ler_rastro(argumentos.rastro, argumentos.formato),
+                                      argumentos.max_processo, argumentos.lote)
+        estatisticas = gerenciador.obter_estatisticas()
+
+    print("\n" + "=" * 50)
+    print("              REPRODUCAO DO RASTRO")
+    print("=" * 50)
+    print(f"Eventos: {resultado['eventos']} em {resultado['segundos']:.3f} s "
+          f"({resultado['eventos_por_segundo']:,.0f} eventos/s)")
+    print(f"Criacoes: {resultado['criacoes']}  Remocoes: {resultado['remocoes']}  "
+          f"Acessos: {resultado['acessos']}")
+    print(f"Falhas: {resultado['falhas']}  Enderecos invalidos: {resultado['invalidos']}  "
+          f"Faltas de pagina: {resultado['faltas_pagina']}")
+    print(f"Quadros usados: {estatisticas['quadros_usados']}/{estatisticas['total_quadros']} "
+          f"({estatisticas['percentual_usado']:.2f}%)")
+    print(f"Processos ativos: {estatisticas['num_processos']}")
+    print(f"Fragmentacao externa: {estatisticas['fragmentacao']['fragmentacao_externa']:.3f}")
+    if estatisticas['tlb'] is not None:
+        print(f"Taxa de acerto da TLB: {estatisticas['tlb']['taxa_acerto']:.3f}")
+    if estatisticas['substituicao'] is not None:
+        print(f"Taxa de acerto ({estatisticas['substituicao']['tipo']}): "
+              f"{estatisticas['substituicao']['taxa_acerto']:.3f}")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Resultados tipados das operações do gerenciador de memória.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ResultadoCriacao:
+    """Resultado de GerenciadorMemoria.criar_processo"""
+
+    id_processo: int
+    tamanho: int
+    num_paginas: int
+    paginas_alocadas: int
+    paginas_grandes: int = 0  # páginas grandes entre as páginas alocadas
+
+    @property
+    def paginas_sob_demanda(self) -> int:
+        """Páginas que ficaram fora da memória até a primeira falta"""
+        return self.num_paginas - self.paginas_alocadas
+
+
+@dataclass(slots=True)
+class ResultadoRemocao:
+    """Resultado de GerenciadorMemoria.remover_processo"""
+
+    id_processo: int
+    quadros_liberados: int
+
+
+@dataclass(slots=True)
+class ResultadoTraducao:
+    """
+    Resultado de GerenciadorMemoria.traduzir_endereco.
+
+    Também aceita acesso por chave (resultado['valor']), como o dicionário
+    devolvido pelas versões anteriores.
+    """
+
+    endereco_logico: int
+    numero_pagina: int
+    deslocamento: int
+    numero_quadro: int
+    endereco_fisico: int
+    valor: int
+    falta_pagina: bool
+
+    def __getitem__(self, chave: str):
+        try:
+            return getattr(self, chave)
+        except AttributeError:
+            raise KeyError(chave) from None
+
+
+@dataclass(slots=True)
+class ResultadoFork:
+    """Resultado de GerenciadorMemoria.fork_processo"""
+
+    id_pai: int
+    id_filho: int
+    num_paginas: int
+    quadros_compartilhados: int
+    paginas_swap_copiadas: int
+
+
+@dataclass(slots=True)
+class ResultadoEscrita:
+    """Resultado de GerenciadorMemoria.escrever_endereco"""
+
+    endereco_logico: int
+    numero_pagina: int
+    numero_quadro: int
+    endereco_fisico: int
+    valor: int
+    falta_pagina: bool
+    copia_na_escrita: bool
+
+
+@dataclass(slots=True)
+class ResultadoSegmento:
+    """Resultado de GerenciadorMemoria.criar_segmento e remover_segmento"""
+
+    nome: str
+    tamanho: int
+    num_paginas: int
+    quadros: int  # quadros reservados (criação) ou liberados (remoção)
+
+
+@dataclass(slots=True)
+class ResultadoAnexacao:
+    """Resultado de GerenciadorMemoria.anexar_segmento"""
+
+    id_processo: int
+    nome: str
+    pagina_inicial: int
+    num_paginas: int
+    endereco_inicial: int
+
+
+@dataclass(slots=True)
+class ResultadoDeduplicacao:
+    """Resultado de GerenciadorMemoria.deduplicar (um passo da varredura)"""
+
+    paginas_varridas: int
+    paginas_mescladas: int
+    bytes_hash: int
+    segundos_hash: float
+    varredura_completa: bool
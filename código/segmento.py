@@ -0,0 +1,47 @@
+"""
+Segmentos de memória compartilhada com nome.
+
+Um segmento reserva seus quadros na criação e os mantém enquanto existir;
+processos o anexam ao fim do espaço de endereçamento e mapeiam os mesmos
+quadros, como uma biblioteca compartilhada. A escrita de um processo em
+uma página do segmento segue a cópia na escrita: o processo passa a ter
+uma cópia privada e os demais continuam vendo o conteúdo original.
+"""
+
+import math
+import random
+
+
+class SegmentoCompartilhado:
+    """Segmento com nome cujos quadros são mapeados por vários processos"""
+
+    def __init__(self, nome: str, tamanho: int, tamanho_pagina: int):
+        """
+        Args:
+            nome: Nome do segmento
+            tamanho: Tamanho em bytes
+            tamanho_pagina: Tamanho de cada página em bytes
+        """
+        self.nome = nome
+        self.tamanho = tamanho
+        self.tamanho_pagina = tamanho_pagina
+        self.num_paginas = math.ceil(tamanho / tamanho_pagina)
+        self.quadros = []  # quadro de cada página (cada um com uma referência do segmento)
+        self.pronto = False  # conteúdo carregado; antes disso o segmento não pode ser anexado
+
+    def gerar_pagina(self, numero_pagina: int) -> bytes:
+        """
+        Gera o conteúdo inicial de uma página, determinístico pelo nome.
+
+        Args:
+            numero_pagina: Número da página no segmento
+
+        Returns:
+            bytes com valores aleatórios (0-255)
+        """
+        inicio = numero_pagina * self.tamanho_pagina
+        tamanho = min(self.tamanho_pagina, self.tamanho - inicio)
+        return random.Random(f"segmento:{self.nome}:{numero_pagina}").randbytes(tamanho)
+
+    def __repr__(self):
+        return f"SegmentoCompartilhado(nome={self.nome!r}, paginas={self.num_paginas})"
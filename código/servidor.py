@@ -0,0 +1,237 @@
+"""
+Servidor asyncio que expõe um GerenciadorMemoria por um socket local
+(Unix ou TCP em localhost), usando o protocolo binário de protocolo.py.
+
+Todas as conexões compartilham o mesmo gerenciador, executado na thread do
+laço de eventos: cada requisição roda até o fim sem ser interrompida, então
+o gerenciador não precisa do modo concorrente.
+
+Lotes e pipelining: os clientes podem enviar várias requisições sem esperar
+as respostas. Tudo o que chega em uma leitura do socket é processado como
+um lote e as respostas vão de volta em uma única escrita. Se o cliente não
+consome as respostas, o servidor para de ler da conexão até o buffer de
+saída esvaziar.
+
+Executar:
+    python3 servidor.py --mem 1048576 --page 4096 --unix /tmp/memoria.sock
+    python3 servidor.py --mem 1048576 --page 4096 --porta 7070
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+import protocolo
+from configuracao import ConfiguracaoSistema
+from erros import ErroGerenciadorMemoria
+from gerenciador_memoria import GerenciadorMemoria
+
+
+class ConexaoServidor(asyncio.Protocol):
+    """Uma conexão de cliente: separa os quadros e responde em lote"""
+
+    def __init__(self, servidor):
+        self.servidor = servidor
+        self.transporte = None
+        self.buffer = bytearray()
+
+    def connection_made(self, transporte):
+        self.transporte = transporte
+        self.servidor.conexoes += 1
+
+    def connection_lost(self, excecao):
+        self.servidor.conexoes -= 1
+
+    def data_received(self, dados):
+        self.buffer += dados
+        quadros = protocolo.extrair_quadros(self.buffer)
+        if quadros:
+            self.servidor.lotes += 1
+            self.transporte.write(b''.join(map(self.servidor.processar, quadros)))
+
+    def pause_writing(self):
+        # Contrapressão: o cliente não está lendo as respostas
+        self.transporte.pause_reading()
+
+    def resume_writing(self):
+        self.transporte.resume_reading()
+
+
+class ServidorMemoria:
+    """
+    Front-end assíncrono para um GerenciadorMemoria.
+
+    O gerenciador é usado no modo silencioso: resultados e exceções são
+    convertidos em respostas do protocolo.
+    """
+
+    def __init__(self, gerenciador: GerenciadorMemoria):
+        """
+        Args:
+            gerenciador: Gerenciador de memória no modo silencioso
+        """
+        if not gerenciador.silencioso:
+            raise ValueError("O servidor requer um GerenciadorMemoria silencioso")
+
+        self.gerenciador = gerenciador
+        self.servidor = None
+        self.conexoes = 0
+        self.requisicoes = 0
+        self.lotes = 0
+
+        self._operacoes = {
+            protocolo.CRIAR: self._criar,
+            protocolo.REMOVER: self._remover,
+            protocolo.TRADUZIR: self._traduzir,
+            protocolo.TRADUZIR_LOTE: self._traduzir_lote,
+            protocolo.ESTATISTICAS: self._estatisticas
+        }
+
+    async def iniciar(self, caminho_unix: str = None, host: str = '127.0.0.1', porta: int = 0):
+        """
+        Começa a aceitar conexões.
+
+        Args:
+            caminho_unix: Caminho do socket Unix (se informado, host e porta
+                são ignorados)
+            host: Endereço TCP
+            porta: Porta TCP (0 = escolhida pelo sistema)
+
+        Returns:
+            O endereço em que o servidor está escutando
+        """
+        loop = asyncio.get_running_loop()
+        fabrica = lambda: ConexaoServidor(self)
+
+        if caminho_unix is not None:
+            if os.path.exists(caminho_unix):
+                os.unlink(caminho_unix)
+            self.servidor = await loop.create_unix_server(fabrica, caminho_unix)
+        else:
+            self.servidor = await loop.create_server(fabrica, host, porta)
+
+        return self.servidor.sockets[0].getsockname()
+
+    async def parar(self) -> None:
+        """Fecha o socket de escuta e espera as conexões terminarem"""
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+            self.servidor = None
+
+    async def servir_para_sempre(self) -> None:
+        """Atende conexões até o laço de eventos ser cancelado"""
+        async with self.servidor:
+            await self.servidor.serve_forever()
+
+    def processar(self, corpo: bytes) -> bytes:
+        """
+        Executa uma requisição.
+
+        Args:
+            corpo: Corpo do quadro de requisição
+
+        Returns:
+            Quadro de resposta
+        """
+        self.requisicoes += 1
+        id_requisicao = 0
+
+        try:
+            id_requisicao, operacao = protocolo.CABECALHO_REQUISICAO.unpack_from(corpo)
+            funcao = self._operacoes.get(operacao)
+            if funcao is None:
+                raise ValueError(f"Operacao desconhecida: {operacao}")
+
+            conteudo = funcao(memoryview(corpo)[protocolo.CABECALHO_REQUISICAO.size:])
+            return protocolo.enquadrar(
+                protocolo.CABECALHO_RESPOSTA.pack(id_requisicao, protocolo.OK) + conteudo
+            )
+        except ErroGerenciadorMemoria as erro:
+            return protocolo.codificar_erro(id_requisicao, erro)
+        except (ValueError, struct.error) as erro:
+            return protocolo.codificar_erro(id_requisicao, ValueError(str(erro)))
+
+    def _criar(self, argumentos) -> bytes:
+        id_processo, tamanho = protocolo.PROCESSO_VALOR.unpack(argumentos)
+        resultado = self.gerenciador.criar_processo(id_processo, tamanho)
+        return protocolo.RESPOSTA_CRIAR.pack(resultado.num_paginas, resultado.paginas_alocadas)
+
+    def _remover(self, argumentos) -> bytes:
+        id_processo, = protocolo.PROCESSO.unpack(argumentos)
+        resultado = self.gerenciador.remover_processo(id_processo)
+        return protocolo.CONTAGEM.pack(resultado.quadros_liberados)
+
+    def _traduzir(self, argumentos) -> bytes:
+        id_processo, endereco = protocolo.PROCESSO_VALOR.unpack(argumentos)
+        resultado = self.gerenciador.traduzir_endereco(id_processo, endereco)
+        return protocolo.RESPOSTA_TRADUZIR.pack(resultado.numero_pagina, resultado.deslocamento,
+                                                resultado.numero_quadro, resultado.endereco_fisico,
+                                                resultado.valor, resultado.falta_pagina)
+
+    def _traduzir_lote(self, argumentos) -> bytes:
+        n, = protocolo.CONTAGEM.unpack_from(argumentos)
+        pares = argumentos[protocolo.CONTAGEM.size:]
+        if len(pares) != n * protocolo.PROCESSO_VALOR.size:
+            raise ValueError(f"Lote com tamanho invalido: {n} enderecos, {len(pares)} bytes")
+
+        resultado = self.gerenciador.traduzir_lote(protocolo.PROCESSO_VALOR.iter_unpack(pares))
+        return (protocolo.RESPOSTA_LOTE.pack(n, resultado['faltas_pagina'], resultado['invalidos'])
+                + protocolo.codificar_colunas(resultado['numero_quadro'], resultado['endereco_fisico'],
+                                              resultado['valor']))
+
+    def _estatisticas(self, argumentos) -> bytes:
+        estatisticas = self.gerenciador.obter_estatisticas()
+        estatisticas['servidor'] = {'conexoes': self.conexoes, 'requisicoes': self.requisicoes,
+                                    'lotes': self.lotes}
+        return json.dumps(estatisticas).encode()
+
+
+def main():
+    """Sobe o servidor com a configuração da linha de comando"""
+    parser = argparse.ArgumentParser(description="Servidor do gerenciador de memoria")
+    parser.add_argument('--mem', type=int, required=True, help="Tamanho da memoria fisica em bytes")
+    parser.add_argument('--page', type=int, required=True, help="Tamanho da pagina em bytes")
+    parser.add_argument('--max-proc', type=int, help="Tamanho maximo de um processo (padrao: --mem)")
+    parser.add_argument('--alocador', default='bitmap', help="Alocador de quadros livres")
+    parser.add_argument('--swap', type=int, default=0, help="Tamanho da area de swap em bytes")
+    parser.add_argument('--politica', default='fifo', help="Politica de substituicao")
+    parser.add_argument('--tlb', type=int, default=None, help="Entradas da TLB")
+    parser.add_argument('--tabela', default='lista', help="Tipo de tabela de paginas")
+    parser.add_argument('--instrumentar', action='store_true',
+                        help="Mede as operacoes (incluidas na resposta de estatisticas)")
+    endereco = parser.add_mutually_exclusive_group(required=True)
+    endereco.add_argument('--unix', help="Caminho do socket Unix")
+    endereco.add_argument('--porta', type=int, help="Porta TCP em 127.0.0.1")
+    argumentos = parser.parse_args()
+
+    try:
+        configuracao = ConfiguracaoSistema(argumentos.mem, argumentos.page,
+                                           argumentos.max_proc or argumentos.mem)
+        gerenciador = GerenciadorMemoria(configuracao, alocador=argumentos.alocador,
+                                         tamanho_swap=argumentos.swap,
+                                         politica_substituicao=argumentos.politica,
+                                         tlb=argumentos.tlb, tipo_tabela=argumentos.tabela,
+                                         silencioso=True)
+    except ValueError as erro:
+        parser.error(str(erro))
+
+    if argumentos.instrumentar:
+        gerenciador.instrumentar()
+
+    async def servir():
+        servidor = ServidorMemoria(gerenciador)
+        endereco_escuta = await servidor.iniciar(argumentos.unix, porta=argumentos.porta or 0)
+        print(f"Servidor escutando em {endereco_escuta}")
+        await servidor.servir_para_sempre()
+
+    with gerenciador:
+        try:
+            asyncio.run(servir())
+        except KeyboardInterrupt:
+            print("\nServidor encerrado.")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,9 @@ Interface de linha de comando para o simulador de gerenciamento de memória.
 
 import os
 from gerenciador_memoria import GerenciadorMemoria
-from configuracao import Configuracao
+from configuracao import ConfiguracaoSistema, eh_potencia_de_dois
+from apresentador import Apresentador
+from erros import ErroGerenciadorMemoria
 
 
 class Simulador:
@@ -15,10 +17,12 @@ class Simulador:
         # Solicitar configurações ao usuário
         self.configurar_sistema()
 
-        # Criar gerenciador de memória
+        # Criar gerenciador de memória (silencioso: as mensagens saem pelo apresentador)
+        self.apresentador = Apresentador()
         self.gerenciador_memoria = GerenciadorMemoria(
-            Configuracao.TAMANHO_MEMORIA_FISICA,
-            Configuracao.TAMANHO_PAGINA
+            self.configuracao,
+            silencioso=True,
+            apresentador=self.apresentador
         )
 
     def configurar_sistema(self) -> None:
@@ -35,7 +39,7 @@ class Simulador:
                 mem_fisica = self.obter_entrada("Tamanho da memoria fisica (em bytes): ")
                 mem_fisica = int(mem_fisica.strip())
 
-                if not Configuracao.eh_potencia_de_dois(mem_fisica):
+                if not eh_potencia_de_dois(mem_fisica):
                     print("[ERRO] O valor deve ser potencia de 2!\n")
                     continue
 
@@ -52,7 +56,7 @@ class Simulador:
                 tam_pagina = self.obter_entrada("Tamanho da pagina/quadro (em bytes): ")
                 tam_pagina = int(tam_pagina.strip())
 
-                if not Configuracao.eh_potencia_de_dois(tam_pagina):
+                if not eh_potencia_de_dois(tam_pagina):
                     print("[ERRO] O valor deve ser potencia de 2!\n")
                     continue
 
@@ -73,7 +77,7 @@ class Simulador:
                 max_processo = self.obter_entrada("Tamanho maximo de um processo (em bytes): ")
                 max_processo = int(max_processo.strip())
 
-                if not Configuracao.eh_potencia_de_dois(max_processo):
+                if not eh_potencia_de_dois(max_processo):
                     print("[ERRO] O valor deve ser potencia de 2!\n")
                     continue
 
@@ -90,7 +94,7 @@ class Simulador:
 
         # Definir configurações
         try:
-            Configuracao.definir_configuracao(mem_fisica, tam_pagina, max_processo)
+            self.configuracao = ConfiguracaoSistema(mem_fisica, tam_pagina, max_processo)
             print("\n" + "=" * 70)
             print("[OK] Configuracao realizada com sucesso!")
             print("=" * 70)
@@ -105,9 +109,9 @@ class Simulador:
         print("       SIMULADOR DE GERENCIAMENTO DE MEMÓRIA - PAGINAÇÃO")
         print("═" * 60)
         print("\nConfigurações:")
-        print(f"  • Memória física: {Configuracao.TAMANHO_MEMORIA_FISICA} bytes")
-        print(f"  • Tamanho da página: {Configuracao.TAMANHO_PAGINA} bytes")
-        print(f"  • Tamanho máximo do processo: {Configuracao.TAMANHO_MAXIMO_PROCESSO} bytes")
+        print(f"  • Memória física: {self.configuracao.tamanho_memoria_fisica} bytes")
+        print(f"  • Tamanho da página: {self.configuracao.tamanho_pagina} bytes")
+        print(f"  • Tamanho máximo do processo: {self.configuracao.tamanho_maximo_processo} bytes")
         print("\n" + "─" * 60)
         print("1. Visualizar memória física")
         print("2. Criar processo")
@@ -159,7 +163,7 @@ class Simulador:
 
         # Solicitar tamanho do processo
         texto_tamanho = self.obter_entrada(
-            f"Informe o tamanho do processo em bytes (máx {Configuracao.TAMANHO_MAXIMO_PROCESSO}): "
+            f"Informe o tamanho do processo em bytes (máx {self.configuracao.tamanho_maximo_processo}): "
         )
 
         try:
@@ -170,14 +174,14 @@ class Simulador:
             return
 
         # Validar tamanho
-        while tamanho <= 0 or tamanho > Configuracao.TAMANHO_MAXIMO_PROCESSO:
-            if tamanho > Configuracao.TAMANHO_MAXIMO_PROCESSO:
-                print(f"\n[ERRO] Tamanho excede o máximo de {Configuracao.TAMANHO_MAXIMO_PROCESSO} bytes!")
+        while tamanho <= 0 or tamanho > self.configuracao.tamanho_maximo_processo:
+            if tamanho > self.configuracao.tamanho_maximo_processo:
+                print(f"\n[ERRO] Tamanho excede o máximo de {self.configuracao.tamanho_maximo_processo} bytes!")
             else:
                 print("\n[ERRO] Tamanho deve ser maior que zero!")
 
             texto_tamanho = self.obter_entrada(
-                f"Informe um tamanho válido (1-{Configuracao.TAMANHO_MAXIMO_PROCESSO} bytes): "
+                f"Informe um tamanho válido (1-{self.configuracao.tamanho_maximo_processo} bytes): "
             )
 
             try:
@@ -188,7 +192,11 @@ class Simulador:
                 return
 
         # Criar processo
-        self.gerenciador_memoria.criar_processo(id_processo, tamanho, Configuracao.TAMANHO_MAXIMO_PROCESSO)
+        try:
+            resultado = self.gerenciador_memoria.criar_processo(id_processo, tamanho)
+            self.apresentador.processo_criado(resultado)
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
         self.obter_entrada("\nPressione ENTER para continuar...")
 
     def menu_remover_processo(self) -> None:
@@ -217,7 +225,10 @@ class Simulador:
             return
 
         # Remover processo
-        self.gerenciador_memoria.remover_processo(id_processo)
+        try:
+            self.apresentador.processo_removido(self.gerenciador_memoria.remover_processo(id_processo))
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
         self.obter_entrada("\nPressione ENTER para continuar...")
 
     def menu_exibir_tabela_paginas(self) -> None:
@@ -295,19 +306,10 @@ class Simulador:
             return
 
         # Traduzir endereço
-        resultado = self.gerenciador_memoria.traduzir_endereco(id_processo, endereco_logico)
-
-        if resultado:
-            print("\n" + "=" * 60)
-            print("RESULTADO DA TRADUÇÃO")
-            print("=" * 60)
-            print(f"Endereço lógico:     {resultado['endereco_logico']}")
-            print(f"Número da página:    {resultado['numero_pagina']}")
-            print(f"Deslocamento:        {resultado['deslocamento']}")
-            print(f"Número do quadro:    {resultado['numero_quadro']}")
-            print(f"Endereço físico:     {resultado['endereco_fisico']}")
-            print(f"Valor armazenado:    0x{resultado['valor']:02x} ({resultado['valor']})")
-            print("=" * 60)
+        try:
+            self.apresentador.traducao(self.gerenciador_memoria.traduzir_endereco(id_processo, endereco_logico))
+        except ErroGerenciadorMemoria as erro:
+            self.apresentador.erro(erro)
 
         self.obter_entrada("\nPressione ENTER para continuar...")
 
@@ -0,0 +1,119 @@
+"""
+Implementação da área de troca (swap) usada pela paginação sob demanda.
+"""
+
+import os
+from alocador_quadros import AlocadorBitmap
+
+
+class AreaSwap:
+    """Área de swap dividida em posições do tamanho de uma página"""
+
+    def __init__(self, tamanho: int, tamanho_pagina: int, arquivo: str = None):
+        """
+        Inicializa a área de swap.
+
+        Args:
+            tamanho: Tamanho da área de swap em bytes
+            tamanho_pagina: Tamanho de cada página em bytes
+            arquivo: Caminho de um arquivo para a área de swap. Se None, a
+                área fica em um bytearray na memória do hospedeiro.
+        """
+        self.tamanho_pagina = tamanho_pagina
+        self.total_posicoes = tamanho // tamanho_pagina
+        self.arquivo = arquivo
+        self.posicoes = AlocadorBitmap(self.total_posicoes)
+        self.bytes_lidos = 0
+        self.bytes_gravados = 0
+
+        if arquivo is None:
+            self._dados = memoryview(bytearray(self.total_posicoes * tamanho_pagina))
+            self._descritor = None
+        else:
+            self._dados = None
+            self._descritor = os.open(arquivo, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.ftruncate(self._descritor, self.total_posicoes * tamanho_pagina)
+
+    def alocar_posicao(self) -> int:
+        """
+        Reserva uma posição livre.
+
+        Returns:
+            Número da posição ou None se a área estiver cheia
+        """
+        posicoes = self.posicoes.alocar(1)
+        return posicoes[0] if posicoes else None
+
+    def liberar_posicao(self, posicao: int) -> None:
+        """Devolve uma posição à área de swap"""
+        self.posicoes.liberar((posicao,))
+
+    def gravar(self, posicao: int, dados) -> None:
+        """
+        Grava uma página em uma posição.
+
+        Args:
+            posicao: Número da posição
+            dados: Bytes da página (bytes, bytearray ou memoryview)
+        """
+        inicio = posicao * self.tamanho_pagina
+        if self._descritor is None:
+            self._dados[inicio:inicio + len(dados)] = dados
+        else:
+            os.pwrite(self._descritor, dados, inicio)
+        self.bytes_gravados += len(dados)
+
+    def ler(self, posicao: int, destino) -> None:
+        """
+        Lê a página de uma posição diretamente para um buffer.
+
+        Args:
+            posicao: Número da posição
+            destino: memoryview gravável do tamanho de uma página
+        """
+        inicio = posicao * self.tamanho_pagina
+        if self._descritor is None:
+            destino[:] = self._dados[inicio:inicio + self.tamanho_pagina]
+        else:
+            os.preadv(self._descritor, [destino], inicio)
+        self.bytes_lidos += self.tamanho_pagina
+
+    def ler_bloco(self, inicio: int, tamanho: int) -> bytes:
+        """Lê bytes brutos da área, sem contar nas estatísticas de E/S"""
+        if self._descritor is None:
+            return self._dados[inicio:inicio + tamanho]
+        return os.pread(self._descritor, tamanho, inicio)
+
+    def gravar_bloco(self, inicio: int, dados) -> None:
+        """Grava bytes brutos na área, sem contar nas estatísticas de E/S"""
+        if self._descritor is None:
+            self._dados[inicio:inicio + len(dados)] = dados
+        else:
+            os.pwrite(self._descritor, dados, inicio)
+
+    def num_livres(self) -> int:
+        """Retorna a quantidade de posições livres"""
+        return self.posicoes.num_livres()
+
+    def fechar(self) -> None:
+        """Fecha o arquivo de swap (se houver)"""
+        if self._descritor is not None:
+            os.close(self._descritor)
+            self._descritor = None
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna a ocupação e o volume de E/S da área de swap.
+
+        Returns:
+            Dicionário com posições e bytes lidos/gravados
+        """
+        return {
+            'total_posicoes': self.total_posicoes,
+            'posicoes_livres': self.num_livres(),
+            'bytes_lidos': self.bytes_lidos,
+            'bytes_gravados': self.bytes_gravados
+        }
+
+    def __repr__(self):
+        return f"AreaSwap(posicoes={self.total_posicoes}, livres={self.num_livres()})"
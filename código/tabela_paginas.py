@@ -2,37 +2,189 @@
 Implementação da tabela de páginas e suas entradas.
 """
 
+import sys
+from array import array
+
+
 class EntradaTabelaPaginas:
     """Entrada na tabela de páginas"""
 
-    def __init__(self, numero_quadro: int):
+    __slots__ = ('numero_quadro', 'carregada', 'valida', 'presente', 'referenciada', 'posicao_swap',
+                 'paginas')
+
+    def __init__(self, numero_quadro: int, carregada: bool = True):
         """
         Inicializa uma entrada da tabela de páginas.
 
         Args:
-            numero_quadro: Número do quadro na memória física
+            numero_quadro: Número do quadro na memória física (None se a
+                página ainda não estiver na memória)
+            carregada: Se o conteúdo da página já foi copiado para o quadro
         """
         self.numero_quadro = numero_quadro
+        self.carregada = carregada and numero_quadro is not None
+        self.valida = True
+        self.presente = numero_quadro is not None
+        self.referenciada = False  # bit de referência (usado pelo Clock)
+        self.posicao_swap = None  # posição na área de swap, se a página foi despejada
+        self.paginas = 1  # páginas base cobertas (> 1 em uma página grande)
 
     def __repr__(self):
+        if not self.presente:
+            return f"EntradaTabelaPaginas(ausente, swap={self.posicao_swap})"
+        if self.paginas > 1:
+            return f"EntradaTabelaPaginas(quadro={self.numero_quadro}, paginas={self.paginas})"
         return f"EntradaTabelaPaginas(quadro={self.numero_quadro})"
 
 
 class TabelaPaginas:
-    """Tabela de páginas de um processo"""
+    """
+    Tabela de páginas de um processo.
+
+    Uma página grande (paginas_grandes páginas base contíguas e alinhadas,
+    em quadros também contíguos e alinhados) é uma única entrada
+    compartilhada pelas posições que ela cobre. Qualquer mudança do
+    mapeamento de uma dessas páginas (despejo, cópia na escrita, mesclagem)
+    divide a página grande em entradas comuns antes de ser aplicada.
+    """
+
+    divisoes = 0  # páginas grandes divididas em páginas base
 
     def __init__(self):
         """Inicializa uma tabela de páginas vazia"""
         self.entradas = []
 
-    def adicionar_entrada(self, numero_quadro: int) -> None:
+    def adicionar_entrada(self, numero_quadro: int, carregada: bool = True) -> None:
         """
         Adiciona uma nova entrada na tabela de páginas.
 
         Args:
-            numero_quadro: Número do quadro a ser mapeado
+            numero_quadro: Número do quadro a ser mapeado (None para uma
+                página válida que ainda não está na memória)
+            carregada: Se o conteúdo da página já está no quadro
+        """
+        self.entradas.append(EntradaTabelaPaginas(numero_quadro, carregada))
+
+    def adicionar_entrada_grande(self, numero_quadro: int, paginas: int, carregada: bool = True) -> None:
+        """
+        Adiciona uma página grande cobrindo as próximas páginas da tabela.
+
+        Args:
+            numero_quadro: Primeiro quadro do bloco (alinhado a paginas)
+            paginas: Páginas base cobertas (potência de 2)
+            carregada: Se o conteúdo das páginas já está nos quadros
+        """
+        entrada = EntradaTabelaPaginas(numero_quadro, carregada)
+        entrada.paginas = paginas
+        self.entradas.extend([entrada] * paginas)
+
+    def extensao(self, numero_pagina: int) -> tuple:
+        """
+        Retorna a primeira página e o número de páginas base da entrada que
+        mapeia a página ((numero_pagina, 1) para uma página comum).
+        """
+        paginas = self.entradas[numero_pagina].paginas
+        return numero_pagina & ~(paginas - 1), paginas
+
+    def num_paginas_grandes(self) -> int:
+        """Retorna quantas páginas grandes a tabela mapeia"""
+        return sum(1 for num_pag, entrada in enumerate(self.entradas)
+                   if entrada.paginas > 1 and not num_pag & (entrada.paginas - 1))
+
+    def bytes_economizados_paginas_grandes(self) -> int:
+        """Memória do hospedeiro poupada pelas páginas grandes, em bytes"""
+        economizadas = sum(entrada.paginas - 1 for num_pag, entrada in enumerate(self.entradas)
+                           if entrada.paginas > 1 and not num_pag & (entrada.paginas - 1))
+        return economizadas * sys.getsizeof(EntradaTabelaPaginas(None))
+
+    def _entrada_base(self, numero_pagina: int) -> EntradaTabelaPaginas:
+        """Retorna a entrada da página, dividindo antes a página grande que a contém"""
+        entrada = self.entradas[numero_pagina]
+        if entrada.paginas == 1:
+            return entrada
+
+        inicio = numero_pagina & ~(entrada.paginas - 1)
+        for indice in range(entrada.paginas):
+            nova = EntradaTabelaPaginas(entrada.numero_quadro + indice, entrada.carregada)
+            nova.referenciada = entrada.referenciada
+            self.entradas[inicio + indice] = nova
+        self.divisoes += 1
+        return self.entradas[numero_pagina]
+
+    def esta_presente(self, numero_pagina: int) -> bool:
+        """Verifica se a página está mapeada em um quadro da memória física"""
+        return self.entradas[numero_pagina].presente
+
+    def mapear(self, numero_pagina: int, numero_quadro: int) -> None:
+        """
+        Mapeia uma página ausente em um quadro (após uma falta de página).
+
+        Args:
+            numero_pagina: Número da página lógica
+            numero_quadro: Número do quadro que passa a conter a página
+        """
+        entrada = self._entrada_base(numero_pagina)
+        entrada.numero_quadro = numero_quadro
+        entrada.presente = True
+        entrada.carregada = True
+
+    def desmapear(self, numero_pagina: int, posicao_swap: int = None) -> None:
+        """
+        Retira uma página da memória física.
+
+        Args:
+            numero_pagina: Número da página lógica
+            posicao_swap: Posição da área de swap que guarda a página, ou None
+                se ela pode ser recriada a partir da memória lógica do processo
+        """
+        entrada = self._entrada_base(numero_pagina)
+        entrada.numero_quadro = None
+        entrada.presente = False
+        entrada.carregada = False
+        entrada.referenciada = False
+        entrada.posicao_swap = posicao_swap
+
+    def marcar_referenciada(self, numero_pagina: int) -> None:
+        """Liga o bit de referência da página"""
+        self.entradas[numero_pagina].referenciada = True
+
+    def limpar_referenciada(self, numero_pagina: int) -> bool:
         """
-        self.entradas.append(EntradaTabelaPaginas(numero_quadro))
+        Desliga o bit de referência da página.
+
+        Returns:
+            Valor do bit antes de ser desligado
+        """
+        entrada = self.entradas[numero_pagina]
+        referenciada = entrada.referenciada
+        entrada.referenciada = False
+        return referenciada
+
+    def obter_posicao_swap(self, numero_pagina: int) -> int:
+        """Retorna a posição de swap da página ou None"""
+        return self.entradas[numero_pagina].posicao_swap
+
+    def definir_posicao_swap(self, numero_pagina: int, posicao_swap: int) -> None:
+        """Define (ou limpa, com None) a posição de swap da página"""
+        self._entrada_base(numero_pagina).posicao_swap = posicao_swap
+
+    def quadros_mapeados(self) -> list:
+        """Retorna os quadros das páginas presentes, na ordem das páginas"""
+        return [entrada.numero_quadro + (num_pag & (entrada.paginas - 1))
+                for num_pag, entrada in enumerate(self.entradas) if entrada.presente]
+
+    def posicoes_swap(self) -> list:
+        """Retorna as posições de swap ocupadas pelas páginas da tabela"""
+        return [entrada.posicao_swap for entrada in self.entradas
+                if entrada.posicao_swap is not None]
+
+    def esta_carregada(self, numero_pagina: int) -> bool:
+        """Verifica se o conteúdo da página já foi copiado para o quadro"""
+        return self.entradas[numero_pagina].carregada
+
+    def marcar_carregada(self, numero_pagina: int) -> None:
+        """Marca a página como carregada no quadro"""
+        self.entradas[numero_pagina].carregada = True
 
     def obter_numero_quadro(self, numero_pagina: int) -> int:
         """
@@ -42,16 +194,33 @@ class TabelaPaginas:
             numero_pagina: Número da página lógica
 
         Returns:
-            Número do quadro ou None se a página não existir
+            Número do quadro ou None se a página não existir ou não estiver presente
         """
         if 0 <= numero_pagina < len(self.entradas):
-            return self.entradas[numero_pagina].numero_quadro
+            entrada = self.entradas[numero_pagina]
+            if entrada.paginas == 1 or entrada.numero_quadro is None:
+                return entrada.numero_quadro
+            return entrada.numero_quadro + (numero_pagina & (entrada.paginas - 1))
         return None
 
     def obter_num_paginas(self) -> int:
         """Retorna o número de páginas na tabela"""
         return len(self.entradas)
 
+    def descartar(self) -> None:
+        """Libera estruturas compartilhadas quando o processo é removido"""
+
+    def tamanho_bytes(self) -> int:
+        """Estima a memória do hospedeiro ocupada pela tabela, em bytes"""
+        # Uma página grande é um único objeto, contado uma vez
+        return sys.getsizeof(self.entradas) + sum(
+            sys.getsizeof(e) for num_pag, e in enumerate(self.entradas) if not num_pag & (e.paginas - 1)
+        )
+
+    def profundidade_percurso(self) -> float:
+        """Número médio de acessos à memória para percorrer a tabela"""
+        return 1.0
+
     def exibir(self) -> str:
         """
         Retorna uma representação formatada da tabela de páginas.
@@ -65,8 +234,14 @@ class TabelaPaginas:
             "+--------------+--------------+"
         ]
 
-        for num_pag, entrada in enumerate(self.entradas):
-            linha = f"| {num_pag:>12} | {entrada.numero_quadro:>12} |"
+        for num_pag in range(self.obter_num_paginas()):
+            if self.esta_presente(num_pag):
+                quadro = self.obter_numero_quadro(num_pag)
+            elif self.obter_posicao_swap(num_pag) is not None:
+                quadro = f"swap {self.obter_posicao_swap(num_pag)}"
+            else:
+                quadro = "-"
+            linha = f"| {num_pag:>12} | {quadro:>12} |"
             saida.append(linha)
 
         saida.append("+--------------+--------------+")
@@ -74,3 +249,700 @@ class TabelaPaginas:
 
     def __repr__(self):
         return f"TabelaPaginas(entradas={len(self.entradas)})"
+
+
+class TabelaPaginasCompacta(TabelaPaginas):
+    """
+    Tabela de páginas compacta: uma palavra de 32 bits por página em um
+    array('I') pré-alocado com o número de páginas do processo.
+
+    Os 6 bits mais altos guardam as flags e os 26 bits restantes guardam o
+    número do quadro (página presente) ou a posição de swap (página
+    despejada), como em uma PTE de hardware.
+
+    As páginas base de uma página grande mantêm uma palavra cada (com o
+    próprio quadro), marcadas com GRANDE: o array é denso, então aqui a
+    página grande não economiza memória, só informa a extensão à TLB.
+    """
+
+    VALIDA = 1 << 31
+    PRESENTE = 1 << 30
+    CARREGADA = 1 << 29
+    REFERENCIADA = 1 << 28
+    EM_SWAP = 1 << 27
+    GRANDE = 1 << 26
+    BITS_NUMERO = 26
+    MASCARA_NUMERO = (1 << BITS_NUMERO) - 1
+
+    paginas_grandes = 1  # páginas base por página grande (definido na primeira)
+
+    def __init__(self, num_paginas: int):
+        """
+        Inicializa a tabela com todas as entradas inválidas.
+
+        Args:
+            num_paginas: Número de páginas do processo
+        """
+        self.palavras = array('I', bytes(4 * num_paginas))
+        self.num_entradas = 0
+
+    def _numero(self, numero: int) -> int:
+        if numero > self.MASCARA_NUMERO:
+            raise ValueError(f"Numero {numero} nao cabe em {self.BITS_NUMERO} bits da tabela compacta")
+        return numero
+
+    @property
+    def entradas(self) -> list:
+        """Entradas como objetos EntradaTabelaPaginas (cópia, para depuração)"""
+        entradas = []
+        for num_pag in range(self.num_entradas):
+            entrada = EntradaTabelaPaginas(self.obter_numero_quadro(num_pag),
+                                           self.esta_carregada(num_pag))
+            entrada.referenciada = bool(self.palavras[num_pag] & self.REFERENCIADA)
+            entrada.posicao_swap = self.obter_posicao_swap(num_pag)
+            entradas.append(entrada)
+        return entradas
+
+    def adicionar_entrada(self, numero_quadro: int, carregada: bool = True) -> None:
+        if self.num_entradas == len(self.palavras):
+            self.palavras.append(0)
+
+        palavra = self.VALIDA
+        if numero_quadro is not None:
+            palavra |= self.PRESENTE | self._numero(numero_quadro)
+            if carregada:
+                palavra |= self.CARREGADA
+
+        self.palavras[self.num_entradas] = palavra
+        self.num_entradas += 1
+
+    def _palavra_grande(self, numero_quadro: int, paginas: int, carregada: bool) -> int:
+        self._numero(numero_quadro + paginas - 1)
+        self.paginas_grandes = paginas
+        palavra = self.VALIDA | self.PRESENTE | self.GRANDE | numero_quadro
+        if carregada:
+            palavra |= self.CARREGADA
+        return palavra
+
+    def adicionar_entrada_grande(self, numero_quadro: int, paginas: int, carregada: bool = True) -> None:
+        palavra = self._palavra_grande(numero_quadro, paginas, carregada)
+        for indice in range(paginas):
+            if self.num_entradas == len(self.palavras):
+                self.palavras.append(0)
+            self.palavras[self.num_entradas] = palavra + indice
+            self.num_entradas += 1
+
+    def extensao(self, numero_pagina: int) -> tuple:
+        if self.palavras[numero_pagina] & self.GRANDE:
+            return numero_pagina & ~(self.paginas_grandes - 1), self.paginas_grandes
+        return numero_pagina, 1
+
+    def num_paginas_grandes(self) -> int:
+        if self.paginas_grandes == 1:
+            return 0
+        return sum(1 for num_pag in range(0, self.num_entradas, self.paginas_grandes)
+                   if self.palavras[num_pag] & self.GRANDE)
+
+    def bytes_economizados_paginas_grandes(self) -> int:
+        return 0
+
+    def _dividir(self, numero_pagina: int) -> None:
+        """Tira a marca GRANDE das páginas base da página grande que contém a página"""
+        inicio, paginas = self.extensao(numero_pagina)
+        if paginas > 1:
+            for num_pag in range(inicio, inicio + paginas):
+                self.palavras[num_pag] &= ~self.GRANDE
+            self.divisoes += 1
+
+    def esta_presente(self, numero_pagina: int) -> bool:
+        return bool(self.palavras[numero_pagina] & self.PRESENTE)
+
+    def mapear(self, numero_pagina: int, numero_quadro: int) -> None:
+        self._dividir(numero_pagina)
+        palavra = self.palavras[numero_pagina] & self.REFERENCIADA
+        self.palavras[numero_pagina] = (
+            palavra | self.VALIDA | self.PRESENTE | self.CARREGADA | self._numero(numero_quadro)
+        )
+
+    def desmapear(self, numero_pagina: int, posicao_swap: int = None) -> None:
+        self._dividir(numero_pagina)
+        palavra = self.VALIDA
+        if posicao_swap is not None:
+            palavra |= self.EM_SWAP | self._numero(posicao_swap)
+        self.palavras[numero_pagina] = palavra
+
+    def marcar_referenciada(self, numero_pagina: int) -> None:
+        self.palavras[numero_pagina] |= self.REFERENCIADA
+
+    def limpar_referenciada(self, numero_pagina: int) -> bool:
+        palavra = self.palavras[numero_pagina]
+        self.palavras[numero_pagina] = palavra & ~self.REFERENCIADA
+        return bool(palavra & self.REFERENCIADA)
+
+    def obter_posicao_swap(self, numero_pagina: int) -> int:
+        palavra = self.palavras[numero_pagina]
+        if palavra & self.EM_SWAP:
+            return palavra & self.MASCARA_NUMERO
+        return None
+
+    def definir_posicao_swap(self, numero_pagina: int, posicao_swap: int) -> None:
+        # A posição de swap só existe em páginas ausentes; ao limpá-la, a
+        # página volta a ser recriada a partir da memória lógica
+        palavra = self.palavras[numero_pagina]
+        if palavra & self.PRESENTE:
+            if posicao_swap is not None:
+                raise ValueError("Pagina presente nao pode ter posicao de swap na tabela compacta")
+            return
+
+        palavra &= ~(self.EM_SWAP | self.MASCARA_NUMERO)
+        if posicao_swap is not None:
+            palavra |= self.EM_SWAP | self._numero(posicao_swap)
+        self.palavras[numero_pagina] = palavra
+
+    def quadros_mapeados(self) -> list:
+        presente = self.PRESENTE
+        mascara = self.MASCARA_NUMERO
+        return [palavra & mascara for palavra in self.palavras[:self.num_entradas]
+                if palavra & presente]
+
+    def posicoes_swap(self) -> list:
+        em_swap = self.EM_SWAP
+        mascara = self.MASCARA_NUMERO
+        return [palavra & mascara for palavra in self.palavras[:self.num_entradas]
+                if palavra & em_swap]
+
+    def esta_carregada(self, numero_pagina: int) -> bool:
+        return bool(self.palavras[numero_pagina] & self.CARREGADA)
+
+    def marcar_carregada(self, numero_pagina: int) -> None:
+        self.palavras[numero_pagina] |= self.CARREGADA
+
+    def obter_numero_quadro(self, numero_pagina: int) -> int:
+        if 0 <= numero_pagina < self.num_entradas:
+            palavra = self.palavras[numero_pagina]
+            if palavra & self.PRESENTE:
+                return palavra & self.MASCARA_NUMERO
+        return None
+
+    def obter_num_paginas(self) -> int:
+        return self.num_entradas
+
+    def tamanho_bytes(self) -> int:
+        return sys.getsizeof(self.palavras)
+
+    def __repr__(self):
+        return f"TabelaPaginasCompacta(entradas={self.num_entradas})"
+
+
+class _ArvoreRadix:
+    """
+    Diretório hierárquico de palavras de 32 bits usado pela tabela multinível.
+
+    Os níveis superiores consomem bits_por_nivel bits do número da página e
+    as folhas bits_folha bits. Os nós intermediários são listas e as folhas
+    são array('I'), criadas apenas quando alguma entrada da folha recebe um
+    valor diferente do padrão.
+
+    Uma página grande do tamanho de uma folha é guardada como uma única
+    palavra no lugar da folha (como uma PDE de página grande do x86): a
+    palavra de cada página base é essa palavra mais o deslocamento. Gravar
+    uma palavra que continue marcada com bit_grande e com o mesmo quadro
+    atualiza a palavra compartilhada; qualquer outra gravação materializa a
+    folha antes.
+    """
+
+    def __init__(self, niveis: int, bits_por_nivel: int, padrao: int, bits_folha: int = None,
+                 bit_grande: int = 0, mascara_numero: int = 0):
+        self.niveis = niveis
+        self.bits_por_nivel = bits_por_nivel
+        self.bits_folha = bits_por_nivel if bits_folha is None else bits_folha
+        self.mascara_folha = (1 << self.bits_folha) - 1
+        self.padrao = padrao
+        self.bit_grande = bit_grande
+        self.mascara_numero = mascara_numero
+        self.raiz = [None] * (1 << bits_por_nivel)
+        self.num_nos = 1
+        self.num_folhas = 0
+
+        # (deslocamento, máscara) de cada nível acima das folhas
+        mascara = (1 << bits_por_nivel) - 1
+        self._superiores = [(self.bits_folha + bits_por_nivel * nivel, mascara)
+                            for nivel in range(niveis - 2, -1, -1)]
+
+    def __getitem__(self, numero_pagina: int) -> int:
+        no = self.raiz
+        for deslocamento, mascara in self._superiores:
+            no = no[(numero_pagina >> deslocamento) & mascara]
+            if no is None:
+                return self.padrao
+        if no.__class__ is int:
+            return no + (numero_pagina & self.mascara_folha)
+        return no[numero_pagina & self.mascara_folha]
+
+    def _pai_da_folha(self, numero_pagina: int, criar: bool) -> tuple:
+        """Retorna (nó, índice) da posição que guarda a folha, ou None"""
+        no = self.raiz
+        ultimo = len(self._superiores) - 1
+        for profundidade, (deslocamento, mascara) in enumerate(self._superiores):
+            indice = (numero_pagina >> deslocamento) & mascara
+            if profundidade == ultimo:
+                return no, indice
+            filho = no[indice]
+            if filho is None:
+                if not criar:
+                    return None
+                filho = [None] * (1 << self.bits_por_nivel)
+                self.num_nos += 1
+                no[indice] = filho
+            no = filho
+
+    def __setitem__(self, numero_pagina: int, palavra: int) -> None:
+        posicao = self._pai_da_folha(numero_pagina, palavra != self.padrao)
+        if posicao is None:
+            return  # nada a gravar em um ramo ainda inexistente
+        no, indice = posicao
+        folha = no[indice]
+        deslocamento = numero_pagina & self.mascara_folha
+
+        if folha is None:
+            if palavra == self.padrao:
+                return
+            folha = array('I', [self.padrao]) * (1 << self.bits_folha)
+            self.num_folhas += 1
+            no[indice] = folha
+        elif folha.__class__ is int:
+            base = palavra - deslocamento
+            if palavra & self.bit_grande and (base ^ folha) & self.mascara_numero == 0:
+                no[indice] = base
+                return
+            folha = array('I', range(folha, folha + (1 << self.bits_folha)))
+            self.num_folhas += 1
+            no[indice] = folha
+
+        folha[deslocamento] = palavra
+
+    def definir_grande(self, numero_pagina: int, palavra: int) -> None:
+        """Guarda uma página grande (alinhada à folha) como uma única palavra"""
+        no, indice = self._pai_da_folha(numero_pagina, True)
+        if no[indice] is not None and no[indice].__class__ is not int:
+            self.num_folhas -= 1
+        no[indice] = palavra
+
+    def percorrer(self):
+        """
+        Percorre as folhas existentes, com a primeira página de cada uma;
+        uma página grande aparece como a palavra (int) no lugar da folha.
+        """
+        pilha = [(self.raiz, 0, 1)]
+        while pilha:
+            no, base, profundidade = pilha.pop()
+            for indice in range(len(no) - 1, -1, -1):
+                filho = no[indice]
+                if filho is None:
+                    continue
+                inicio = (base << self.bits_por_nivel) | indice
+                if profundidade == self.niveis - 1:
+                    yield inicio << self.bits_folha, filho
+                else:
+                    pilha.append((filho, inicio, profundidade + 1))
+
+    def folhas(self):
+        """Percorre as folhas com a primeira página de cada uma (páginas grandes expandidas)"""
+        for inicio, folha in self.percorrer():
+            if folha.__class__ is int:
+                folha = array('I', range(folha, folha + (1 << self.bits_folha)))
+            yield inicio, folha
+
+    def capacidade(self) -> int:
+        """Número de páginas endereçáveis pela árvore"""
+        return 1 << (self.bits_por_nivel * (self.niveis - 1) + self.bits_folha)
+
+    def tamanho_folha(self) -> int:
+        """Memória do hospedeiro ocupada por uma folha, em bytes"""
+        return sys.getsizeof(array('I', bytes(4 << self.bits_folha)))
+
+    def tamanho_bytes(self) -> int:
+        tamanho_no = sys.getsizeof([None] * (1 << self.bits_por_nivel))
+        return self.num_nos * tamanho_no + self.num_folhas * self.tamanho_folha()
+
+
+class TabelaPaginasMultinivel(TabelaPaginasCompacta):
+    """
+    Tabela de páginas hierárquica (2 ou 3 níveis) com entradas compactas.
+
+    Usa a mesma codificação de 32 bits da tabela compacta, mas as entradas
+    ficam em folhas de uma árvore radix. Páginas válidas que nunca foram
+    mapeadas nem despejadas não ocupam folha, então espaços de
+    endereçamento grandes e pouco usados custam pouca memória.
+    """
+
+    def __init__(self, num_paginas: int, niveis: int = 2, paginas_grandes: int = 1):
+        """
+        Inicializa a tabela hierárquica vazia.
+
+        Args:
+            num_paginas: Número de páginas do processo
+            niveis: Número de níveis da árvore (2 ou 3)
+            paginas_grandes: Páginas base por página grande; se > 1, as
+                folhas têm esse tamanho e cada página grande ocupa uma única
+                palavra no nível de cima
+
+        Raises:
+            ValueError: Se o número de níveis for inválido
+        """
+        if niveis not in (2, 3):
+            raise ValueError("Tabela multinivel deve ter 2 ou 3 niveis")
+
+        bits_pagina = max(num_paginas - 1, 1).bit_length()
+        if paginas_grandes > 1:
+            bits_folha = paginas_grandes.bit_length() - 1
+            bits_por_nivel = max(-(-(bits_pagina - bits_folha) // (niveis - 1)), 1)
+        else:
+            bits_por_nivel = -(-bits_pagina // niveis)
+            bits_folha = bits_por_nivel
+        self.niveis = niveis
+        self.palavras = self._nova_arvore(bits_por_nivel, bits_folha)
+        self.num_entradas = 0
+
+    def _nova_arvore(self, bits_por_nivel: int, bits_folha: int) -> _ArvoreRadix:
+        return _ArvoreRadix(self.niveis, bits_por_nivel, self.VALIDA, bits_folha,
+                            self.GRANDE, self.MASCARA_NUMERO)
+
+    def adicionar_entrada(self, numero_quadro: int, carregada: bool = True) -> None:
+        if self.num_entradas == self.palavras.capacidade():
+            self._crescer()
+
+        self.num_entradas += 1
+        if numero_quadro is not None:
+            palavra = self.VALIDA | self.PRESENTE | self._numero(numero_quadro)
+            if carregada:
+                palavra |= self.CARREGADA
+            self.palavras[self.num_entradas - 1] = palavra
+
+    def adicionar_entrada_grande(self, numero_quadro: int, paginas: int, carregada: bool = True) -> None:
+        while self.num_entradas + paginas > self.palavras.capacidade():
+            self._crescer()
+
+        palavra = self._palavra_grande(numero_quadro, paginas, carregada)
+        if paginas == 1 << self.palavras.bits_folha:
+            self.palavras.definir_grande(self.num_entradas, palavra)
+        else:
+            for indice in range(paginas):
+                self.palavras[self.num_entradas + indice] = palavra + indice
+        self.num_entradas += paginas
+
+    def bytes_economizados_paginas_grandes(self) -> int:
+        grandes = sum(1 for _, folha in self.palavras.percorrer() if folha.__class__ is int)
+        return grandes * self.palavras.tamanho_folha()
+
+    def _crescer(self) -> None:
+        """
+        Refaz a árvore com um bit a mais por nível superior quando as
+        entradas acrescentadas depois da criação (ex.: segmentos anexados)
+        não cabem.
+        """
+        antiga = self.palavras
+        self.palavras = self._nova_arvore(antiga.bits_por_nivel + 1, antiga.bits_folha)
+        for inicio, folha in antiga.percorrer():
+            if folha.__class__ is int:
+                self.palavras.definir_grande(inicio, folha)
+                continue
+            for indice, palavra in enumerate(folha):
+                if palavra != self.VALIDA:
+                    self.palavras[inicio + indice] = palavra
+
+    def quadros_mapeados(self) -> list:
+        presente = self.PRESENTE
+        mascara = self.MASCARA_NUMERO
+        mapeados = []
+        for inicio, folha in self.palavras.folhas():
+            mapeados.extend(
+                (inicio + indice, palavra & mascara) for indice, palavra in enumerate(folha)
+                if palavra & presente and inicio + indice < self.num_entradas
+            )
+        return [quadro for _, quadro in sorted(mapeados)]
+
+    def posicoes_swap(self) -> list:
+        em_swap = self.EM_SWAP
+        mascara = self.MASCARA_NUMERO
+        return [palavra & mascara for _, folha in self.palavras.folhas()
+                for palavra in folha if palavra & em_swap]
+
+    def tamanho_bytes(self) -> int:
+        return self.palavras.tamanho_bytes()
+
+    def profundidade_percurso(self) -> float:
+        return float(self.niveis)
+
+    def __repr__(self):
+        return f"TabelaPaginasMultinivel(entradas={self.num_entradas}, niveis={self.niveis})"
+
+
+class TabelaInvertida:
+    """
+    Tabela de páginas invertida (hashed), compartilhada por todos os
+    processos: uma entrada por quadro da memória física.
+
+    O par (id_processo, numero_pagina) é espalhado em uma tabela de âncoras
+    e as colisões são encadeadas pelos próprios quadros, como nas tabelas
+    invertidas do PowerPC. O tamanho não depende do espaço lógico dos
+    processos, apenas da memória física.
+    """
+
+    OCUPADO = 1
+    CARREGADA = 2
+    REFERENCIADA = 4
+
+    def __init__(self, total_quadros: int):
+        """
+        Inicializa a tabela com todos os quadros vazios.
+
+        Args:
+            total_quadros: Número de quadros da memória física
+        """
+        self.total_quadros = total_quadros
+        tamanho_hash = 1 << max(total_quadros - 1, 1).bit_length()
+        self.mascara_hash = tamanho_hash - 1
+        self.ancoras = array('q', [-1]) * tamanho_hash
+        self.proximo = array('q', [-1]) * total_quadros
+        self.id_processo = array('q', [0]) * total_quadros
+        self.numero_pagina = array('q', [0]) * total_quadros
+        self.flags = bytearray(total_quadros)
+        self.buscas = 0
+        self.sondagens = 0
+
+    def _hash(self, id_processo: int, numero_pagina: int) -> int:
+        return ((id_processo * 0x9E3779B1) ^ (numero_pagina * 0x85EBCA6B)) & self.mascara_hash
+
+    def buscar(self, id_processo: int, numero_pagina: int) -> int:
+        """
+        Procura o quadro que contém a página.
+
+        Returns:
+            Número do quadro ou None se a página não estiver na memória
+        """
+        self.buscas += 1
+        quadro = self.ancoras[self._hash(id_processo, numero_pagina)]
+
+        while quadro != -1:
+            self.sondagens += 1
+            if self.numero_pagina[quadro] == numero_pagina and self.id_processo[quadro] == id_processo:
+                return quadro
+            quadro = self.proximo[quadro]
+
+        return None
+
+    def inserir(self, id_processo: int, numero_pagina: int, numero_quadro: int,
+                carregada: bool = True) -> None:
+        """Registra que o quadro passou a conter a página"""
+        indice = self._hash(id_processo, numero_pagina)
+        self.id_processo[numero_quadro] = id_processo
+        self.numero_pagina[numero_quadro] = numero_pagina
+        self.flags[numero_quadro] = self.OCUPADO | (self.CARREGADA if carregada else 0)
+        self.proximo[numero_quadro] = self.ancoras[indice]
+        self.ancoras[indice] = numero_quadro
+
+    def remover(self, id_processo: int, numero_pagina: int) -> int:
+        """
+        Retira a página da tabela.
+
+        Returns:
+            Número do quadro que ela ocupava ou None
+        """
+        indice = self._hash(id_processo, numero_pagina)
+        anterior = -1
+        quadro = self.ancoras[indice]
+
+        while quadro != -1:
+            if self.numero_pagina[quadro] == numero_pagina and self.id_processo[quadro] == id_processo:
+                if anterior == -1:
+                    self.ancoras[indice] = self.proximo[quadro]
+                else:
+                    self.proximo[anterior] = self.proximo[quadro]
+                self.proximo[quadro] = -1
+                self.flags[quadro] = 0
+                return quadro
+            anterior = quadro
+            quadro = self.proximo[quadro]
+
+        return None
+
+    def tamanho_bytes(self) -> int:
+        """Memória do hospedeiro ocupada pela tabela, em bytes"""
+        return sum(sys.getsizeof(estrutura) for estrutura in (
+            self.ancoras, self.proximo, self.id_processo, self.numero_pagina, self.flags
+        ))
+
+    def profundidade_percurso(self) -> float:
+        """Número médio de entradas examinadas por busca"""
+        return self.sondagens / self.buscas if self.buscas else 0.0
+
+    def __repr__(self):
+        return f"TabelaInvertida(quadros={self.total_quadros})"
+
+
+class TabelaPaginasInvertida(TabelaPaginas):
+    """
+    Visão de um processo sobre a tabela invertida global.
+
+    As páginas presentes ficam na TabelaInvertida; apenas as posições de
+    swap das páginas despejadas são guardadas por processo.
+    """
+
+    def __init__(self, tabela_invertida: TabelaInvertida, id_processo: int):
+        """
+        Inicializa a visão vazia.
+
+        Args:
+            tabela_invertida: Tabela invertida do gerenciador de memória
+            id_processo: Processo dono da visão
+        """
+        self.tabela_invertida = tabela_invertida
+        self.id_processo = id_processo
+        self.num_entradas = 0
+        self.swap = {}  # numero_pagina -> posicao_swap
+
+    @property
+    def entradas(self) -> list:
+        entradas = []
+        for num_pag in range(self.num_entradas):
+            entrada = EntradaTabelaPaginas(self.obter_numero_quadro(num_pag),
+                                           self.esta_carregada(num_pag))
+            entrada.posicao_swap = self.swap.get(num_pag)
+            entradas.append(entrada)
+        return entradas
+
+    def _quadro(self, numero_pagina: int) -> int:
+        return self.tabela_invertida.buscar(self.id_processo, numero_pagina)
+
+    def adicionar_entrada_grande(self, numero_quadro: int, paginas: int, carregada: bool = True) -> None:
+        raise ValueError("A tabela invertida nao suporta paginas grandes")
+
+    def extensao(self, numero_pagina: int) -> tuple:
+        return numero_pagina, 1
+
+    def num_paginas_grandes(self) -> int:
+        return 0
+
+    def bytes_economizados_paginas_grandes(self) -> int:
+        return 0
+
+    def adicionar_entrada(self, numero_quadro: int, carregada: bool = True) -> None:
+        if numero_quadro is not None:
+            self.tabela_invertida.inserir(self.id_processo, self.num_entradas, numero_quadro, carregada)
+        self.num_entradas += 1
+
+    def esta_presente(self, numero_pagina: int) -> bool:
+        return self._quadro(numero_pagina) is not None
+
+    def mapear(self, numero_pagina: int, numero_quadro: int) -> None:
+        self.tabela_invertida.inserir(self.id_processo, numero_pagina, numero_quadro)
+
+    def desmapear(self, numero_pagina: int, posicao_swap: int = None) -> None:
+        self.tabela_invertida.remover(self.id_processo, numero_pagina)
+        self.definir_posicao_swap(numero_pagina, posicao_swap)
+
+    def marcar_referenciada(self, numero_pagina: int) -> None:
+        quadro = self._quadro(numero_pagina)
+        if quadro is not None:
+            self.tabela_invertida.flags[quadro] |= TabelaInvertida.REFERENCIADA
+
+    def limpar_referenciada(self, numero_pagina: int) -> bool:
+        quadro = self._quadro(numero_pagina)
+        if quadro is None:
+            return False
+        flags = self.tabela_invertida.flags[quadro]
+        self.tabela_invertida.flags[quadro] = flags & ~TabelaInvertida.REFERENCIADA
+        return bool(flags & TabelaInvertida.REFERENCIADA)
+
+    def obter_posicao_swap(self, numero_pagina: int) -> int:
+        return self.swap.get(numero_pagina)
+
+    def definir_posicao_swap(self, numero_pagina: int, posicao_swap: int) -> None:
+        if posicao_swap is None:
+            self.swap.pop(numero_pagina, None)
+        else:
+            self.swap[numero_pagina] = posicao_swap
+
+    def quadros_mapeados(self) -> list:
+        quadros = [self._quadro(num_pag) for num_pag in range(self.num_entradas)]
+        return [quadro for quadro in quadros if quadro is not None]
+
+    def posicoes_swap(self) -> list:
+        return list(self.swap.values())
+
+    def esta_carregada(self, numero_pagina: int) -> bool:
+        quadro = self._quadro(numero_pagina)
+        return quadro is not None and bool(self.tabela_invertida.flags[quadro] & TabelaInvertida.CARREGADA)
+
+    def marcar_carregada(self, numero_pagina: int) -> None:
+        quadro = self._quadro(numero_pagina)
+        if quadro is not None:
+            self.tabela_invertida.flags[quadro] |= TabelaInvertida.CARREGADA
+
+    def obter_numero_quadro(self, numero_pagina: int) -> int:
+        if 0 <= numero_pagina < self.num_entradas:
+            return self._quadro(numero_pagina)
+        return None
+
+    def obter_num_paginas(self) -> int:
+        return self.num_entradas
+
+    def descartar(self) -> None:
+        for num_pag in range(self.num_entradas):
+            self.tabela_invertida.remover(self.id_processo, num_pag)
+        self.swap.clear()
+
+    def tamanho_bytes(self) -> int:
+        # A tabela invertida é global; aqui conta só o que é do processo
+        return sys.getsizeof(self.swap)
+
+    def profundidade_percurso(self) -> float:
+        return self.tabela_invertida.profundidade_percurso()
+
+    def __repr__(self):
+        return f"TabelaPaginasInvertida(processo={self.id_processo}, entradas={self.num_entradas})"
+
+
+TABELAS_PAGINAS = {
+    'lista': TabelaPaginas,
+    'compacta': TabelaPaginasCompacta,
+    'multinivel': TabelaPaginasMultinivel,
+    'invertida': TabelaPaginasInvertida
+}
+
+
+def criar_tabela_paginas(tipo: str, num_paginas: int, id_processo: int = None,
+                         tabela_invertida: TabelaInvertida = None,
+                         niveis: int = 2, paginas_grandes: int = 1) -> TabelaPaginas:
+    """
+    Cria a tabela de páginas de um processo.
+
+    Args:
+        tipo: 'lista' (uma EntradaTabelaPaginas por página), 'compacta',
+            'multinivel' ou 'invertida'
+        num_paginas: Número de páginas do processo
+        id_processo: Processo dono da tabela (usado pela invertida)
+        tabela_invertida: Tabela invertida global (obrigatória para 'invertida')
+        niveis: Número de níveis da tabela multinível
+        paginas_grandes: Páginas base por página grande (define o tamanho
+            das folhas da tabela multinível)
+
+    Returns:
+        Tabela de páginas vazia
+
+    Raises:
+        ValueError: Se o tipo de tabela for desconhecido
+    """
+    if tipo not in TABELAS_PAGINAS:
+        raise ValueError(f"Tabela de paginas desconhecida: {tipo} (opcoes: {', '.join(TABELAS_PAGINAS)})")
+
+    if tipo == 'lista':
+        return TabelaPaginas()
+    if tipo == 'multinivel':
+        return TabelaPaginasMultinivel(num_paginas, niveis, paginas_grandes)
+    if tipo == 'invertida':
+        if tabela_invertida is None:
+            raise ValueError("Tabela invertida exige a TabelaInvertida do gerenciador")
+        return TabelaPaginasInvertida(tabela_invertida, id_processo)
+    return TABELAS_PAGINAS[tipo](num_paginas)
@@ -0,0 +1,201 @@
+"""
+Teste de estresse do modo concorrente do gerenciador de memória.
+
+Várias threads criam, traduzem e removem processos ao mesmo tempo sobre um
+único GerenciadorMemoria(concorrente=True), enquanto outra thread confere
+continuamente a posse dos quadros (verificar_consistencia). Cada thread
+também confere se os valores lidos nas traduções dos seus processos são os
+bytes das páginas desses processos.
+
+Por fim, confere que uma criação que falha (tamanho inválido, ou erro
+depois da reserva dos quadros) não prende o id do processo nem os quadros.
+
+Executar:
+    python3 teste_concorrencia.py
+"""
+
+import random
+import sys
+import threading
+from configuracao import ConfiguracaoSistema
+from erros import ErroGerenciadorMemoria, ErroMemoriaInsuficiente, ErroTamanhoInvalido
+from gerenciador_memoria import GerenciadorMemoria
+
+CENARIOS = [
+    ("sem swap", {}),
+    ("preguicoso, tabela compacta", {'memoria_preguicosa': True, 'tipo_tabela': 'compacta'}),
+    ("TLB", {'tlb': 16}),
+    ("swap + LRU + TLB", {'tamanho_swap': 1 << 16, 'politica_substituicao': 'lru', 'tlb': 16}),
+    ("swap + Clock, buddy", {'tamanho_swap': 1 << 16, 'politica_substituicao': 'clock', 'alocador': 'buddy'}),
+]
+
+NUM_THREADS = 8
+ITERACOES = 150
+
+
+def valor_esperado(processo, endereco_logico: int) -> int:
+    """Byte que o processo guarda no endereço lógico"""
+    if processo.memoria_logica is not None:
+        return processo.memoria_logica[endereco_logico]
+    numero_pagina, deslocamento = divmod(endereco_logico, processo.tamanho_pagina)
+    return processo.paginas_materializadas[numero_pagina][deslocamento]
+
+
+def trabalhador(gm: GerenciadorMemoria, indice: int, erros: list, parar: threading.Event) -> None:
+    """Cria, traduz e remove processos próprios e traduz processos alheios"""
+    aleatorio = random.Random(indice)
+    meus = []
+
+    for iteracao in range(ITERACOES):
+        if parar.is_set():
+            return
+
+        try:
+            acao = aleatorio.random()
+
+            if acao < 0.3 or not meus:
+                id_processo = indice * 100000 + iteracao
+                try:
+                    gm.criar_processo(id_processo, aleatorio.randrange(1, 4096))
+                    meus.append(id_processo)
+                except ErroMemoriaInsuficiente:
+                    pass
+
+            elif acao < 0.5:
+                gm.remover_processo(meus.pop(aleatorio.randrange(len(meus))))
+
+            else:
+                # Traduções dos próprios processos: o valor precisa bater
+                id_processo = aleatorio.choice(meus)
+                processo = gm.processos[id_processo]
+                for _ in range(20):
+                    endereco = aleatorio.randrange(processo.tamanho)
+                    resultado = gm.traduzir_endereco(id_processo, endereco)
+                    if resultado.valor != valor_esperado(processo, endereco):
+                        erros.append(f"Thread {indice}: PID {id_processo} endereco {endereco} "
+                                     f"leu {resultado.valor}, esperado {valor_esperado(processo, endereco)}")
+
+                # Processo de outra thread: pode sumir a qualquer momento
+                alheios = list(gm.processos)
+                if alheios:
+                    try:
+                        gm.traduzir_endereco(aleatorio.choice(alheios), 0)
+                    except ErroGerenciadorMemoria:
+                        pass
+
+                gm.traduzir_lote([(id_processo, aleatorio.randrange(4096)) for _ in range(32)])
+
+        except Exception as erro:
+            erros.append(f"Thread {indice}: {type(erro).__name__}: {erro}")
+            parar.set()
+            return
+
+    for id_processo in meus:
+        gm.remover_processo(id_processo)
+
+
+def verificador(gm: GerenciadorMemoria, erros: list, parar: threading.Event, verificacoes: list) -> None:
+    """Confere a posse dos quadros enquanto as outras threads trabalham"""
+    while not parar.is_set():
+        problemas = gm.verificar_consistencia()
+        verificacoes.append(len(problemas))
+        if problemas:
+            erros.extend(problemas[:5])
+            parar.set()
+
+
+def executar_cenario(nome: str, opcoes: dict) -> bool:
+    gm = GerenciadorMemoria(ConfiguracaoSistema(1 << 15, 256, 1 << 12),
+                            silencioso=True, concorrente=True, **opcoes)
+    erros = []
+    parar = threading.Event()
+    verificacoes = []
+
+    threads = [threading.Thread(target=trabalhador, args=(gm, indice, erros, parar))
+               for indice in range(NUM_THREADS)]
+    thread_verificador = threading.Thread(target=verificador, args=(gm, erros, parar, verificacoes))
+
+    thread_verificador.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    parar.set()
+    thread_verificador.join()
+
+    erros.extend(gm.verificar_consistencia())
+    if gm.processos:
+        erros.append(f"Processos restantes: {sorted(gm.processos)}")
+    if gm.alocador.num_livres() != gm.total_quadros:
+        erros.append(f"Quadros não devolvidos: {gm.total_quadros - gm.alocador.num_livres()}")
+
+    estatisticas = gm.obter_estatisticas()
+    situacao = "OK" if not erros else "FALHA"
+    print(f"[{situacao}] {nome}: {NUM_THREADS} threads, {len(verificacoes)} verificacoes, "
+          f"{estatisticas['alocador']['operacoes_alocacao']} alocacoes"
+          + (f", {estatisticas['substituicao']['faltas']} faltas de pagina"
+             if estatisticas['substituicao'] else ""))
+    for erro in erros[:10]:
+        print(f"   {erro}")
+
+    return not erros
+
+
+def testar_criacao_com_falha(nome: str, opcoes: dict) -> bool:
+    """Uma criação que falha seguida de uma criação bem-sucedida com o mesmo id"""
+    gm = GerenciadorMemoria(ConfiguracaoSistema(1 << 15, 256, 1 << 12),
+                            silencioso=True, concorrente=True, **opcoes)
+    erros = []
+
+    try:
+        gm.criar_processo(1, -5)
+        erros.append("Tamanho negativo foi aceito")
+    except ErroTamanhoInvalido:
+        pass
+
+    # Falha depois da reserva dos quadros, no meio do carregamento das páginas
+    def carregar_com_falha(processo, numero_pagina, numero_quadro):
+        raise OSError("falha simulada")
+
+    gm._carregar_pagina = carregar_com_falha
+    gm.memoria_preguicosa = False
+    try:
+        gm.criar_processo(2, 1000)
+        erros.append("Falha simulada não foi propagada")
+    except OSError:
+        pass
+    del gm._carregar_pagina
+
+    if gm._ids_em_transicao:
+        erros.append(f"Ids presos em transição: {sorted(gm._ids_em_transicao)}")
+    if gm.alocador.num_livres() != gm.total_quadros or gm.alocacao_quadros or gm.paginas_comprometidas:
+        erros.append("Reserva da criação que falhou não foi desfeita")
+
+    for id_processo in (1, 2):
+        try:
+            gm.criar_processo(id_processo, 1000)
+            gm.traduzir_endereco(id_processo, 999)
+        except ErroGerenciadorMemoria as erro:
+            erros.append(f"Processo {id_processo} não pôde ser recriado: {erro}")
+
+    erros.extend(gm.verificar_consistencia())
+    situacao = "OK" if not erros else "FALHA"
+    print(f"[{situacao}] criação com falha, {nome}")
+    for erro in erros:
+        print(f"   {erro}")
+
+    return not erros
+
+
+def main():
+    # Trocas de thread frequentes aumentam as intercalações testadas
+    sys.setswitchinterval(1e-5)
+
+    print("\n=== ESTRESSE: modo concorrente do gerenciador de memoria ===\n")
+    resultados = [executar_cenario(nome, opcoes) for nome, opcoes in CENARIOS]
+    resultados += [testar_criacao_com_falha(nome, opcoes) for nome, opcoes in CENARIOS]
+    sys.exit(0 if all(resultados) else 1)
+
+
+if __name__ == '__main__':
+    main()
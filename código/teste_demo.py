@@ -7,25 +7,27 @@ Executar:
     python3 teste_demo.py
 """
 
-from configuracao import Configuracao
+from configuracao import ConfiguracaoSistema
 from gerenciador_memoria import GerenciadorMemoria
+from apresentador import Apresentador
 
 
 def main():
     # Definir configuração: memória física 256 B, página 32 B, max processo 128 B
-    Configuracao.definir_configuracao(256, 32, 128)
+    configuracao = ConfiguracaoSistema(256, 32, 128)
 
-    gm = GerenciadorMemoria(Configuracao.TAMANHO_MEMORIA_FISICA, Configuracao.TAMANHO_PAGINA)
+    apresentador = Apresentador()
+    gm = GerenciadorMemoria(configuracao, silencioso=True, apresentador=apresentador)
 
     print("\n=== DEMO: configuracao definida: 256B mem, pagina 32B, max processo 128B ===\n")
 
     # Criar processo 1 (100 bytes)
     print("-> Criando processo 1 (100 bytes)")
-    gm.criar_processo(1, 100, Configuracao.TAMANHO_MAXIMO_PROCESSO)
+    apresentador.processo_criado(gm.criar_processo(1, 100))
 
     # Criar processo 2 (64 bytes)
     print("\n-> Criando processo 2 (64 bytes)")
-    gm.criar_processo(2, 64, Configuracao.TAMANHO_MAXIMO_PROCESSO)
+    apresentador.processo_criado(gm.criar_processo(2, 64))
 
     # Exibir memória
     print("\n-> Exibindo memoria fisica:")
@@ -39,12 +41,11 @@ def main():
     print("\n-> Traduzindo enderecos do processo 1:")
     for addr in [0, 10, 50, 99]:
         res = gm.traduzir_endereco(1, addr)
-        if res:
-            print(f"  L {res['endereco_logico']} -> Q{res['numero_quadro']} + d{res['deslocamento']} = F{res['endereco_fisico']} (valor=0x{res['valor']:02x})")
+        print(f"  L {res.endereco_logico} -> Q{res.numero_quadro} + d{res.deslocamento} = F{res.endereco_fisico} (valor=0x{res.valor:02x})")
 
     # Remover processo 1
     print("\n-> Removendo processo 1")
-    gm.remover_processo(1)
+    apresentador.processo_removido(gm.remover_processo(1))
 
     # Exibir memoria apos remocao
     print("\n-> Exibindo memoria apos remocao:")
@@ -0,0 +1,62 @@
+"""
+Teste do servidor: erros do gerenciador voltam como respostas tipadas e não
+deixam estado preso no gerenciador compartilhado pelas conexões.
+
+Um CRIAR com tamanho negativo deve responder ErroTamanhoInvalido (recriado
+no cliente) e, em seguida, outra conexão deve conseguir criar o mesmo
+processo.
+
+Executar:
+    python3 teste_servidor.py
+"""
+
+import asyncio
+import sys
+from cliente import ClienteMemoria
+from configuracao import ConfiguracaoSistema
+from erros import ErroTamanhoInvalido
+from gerenciador_memoria import GerenciadorMemoria
+from servidor import ServidorMemoria
+
+
+async def testar_tamanho_negativo() -> list:
+    """Tamanho negativo seguido da criação do mesmo processo por outra conexão"""
+    erros = []
+    with GerenciadorMemoria(ConfiguracaoSistema(1 << 16, 256, 1 << 16), silencioso=True) as gerenciador:
+        servidor = ServidorMemoria(gerenciador)
+        _, porta = await servidor.iniciar()
+        try:
+            async with await ClienteMemoria.conectar(porta=porta) as cliente:
+                try:
+                    await cliente.criar_processo(1, -5)
+                    erros.append("Tamanho negativo foi aceito")
+                except ErroTamanhoInvalido as erro:
+                    if erro.tamanho != -5:
+                        erros.append(f"Argumentos do erro perdidos: {erro.args}")
+
+            async with await ClienteMemoria.conectar(porta=porta) as cliente:
+                resultado = await cliente.criar_processo(1, 1000)
+                if resultado.num_paginas != 4:
+                    erros.append(f"Processo recriado com {resultado.num_paginas} paginas")
+                traducao = await cliente.traduzir_endereco(1, 999)
+                if traducao.numero_pagina != 3:
+                    erros.append(f"Traducao inesperada: {traducao}")
+        finally:
+            await servidor.parar()
+
+        if gerenciador._ids_em_transicao or gerenciador.verificar_consistencia():
+            erros.append("Estado do gerenciador inconsistente depois do erro")
+    return erros
+
+
+def main():
+    print("\n=== SERVIDOR: erros do gerenciador ===\n")
+    erros = asyncio.run(testar_tamanho_negativo())
+    print(f"[{'OK' if not erros else 'FALHA'}] CRIAR com tamanho negativo e recriacao do processo")
+    for erro in erros:
+        print(f"   {erro}")
+    sys.exit(0 if not erros else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Teste da paginação sob demanda com o compromisso no limite exato.
+
+Com processos que somam exatamente quadros + posições de swap, o swap fica
+cheio: trazer de volta uma página do swap precisa soltar a posição dela
+antes de despejar a vítima, senão a vítima não tem onde ser gravada. Um
+despejo sem posição de swap livre deve falhar com ErroMemoriaInsuficiente
+sem tirar a vítima da memória.
+
+Executar:
+    python3 teste_swap.py
+"""
+
+import sys
+from erros import ErroMemoriaInsuficiente
+from gerenciador_memoria import GerenciadorMemoria
+
+TABELAS = ('lista', 'compacta', 'multinivel', 'invertida')
+POLITICAS = ('fifo', 'lru', 'clock', 'arc')
+
+
+def testar_encaixe_exato(tipo_tabela: str, politica: str) -> list:
+    """Dois processos que ocupam toda a memória e todo o swap, acessados em vaivém"""
+    erros = []
+    gm = GerenciadorMemoria(64, 16, tamanho_swap=64, silencioso=True,
+                            tipo_tabela=tipo_tabela, politica_substituicao=politica)
+    gm.criar_processo(1, 64)
+    gm.criar_processo(2, 64)
+
+    esperado = {id_processo: [gm.processos[id_processo].obter_dados_pagina(p)[0] for p in range(4)]
+                for id_processo in (1, 2)}
+
+    # Cada rodada troca todas as páginas de um processo pelas do outro
+    for rodada in range(6):
+        for id_processo in (2, 1) if rodada % 2 == 0 else (1, 2):
+            for endereco in (0, 16, 32, 48):
+                resultado = gm.traduzir_endereco(id_processo, endereco)
+                if resultado.valor != esperado[id_processo][endereco // 16]:
+                    erros.append(f"PID {id_processo} endereco {endereco}: leu {resultado.valor}, "
+                                 f"esperado {esperado[id_processo][endereco // 16]}")
+
+    erros.extend(gm.verificar_consistencia())
+    if gm.swap.num_livres() != 0:
+        erros.append(f"Swap deveria estar cheio: {gm.swap.num_livres()} posicoes livres")
+
+    # Com um terceiro processo a criação é recusada, sem afetar os outros
+    try:
+        gm.criar_processo(3, 16)
+        erros.append("Criacao acima do limite foi aceita")
+    except ErroMemoriaInsuficiente:
+        pass
+    return erros
+
+
+def testar_swap_sem_posicao(politica: str) -> list:
+    """Despejo sem posição de swap livre: erro tipado e a vítima continua residente"""
+    erros = []
+    gm = GerenciadorMemoria(64, 16, tamanho_swap=64, silencioso=True, politica_substituicao=politica)
+    gm.criar_processo(1, 64)
+    gm.criar_processo(2, 64)
+
+    # Ocupar o swap por fora, como se outra estrutura o tivesse esgotado
+    reservadas = []
+    while (posicao := gm.swap.alocar_posicao()) is not None:
+        reservadas.append(posicao)
+
+    residentes = gm.politica.num_residentes()
+    try:
+        gm.traduzir_endereco(2, 0)
+        erros.append("Falta de pagina sem posicao de swap foi aceita")
+    except ErroMemoriaInsuficiente:
+        pass
+
+    if gm.politica.num_residentes() != residentes:
+        erros.append("Vitima saiu da politica sem ter sido despejada")
+
+    for posicao in reservadas:
+        gm.swap.liberar_posicao(posicao)
+    erros.extend(gm.verificar_consistencia())
+    for endereco in (0, 16, 32, 48):
+        esperado = gm.processos[2].obter_dados_pagina(endereco // 16)[0]
+        if gm.traduzir_endereco(2, endereco).valor != esperado:
+            erros.append(f"PID 2 endereco {endereco}: valor errado depois de liberar o swap")
+    return erros
+
+
+def main():
+    print("\n=== SWAP: compromisso no limite exato (quadros + swap) ===\n")
+    falhas = 0
+    for tipo_tabela in TABELAS:
+        for politica in POLITICAS:
+            try:
+                erros = testar_encaixe_exato(tipo_tabela, politica)
+            except Exception as erro:
+                erros = [f"{type(erro).__name__}: {erro}"]
+            falhas += bool(erros)
+            print(f"[{'OK' if not erros else 'FALHA'}] tabela {tipo_tabela}, politica {politica}")
+            for erro in erros[:5]:
+                print(f"   {erro}")
+    for politica in POLITICAS:
+        try:
+            erros = testar_swap_sem_posicao(politica)
+        except Exception as erro:
+            erros = [f"{type(erro).__name__}: {erro}"]
+        falhas += bool(erros)
+        print(f"[{'OK' if not erros else 'FALHA'}] despejo sem posicao de swap, politica {politica}")
+        for erro in erros[:5]:
+            print(f"   {erro}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Implementação de uma TLB (Translation Lookaside Buffer) em software.
+"""
+
+from collections import OrderedDict
+
+
+class TLB:
+    """
+    TLB associativa por conjunto com substituição LRU.
+
+    Cada entrada mapeia (id_processo, numero_pagina) -> numero_quadro. Com
+    associatividade None (ou igual ao número de entradas) a TLB é
+    totalmente associativa.
+
+    Com páginas grandes (usar_paginas_grandes), uma única entrada cobre a
+    página grande inteira: a chave usa ~(numero_pagina >> bits), que é
+    negativa e não colide com as páginas comuns, e guarda o primeiro quadro
+    do bloco. A busca tenta a página comum e depois a página grande.
+    """
+
+    def __init__(self, num_entradas: int, associatividade: int = None):
+        """
+        Inicializa a TLB vazia.
+
+        Args:
+            num_entradas: Número total de entradas
+            associatividade: Entradas por conjunto (None = totalmente associativa)
+
+        Raises:
+            ValueError: Se a geometria for inválida
+        """
+        if associatividade is None:
+            associatividade = num_entradas
+
+        if num_entradas <= 0 or associatividade <= 0 or num_entradas % associatividade:
+            raise ValueError("Numero de entradas da TLB deve ser multiplo positivo da associatividade")
+
+        self.num_entradas = num_entradas
+        self.associatividade = associatividade
+        self.num_conjuntos = num_entradas // associatividade
+        self.conjuntos = [OrderedDict() for _ in range(self.num_conjuntos)]
+        self.acertos = 0
+        self.faltas = 0
+        self.invalidacoes = 0
+        self.bits_pagina_grande = 0
+        self.mascara_pagina_grande = 0
+        self.acertos_grandes = 0
+
+    def usar_paginas_grandes(self, paginas_por_pagina_grande: int) -> None:
+        """
+        Habilita entradas de páginas grandes.
+
+        Args:
+            paginas_por_pagina_grande: Páginas base por página grande (potência de 2)
+        """
+        self.bits_pagina_grande = paginas_por_pagina_grande.bit_length() - 1
+        self.mascara_pagina_grande = paginas_por_pagina_grande - 1
+
+    def _conjunto(self, id_processo: int, numero_pagina: int) -> OrderedDict:
+        return self.conjuntos[(numero_pagina ^ id_processo) % self.num_conjuntos]
+
+    def buscar(self, id_processo: int, numero_pagina: int) -> int:
+        """
+        Procura a tradução de uma página.
+
+        Returns:
+            Número do quadro ou None (falta na TLB)
+        """
+        conjunto = self._conjunto(id_processo, numero_pagina)
+        chave = (id_processo, numero_pagina)
+        numero_quadro = conjunto.get(chave)
+
+        if numero_quadro is None and self.bits_pagina_grande:
+            regiao = ~(numero_pagina >> self.bits_pagina_grande)
+            conjunto = self._conjunto(id_processo, regiao)
+            chave = (id_processo, regiao)
+            numero_quadro = conjunto.get(chave)
+            if numero_quadro is not None:
+                numero_quadro += numero_pagina & self.mascara_pagina_grande
+                self.acertos_grandes += 1
+
+        if numero_quadro is None:
+            self.faltas += 1
+            return None
+
+        conjunto.move_to_end(chave)
+        self.acertos += 1
+        return numero_quadro
+
+    def inserir(self, id_processo: int, numero_pagina: int, numero_quadro: int) -> None:
+        """Insere uma tradução, despejando a menos recente do conjunto se necessário"""
+        conjunto = self._conjunto(id_processo, numero_pagina)
+        chave = (id_processo, numero_pagina)
+        conjunto[chave] = numero_quadro
+        conjunto.move_to_end(chave)
+
+        if len(conjunto) > self.associatividade:
+            conjunto.popitem(last=False)
+
+    def inserir_grande(self, id_processo: int, numero_pagina: int, numero_quadro: int) -> None:
+        """Insere a tradução da página grande que contém a página (com o quadro dela)"""
+        self.inserir(id_processo, ~(numero_pagina >> self.bits_pagina_grande),
+                     numero_quadro - (numero_pagina & self.mascara_pagina_grande))
+
+    def invalidar(self, id_processo: int, numero_pagina: int) -> None:
+        """Remove a tradução de uma página e a da página grande que a contém"""
+        if self._conjunto(id_processo, numero_pagina).pop((id_processo, numero_pagina), None) is not None:
+            self.invalidacoes += 1
+        if self.bits_pagina_grande:
+            regiao = ~(numero_pagina >> self.bits_pagina_grande)
+            if self._conjunto(id_processo, regiao).pop((id_processo, regiao), None) is not None:
+                self.invalidacoes += 1
+
+    def invalidar_processo(self, id_processo: int) -> None:
+        """Remove todas as traduções de um processo"""
+        for conjunto in self.conjuntos:
+            for chave in [chave for chave in conjunto if chave[0] == id_processo]:
+                del conjunto[chave]
+                self.invalidacoes += 1
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna a geometria e a taxa de acerto da TLB.
+
+        Returns:
+            Dicionário com contadores, taxa de acerto, ocupação e o alcance
+            (páginas base cobertas pelas entradas ocupadas)
+        """
+        total = self.acertos + self.faltas
+        grandes = sum(1 for conjunto in self.conjuntos for chave in conjunto if chave[1] < 0)
+        ocupadas = sum(len(conjunto) for conjunto in self.conjuntos)
+        return {
+            'num_entradas': self.num_entradas,
+            'associatividade': self.associatividade,
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'invalidacoes': self.invalidacoes,
+            'taxa_acerto': self.acertos / total if total else 0.0,
+            'entradas_ocupadas': ocupadas,
+            'entradas_grandes': grandes,
+            'acertos_grandes': self.acertos_grandes,
+            'alcance_paginas': ocupadas + grandes * self.mascara_pagina_grande
+        }
+
+    def __repr__(self):
+        return f"TLB(entradas={self.num_entradas}, associatividade={self.associatividade})"
@@ -0,0 +1,193 @@
+"""
+Varredura de parâmetros: reproduz o mesmo rastro em muitas configurações
+(memória, página, política de substituição, TLB) em paralelo.
+
+Cada configuração roda em um processo de um ProcessPoolExecutor, com seu
+próprio GerenciadorMemoria. O rastro é convertido uma única vez para o
+formato binário e todos os processos o mapeiam somente leitura com mmap,
+compartilhando as mesmas páginas do cache de arquivos do sistema.
+
+Executar:
+    python3 varredura.py carga.txt --memorias 65536,262144 --paginas 256,4096 \\
+        --politicas fifo,lru,clock,arc --tlbs 0,64 --saida resultados.csv
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from configuracao import ConfiguracaoSistema
+from gerenciador_memoria import GerenciadorMemoria
+from rastro import converter_rastro, eh_rastro_binario, ler_eventos_binario, reproduzir_rastro
+
+COLUNAS = (
+    'memoria', 'pagina', 'politica', 'tlb', 'eventos', 'acessos', 'falhas', 'invalidos',
+    'faltas_pagina', 'taxa_faltas', 'taxa_acerto_tlb', 'fragmentacao_externa',
+    'percentual_usado', 'segundos', 'eventos_por_segundo', 'erro'
+)
+
+
+def gerar_pontos(memorias, paginas, politicas, tlbs) -> list:
+    """
+    Gera o produto cartesiano das configurações, descartando as inválidas
+    (página maior que a memória).
+
+    Returns:
+        Lista de dicionários com as chaves memoria, pagina, politica e tlb
+    """
+    return [
+        {'memoria': memoria, 'pagina': pagina, 'politica': politica, 'tlb': tlb}
+        for memoria, pagina, politica, tlb in itertools.product(memorias, paginas, politicas, tlbs)
+        if pagina <= memoria
+    ]
+
+
+def executar_ponto(ponto: dict, caminho_rastro: str, fator_swap: int = 4,
+                   tipo_tabela: str = 'lista', alocador: str = 'bitmap') -> dict:
+    """
+    Reproduz o rastro binário em uma configuração (executado em um processo filho).
+
+    Args:
+        ponto: Configuração (memoria, pagina, politica, tlb)
+        caminho_rastro: Rastro no formato binário
+        fator_swap: Tamanho da área de swap em múltiplos da memória física
+        tipo_tabela: Tipo de tabela de páginas
+        alocador: Alocador de quadros livres
+
+    Returns:
+        Linha da tabela de resultados (ver COLUNAS); 'erro' traz a mensagem
+        se a configuração for inválida
+    """
+    linha = dict.fromkeys(COLUNAS)
+    linha.update(ponto)
+
+    try:
+        configuracao = ConfiguracaoSistema(ponto['memoria'], ponto['pagina'], ponto['memoria'])
+        gerenciador = GerenciadorMemoria(configuracao, silencioso=True, alocador=alocador,
+                                         tamanho_swap=fator_swap * ponto['memoria'],
+                                         politica_substituicao=ponto['politica'],
+                                         tlb=ponto['tlb'] or None, tipo_tabela=tipo_tabela)
+    except ValueError as erro:
+        linha['erro'] = str(erro)
+        return linha
+
+    with gerenciador:
+        resultado = reproduzir_rastro(gerenciador, ler_eventos_binario(caminho_rastro))
+        estatisticas = gerenciador.obter_estatisticas()
+
+    acessos_validos = resultado['acessos'] - resultado['invalidos']
+    linha.update({
+        'eventos': resultado['eventos'],
+        'acessos': resultado['acessos'],
+        'falhas': resultado['falhas'],
+        'invalidos': resultado['invalidos'],
+        'faltas_pagina': resultado['faltas_pagina'],
+        'taxa_faltas': resultado['faltas_pagina'] / acessos_validos if acessos_validos else 0.0,
+        'taxa_acerto_tlb': estatisticas['tlb']['taxa_acerto'] if estatisticas['tlb'] else None,
+        'fragmentacao_externa': estatisticas['fragmentacao']['fragmentacao_externa'],
+        'percentual_usado': estatisticas['percentual_usado'],
+        'segundos': resultado['segundos'],
+        'eventos_por_segundo': resultado['eventos_por_segundo']
+    })
+    return linha
+
+
+def executar_varredura(caminho_rastro: str, pontos: list, processos: int = None,
+                       fator_swap: int = 4, tipo_tabela: str = 'lista', alocador: str = 'bitmap') -> list:
+    """
+    Distribui as configurações entre processos e junta os resultados.
+
+    Rastros em texto ou CSV são convertidos para um arquivo binário
+    temporário antes da distribuição.
+
+    Args:
+        caminho_rastro: Rastro em qualquer formato aceito por ler_rastro
+        pontos: Configurações (ver gerar_pontos)
+        processos: Número de processos (None = número de CPUs)
+        fator_swap: Tamanho da área de swap em múltiplos da memória física
+        tipo_tabela: Tipo de tabela de páginas
+        alocador: Alocador de quadros livres
+
+    Returns:
+        Linhas de resultado na mesma ordem de pontos
+    """
+    temporario = None
+    if not eh_rastro_binario(caminho_rastro):
+        descritor, temporario = tempfile.mkstemp(suffix='.bin')
+        os.close(descritor)
+        converter_rastro(caminho_rastro, temporario)
+        caminho_rastro = temporario
+
+    try:
+        linhas = [None] * len(pontos)
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = {
+                executor.submit(executar_ponto, ponto, caminho_rastro, fator_swap, tipo_tabela, alocador): indice
+                for indice, ponto in enumerate(pontos)
+            }
+            for futuro in as_completed(futuros):
+                linhas[futuros[futuro]] = futuro.result()
+        return linhas
+    finally:
+        if temporario is not None:
+            os.unlink(temporario)
+
+
+def escrever_resultados(linhas: list, caminho: str) -> None:
+    """
+    Grava a tabela de resultados em CSV ou JSON (pela extensão do arquivo).
+
+    Args:
+        linhas: Linhas retornadas por executar_varredura
+        caminho: Arquivo de saída ('.json' = JSON, demais = CSV)
+    """
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        if caminho.lower().endswith('.json'):
+            json.dump(linhas, arquivo, indent=2)
+            arquivo.write('\n')
+        else:
+            escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS)
+            escritor.writeheader()
+            escritor.writerows(linhas)
+
+
+def _lista_inteiros(texto: str) -> list:
+    return [int(valor, 0) for valor in texto.split(',')]
+
+
+def main():
+    """Executa uma varredura descrita na linha de comando"""
+    parser = argparse.ArgumentParser(description="Varredura de parametros do gerenciador de memoria")
+    parser.add_argument('rastro', help="Arquivo de rastro (texto, CSV ou binario)")
+    parser.add_argument('--memorias', type=_lista_inteiros, default=[1 << 16, 1 << 18],
+                        help="Tamanhos de memoria fisica separados por virgula")
+    parser.add_argument('--paginas', type=_lista_inteiros, default=[4096], help="Tamanhos de pagina")
+    parser.add_argument('--politicas', type=lambda texto: texto.split(','), default=['fifo', 'lru'],
+                        help="Politicas de substituicao")
+    parser.add_argument('--tlbs', type=_lista_inteiros, default=[0], help="Entradas da TLB (0 = sem TLB)")
+    parser.add_argument('--fator-swap', type=int, default=4, help="Swap em multiplos da memoria fisica")
+    parser.add_argument('--tabela', default='lista', help="Tipo de tabela de paginas")
+    parser.add_argument('--alocador', default='bitmap', help="Alocador de quadros livres")
+    parser.add_argument('--processos', type=int, default=None, help="Processos paralelos (padrao: CPUs)")
+    parser.add_argument('--saida', default='varredura.csv', help="Arquivo de saida (.csv ou .json)")
+    argumentos = parser.parse_args()
+
+    pontos = gerar_pontos(argumentos.memorias, argumentos.paginas, argumentos.politicas, argumentos.tlbs)
+
+    inicio = time.perf_counter()
+    linhas = executar_varredura(argumentos.rastro, pontos, argumentos.processos,
+                                argumentos.fator_swap, argumentos.tabela, argumentos.alocador)
+    segundos = time.perf_counter() - inicio
+
+    escrever_resultados(linhas, argumentos.saida)
+    print(f"{len(linhas)} configuracoes em {segundos:.2f} s "
+          f"({sum(linha['segundos'] or 0 for linha in linhas) / segundos:.1f}x paralelismo efetivo)")
+    print(f"Resultados gravados em {argumentos.saida}")
+
+
+if __name__ == '__main__':
+    main()